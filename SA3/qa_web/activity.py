@@ -0,0 +1,122 @@
+"""Activity of a user displayed on their profile page.
+
+Questions, answers and comments of a user are each listed one page at a
+time from the most recent, following a cursor on (`creation_date`, `id`)
+as in qa_web.pagination. Each post type has an index on (`owner`,
+`creation_date`, `id`) so any page is read directly from the index, however
+deep it is and however many posts the user wrote.
+
+The activity stream merges the three lists by date: a page of the stream is
+the most recent posts among a page of each list following the same cursor.
+"""
+import heapq
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+from qa_web.models import Answer, Comment, Question
+from qa_web.pagination import ORDERING, after_cursor, encode_cursor
+from qa_web.rendering import post_html
+from qa_web.templatetags.utils import (get_answer_parent_title,
+                                       get_comment_parent,
+                                       get_comment_question_id)
+
+
+def _questions(user_id):
+    return Question.objects.filter(owner_id=user_id)
+
+
+def _answers(user_id):
+    # Parents are annotated so that displaying the posts through
+    # qa_web.templatetags.utils never queries the database
+    return Answer.objects.filter(owner_id=user_id) \
+        .annotate(question_title=F('question__title'))
+
+
+def _comments(user_id):
+    return Comment.objects.filter(owner_id=user_id).annotate(
+        answer_question_id=F('answer__question_id'),
+        parent_owner=Coalesce('answer__owner__username',
+                              'question__owner__username'))
+
+
+ACTIVITY_QUERYSETS = {
+    'question': _questions,
+    'answer': _answers,
+    'comment': _comments,
+}
+
+
+def _next_cursor(posts, per_page):
+    """Cursor following a page of posts, None on the last page."""
+    if len(posts) < per_page:
+        return None
+    return encode_cursor(posts[-1])
+
+
+def activity_page(post_type, user_id, cursor=None, per_page=None):
+    """Page of the posts of a type written by a user, from the most recent.
+
+    :param post_type: Key of `ACTIVITY_QUERYSETS`
+    :param user_id: Id of the posts' owner
+    :param cursor: Cursor returned along the previous page, None for the
+                   first page
+    :param per_page: Number of posts per page, `PROFILE_PAGE_SIZE` by default
+    :return: Tuple of the list of posts and the cursor to the next page
+    :raises ValueError: If the cursor is malformed
+    """
+    per_page = per_page or settings.PROFILE_PAGE_SIZE
+    queryset = ACTIVITY_QUERYSETS[post_type](user_id).order_by(*ORDERING)
+    if cursor:
+        queryset = after_cursor(queryset, cursor)
+    posts = list(queryset[:per_page])
+    for post in posts:
+        post.post_type = post_type
+    return posts, _next_cursor(posts, per_page)
+
+
+def merge_pages(pages, per_page=None):
+    """Page of the activity stream made of pages of each post type following
+    the same cursor.
+
+    :param pages: Lists of posts, each ordered from the most recent
+    :return: Tuple of the list of posts and the cursor to the next page
+    """
+    per_page = per_page or settings.PROFILE_PAGE_SIZE
+    posts = list(heapq.merge(
+        *pages, key=lambda post: (post.creation_date, post.pk),
+        reverse=True))[:per_page]
+    return posts, _next_cursor(posts, per_page)
+
+
+def activity_stream(user_id, cursor=None, per_page=None):
+    """Page of the questions, answers and comments written by a user, from
+    the most recent.
+
+    :return: Tuple of the list of posts and the cursor to the next page
+    :raises ValueError: If the cursor is malformed
+    """
+    return merge_pages([activity_page(post_type, user_id, cursor, per_page)[0]
+                        for post_type in ACTIVITY_QUERYSETS], per_page)
+
+
+def serialize_post(post):
+    """Data of a post listed by `activity_page`, as displayed on the profile
+    page."""
+    data = {
+        'type': post.post_type,
+        'id': post.pk,
+        'content': post.content,
+        'content_html': post_html(post),
+        'creation_date': post.creation_date.isoformat(),
+    }
+    if post.post_type == 'question':
+        data.update(question_id=post.pk, title=post.title)
+    elif post.post_type == 'answer':
+        data.update(question_id=post.question_id,
+                    title=get_answer_parent_title(post))
+    else:
+        data.update(question_id=get_comment_question_id(post),
+                    title=get_comment_parent(post))
+    data['url'] = reverse('answers', args=[data['question_id']])
+    return data
@@ -6,10 +6,32 @@ For more information:
     https://docs.djangoproject.com/en/2.0/ref/contrib/admin/
 """
 from django.contrib import admin
-from .models import Question, Answer, Comment, User
+from .models import Question, Answer, Comment, SiteStats, User
+from .stats import refresh_stats
 from django.contrib.auth.admin import UserAdmin
 
+
+class SiteStatsAdmin(admin.ModelAdmin):
+    """Site-wide totals, only changed by recounting them."""
+    list_display = ('refreshed', 'questions', 'answers', 'comments', 'votes',
+                    'users')
+    actions = ['refresh']
+
+    def has_add_permission(self, request):
+        return False
+
+    def refresh(self, request, queryset):
+        """Recomputes the site-wide totals from the database."""
+        stats = refresh_stats()
+        self.message_user(request, 'Site statistics refreshed: ' + ', '.join(
+            '{} {}'.format(total, name)
+            for name, total in sorted(stats.items())))
+
+    refresh.short_description = 'Refresh site statistics'
+
+
 admin.site.register(User, UserAdmin)
 admin.site.register(Question)
 admin.site.register(Answer)
 admin.site.register(Comment)
+admin.site.register(SiteStats, SiteStatsAdmin)
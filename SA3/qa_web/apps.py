@@ -4,3 +4,7 @@ from django.apps import AppConfig
 
 class QAWebConfig(AppConfig):
     name = 'qa_web'
+
+    def ready(self):
+        # Connects the signal receivers
+        from qa_web import signals  # pylint: disable=unused-import
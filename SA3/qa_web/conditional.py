@@ -0,0 +1,159 @@
+"""Conditional GET of the thread and listing pages.
+
+Each question holds the time of the last activity on its thread,
+`last_activity`, updated whenever the question, one of its answers or
+comments, a vote on any of them, its best answer or its tags change:
+    - by `auto_now` when the question itself is saved
+    - by the receivers of qa_web.signals for answers, comments and tags
+    - by qa_web.votes and qa_web.reputation, which update posts in place
+    - by qa_web.reputation for every thread displaying a post of a user
+      whose reputation changes, since it is shown next to their posts
+
+Pages are validated by an ETag computed from these timestamps and the id of
+the user viewing the page, whose own votes and permissions are displayed.
+A request carrying the ETag of the current page is answered with a 304
+response after a single indexed query, before the thread or listing is
+loaded.
+
+The Last-Modified date is only sent along with the ETag and is not used to
+validate requests: it has a resolution of one second, so a request carrying
+only If-Modified-Since gets the full page.
+
+Visit counts, flushed in batches by qa_web.visits, do not change the
+validators, so a cached page may show a slightly outdated number of visits
+until the next activity on the thread.
+"""
+import hashlib
+import math
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from qa_web.models import Answer, Comment, Question
+
+# Questions whose thread contains a post, by type of post
+THREAD_LOOKUPS = {
+    'question': lambda post_id: Q(pk=post_id),
+    'answer': lambda post_id: Q(answer=post_id),
+    'comment': lambda post_id: (Q(comment=post_id) |
+                                Q(answer__comment=post_id)),
+}
+
+
+def touch_question(question_id, **counters):
+    """Records activity on a question, atomically adding values to its
+    counters at the same time.
+
+    :param question_id: Id of the question, None being ignored
+    :param counters: Value added to each counter field of Question
+    """
+    if question_id is None:
+        return
+    updates = {field: F(field) + value for field, value in counters.items()}
+    Question.objects.filter(pk=question_id) \
+        .update(last_activity=timezone.now(), **updates)
+
+
+def touch_thread(post_type, post_id):
+    """Records activity on the thread containing a post.
+
+    :param post_type: One of `THREAD_LOOKUPS`' keys
+    :param post_id: Id of the post
+    """
+    questions = Question.objects.filter(THREAD_LOOKUPS[post_type](post_id))
+    Question.objects.filter(pk__in=questions.values('pk')) \
+        .update(last_activity=timezone.now())
+
+
+def touch_user_threads(user_id):
+    """Records activity on every thread containing a post of a user.
+
+    :param user_id: Id of the user
+    """
+    Question.objects.filter(
+        Q(owner=user_id) |
+        Q(pk__in=Answer.objects.filter(owner=user_id)
+          .values('question_id')) |
+        Q(pk__in=Comment.objects.filter(owner=user_id)
+          .values('question_id')) |
+        Q(pk__in=Comment.objects.filter(owner=user_id)
+          .values('answer__question_id'))
+    ).update(last_activity=timezone.now())
+
+
+class Validators:
+    """ETag and Last-Modified date of a page, from the time of the last
+    activity it displays and the user viewing it.
+
+    :param last_activity: Datetime of the last activity, None if unknown
+    :param user: User requesting the page
+    :param extra: Other values displayed by the page, e.g. totals changing
+                  without any activity on the remaining questions
+    """
+
+    def __init__(self, last_activity, user, *extra):
+        self.last_activity = last_activity
+        key = repr((last_activity and last_activity.isoformat(),
+                    user.pk if user.is_authenticated else None) + extra)
+        self.etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    @property
+    def last_modified(self):
+        """Last-Modified date as a timestamp rounded up to the second, so
+        that it is never earlier than the last activity. None if unknown."""
+        if self.last_activity is None:
+            return None
+        return math.ceil(self.last_activity.timestamp())
+
+    def not_modified(self, request):
+        """304 response when the client's copy of the page is current, 412
+        when a precondition of the request fails.
+
+        :return: HttpResponse, None if the page has to be rendered
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        # Validated by the ETag alone, see the module's documentation
+        response = get_conditional_response(request, etag=self.etag)
+        if response is not None:
+            self.apply(response)
+        return response
+
+    def apply(self, response):
+        """Adds the validators to a response. Browsers revalidate the page
+        on each visit, since it depends on the session."""
+        response['ETag'] = self.etag
+        if self.last_modified is not None:
+            response['Last-Modified'] = http_date(self.last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+def thread_validators(question_id, user):
+    """Validators of the thread page of a question.
+
+    :return: Validators, None if the question does not exist
+    """
+    last_activity = Question.objects.filter(pk=question_id) \
+        .values_list('last_activity', flat=True).first()
+    if last_activity is None:
+        return None
+    return Validators(last_activity, user)
+
+
+def listing_validators(questions, user, *extra, count=False):
+    """Validators of a page listing questions, from the last activity on
+    any of them.
+
+    :param questions: Queryset of the listed questions
+    :param extra: See `Validators`
+    :param count: Whether the number of questions is part of the
+                  validators, so that deleting one of them changes them
+    :return: Validators
+    """
+    aggregates = {'last_activity': Max('last_activity')}
+    if count:
+        aggregates['count'] = Count('pk')
+    values = questions.order_by().aggregate(**aggregates)
+    return Validators(values['last_activity'], user,
+                      *(extra + (values.get('count'),)))
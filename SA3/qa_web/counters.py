@@ -0,0 +1,71 @@
+"""Recomputation of the denormalized counters stored on the models.
+Counters are maintained incrementally as posts are created and deleted (see
+qa_web.signals), the functions below recompute them in bulk from the
+underlying tables to backfill or repair them.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from taggit.models import TaggedItem
+from qa_web.models import (Answer, Comment, Question, TagUsage, User,
+                           UserStats)
+
+
+def count_subquery(queryset, field, aggregate=Count('pk')):
+    """Correlated subquery counting the rows of a queryset whose `field`
+    references the outer query's primary key.
+
+    :param queryset: Rows to count
+    :param field: Name of the foreign key to the outer model
+    :param aggregate: Aggregate computed instead of the number of rows
+    :return: Expression usable in `annotate` or `update`
+    """
+    counts = queryset.filter(**{field: OuterRef('pk')}).order_by() \
+        .values(field).annotate(count=aggregate).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def recount_questions():
+    """Recomputes `num_answers` and `num_comments` of every question in a
+    single UPDATE statement.
+
+    :return: Number of questions updated
+    """
+    return Question.objects.update(
+        num_answers=count_subquery(Answer.objects.all(), 'question'),
+        num_comments=count_subquery(Comment.objects.all(), 'question'))
+
+
+def recount_tags():
+    """Rebuilds the usage count of every tag used on questions.
+
+    :return: Number of tags counted
+    """
+    counts = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Question),
+        object_id__in=Question.objects.values('pk')) \
+        .values('tag').annotate(num_questions=Count('pk'))
+    TagUsage.objects.all().delete()
+    return len(TagUsage.objects.bulk_create(
+        TagUsage(tag_id=count['tag'], num_questions=count['num_questions'])
+        for count in counts))
+
+
+def recount_users():
+    """Recomputes the statistics of every user in a single UPDATE statement,
+    creating missing ones first.
+
+    :return: Number of users updated
+    """
+    UserStats.objects.bulk_create(
+        UserStats(user_id=pk) for pk in
+        User.objects.filter(stats__isnull=True).values_list('pk', flat=True))
+    return UserStats.objects.update(
+        num_questions=count_subquery(Question.objects.all(), 'owner'),
+        num_answers=count_subquery(Answer.objects.all(), 'owner'),
+        num_accepted=count_subquery(
+            Answer.objects.filter(correct_answer=True), 'owner'),
+        num_comments=count_subquery(Comment.objects.all(), 'owner'),
+        score=count_subquery(Question.objects.all(), 'owner', Sum('score')) +
+        count_subquery(Answer.objects.all(), 'owner', Sum('score')) +
+        count_subquery(Comment.objects.all(), 'owner', Sum('score')))
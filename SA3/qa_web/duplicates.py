@@ -0,0 +1,219 @@
+"""Detection of near-duplicate questions at posting time.
+
+MinHash signatures of the title and content of every question are held in
+memory in an LSH index (see qa_web.minhash). Bands of `ROWS_PER_BAND` rows
+group questions sharing most of their words, and only the
+`MAX_PER_BUCKET` most recently indexed questions of each bucket are read,
+so looking up the duplicates of a question compares a bounded number of
+signatures and takes the same time, around 2ms, however many questions are
+indexed.
+
+Signatures are never computed on the request path: they are stored in
+QuestionSignature by the question signal receivers of qa_web.signals once
+a change is committed, and by `manage.py update_related_questions` for
+questions which were not created through the models, e.g. imported ones.
+The index is loaded on first use from the stored signatures, then kept up
+to date by the same receivers. The changes made by other processes are
+applied from the signatures of the changed questions alone, at most every
+`QUESTION_INDEX_SYNC_INTERVAL` seconds (see qa_web.search.cache).
+
+An indexed question takes about 2.6KB: its 256 bytes signature and an entry
+in the buckets of each of its 16 bands, 260MB per process for 100 000
+questions.
+"""
+import threading
+import time
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from qa_web import minhash
+from qa_web.models import (Question, QuestionIndexGeneration,
+                           QuestionSignature)
+from qa_web.search.cache import current_generation, question_changes
+
+# Rows per band of the LSH index, pairs of questions estimated about 50%
+# similar are found two thirds of the time, pairs 70% similar almost always
+ROWS_PER_BAND = 4
+
+# Questions read from each bucket when looking up duplicates, the most
+# recently indexed ones, so that at most 16 * 50 signatures are ever compared
+MAX_PER_BUCKET = 50
+
+
+def text_signature(title, content):
+    """Signature of the title and content of a question."""
+    return minhash.signature(minhash.features(title, content))
+
+
+class DuplicateIndex:
+    """Thread-safe LSH index of the signatures of questions by id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = minhash.LSHIndex(ROWS_PER_BAND)
+        self.loaded = False
+        # Generation of the questions reflected by the index
+        self.generation = None
+        # Monotonic time of the last load or application of changes
+        self.synced_at = None
+
+    def load(self, signatures, generation=None):
+        """Replaces the content of the index.
+
+        :param signatures: Iterable of tuples of question id and signature
+        :param generation: Generation of the questions, read before them
+        """
+        index = minhash.LSHIndex(ROWS_PER_BAND)
+        for question_id, values in signatures:
+            index.add(question_id, values)
+        with self._lock:
+            self._index = index
+            self.loaded = True
+            self.generation = generation
+            self.synced_at = time.monotonic()
+
+    def _advance(self, generation):
+        """Records a change of the given generation, unless changes of other
+        generations were missed."""
+        if generation is not None and self.generation is not None and \
+                generation == self.generation + 1:
+            self.generation = generation
+
+    def add(self, question_id, values, generation=None):
+        """Adds or replaces the signature of a question. Ignored until the
+        index is loaded.
+
+        :param values: Signature of the question, see `text_signature`
+        :param generation: Generation of the change, see `load`
+        """
+        with self._lock:
+            if self.loaded:
+                self._index.add(question_id, values)
+                self._advance(generation)
+
+    def apply(self, question_ids, signatures, generation):
+        """Applies the changes of questions up to a generation. Ignored until
+        the index is loaded.
+
+        :param question_ids: Ids of the changed questions
+        :param signatures: Iterable of tuples of question id and signature
+                           of the changed questions still existing
+        :param generation: Latest generation of the changes
+        """
+        with self._lock:
+            if not self.loaded:
+                return
+            for question_id in question_ids:
+                self._index.remove(question_id)
+            for question_id, values in signatures:
+                self._index.add(question_id, values)
+            self.generation = generation
+            self.synced_at = time.monotonic()
+
+    def sync_due(self, interval):
+        """Whether the changes of other processes are to be applied, the
+        first caller once `interval` seconds passed since the last sync
+        claiming it."""
+        now = time.monotonic()
+        with self._lock:
+            if self.synced_at is None or now - self.synced_at < interval:
+                return False
+            self.synced_at = now
+            return True
+
+    def remove(self, question_id, generation=None):
+        """Removes the signature of a question, if indexed.
+
+        :param generation: Generation of the change, see `load`
+        """
+        with self._lock:
+            self._index.remove(question_id)
+            self._advance(generation)
+
+    def find(self, title, content, limit, threshold):
+        """Questions whose title and content are similar to the given ones.
+
+        :param limit: Maximum number of questions
+        :param threshold: Minimum estimated similarity of the questions
+        :return: List of tuples of question id and estimated similarity, from
+                 the most similar
+        """
+        values = text_signature(title, content)
+        with self._lock:
+            return self._index.query(values, limit, threshold,
+                                     max_per_bucket=MAX_PER_BUCKET)
+
+    def clear(self):
+        """Empties the index, which is loaded again on next use."""
+        with self._lock:
+            self._index.clear()
+            self.loaded = False
+            self.generation = None
+            self.synced_at = None
+
+    def __len__(self):
+        return len(self._index)
+
+
+duplicate_index = DuplicateIndex()
+
+
+def store_text_signature(question_id, values):
+    """Stores the signature of a question's title and content. The
+    signature of a new question is created stale, for qa_web.related to
+    compute its other signature.
+
+    :param values: Signature of the question, see `text_signature`
+    """
+    data = minhash.to_bytes(values)
+    if QuestionSignature.objects.filter(pk=question_id) \
+            .update(text_signature=data):
+        return
+    try:
+        with transaction.atomic():
+            QuestionSignature.objects.create(
+                question_id=question_id, text_signature=data, stale=True)
+    except IntegrityError:
+        # Deleted, or its signatures computed by qa_web.related meanwhile
+        pass
+
+
+def _signatures(signatures):
+    """Signatures of a queryset of QuestionSignature."""
+    for question_id, data in signatures \
+            .values_list('question_id', 'text_signature').iterator():
+        yield question_id, minhash.from_bytes(data)
+
+
+def _load_signatures():
+    """Loads every stored signature into the index."""
+    generation = current_generation(QuestionIndexGeneration)
+    duplicate_index.load(_signatures(QuestionSignature.objects.filter(
+        text_signature__isnull=False)), generation)
+
+
+def find_duplicates(title, content):
+    """Existing questions which are likely duplicates of a new one, loading
+    the index on first use and applying the changes of other processes once
+    due.
+
+    :return: List of Question instances, from the most similar
+    """
+    if not duplicate_index.loaded:
+        _load_signatures()
+    elif duplicate_index.sync_due(settings.QUESTION_INDEX_SYNC_INTERVAL):
+        changes = question_changes(
+            duplicate_index.generation,
+            QuestionSignature.objects.filter(text_signature__isnull=False))
+        if changes is None:
+            _load_signatures()
+        else:
+            generation, question_ids, signatures = changes
+            duplicate_index.apply(question_ids, _signatures(signatures),
+                                  generation)
+    matches = duplicate_index.find(title, content, settings.DUPLICATES_LIMIT,
+                                   settings.DUPLICATES_THRESHOLD)
+    # Questions deleted by another process are left out
+    questions = Question.objects.only('title').in_bulk(
+        [question_id for question_id, _ in matches])
+    return [questions[question_id] for question_id, _ in matches
+            if question_id in questions]
@@ -0,0 +1,67 @@
+"""Command running the search benchmark suite on synthetic corpora."""
+import json
+import platform
+import sqlite3
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from qa_web.search.benchmark import ENGINES, benchmark_backend
+
+
+class Command(BaseCommand):
+    help = 'Measures indexing, index size, query latency and throughput of ' \
+           'the search backends on generated corpora.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, action='append',
+                            dest='sizes',
+                            help='Number of questions of a corpus, repeat '
+                                 'for several corpora (10000 by default).')
+        parser.add_argument('--queries', type=int, default=200,
+                            help='Number of queries of the mix.')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of concurrent searchers, 0 to skip '
+                                 'measuring the throughput.')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Seed of the generated corpora.')
+        parser.add_argument('--backend', action='append',
+                            choices=sorted(ENGINES), dest='backends',
+                            help='Backend to benchmark, all by default.')
+        parser.add_argument('--output',
+                            help='Path of the JSON file the results are '
+                                 'written to.')
+
+    def handle(self, *args, **options):
+        runs = []
+        self.stdout.write(
+            '{:<8} {:>8} {:>10} {:>10} {:>10} {:>9} {:>9} {:>9}'.format(
+                'backend', 'size', 'build (s)', 'docs/sec', 'size (MB)',
+                'p50 (ms)', 'p99 (ms)', 'queries/s'))
+        for size in options['sizes'] or [10000]:
+            for name in options['backends'] or sorted(ENGINES):
+                result = benchmark_backend(
+                    name, size, options['queries'], options['concurrency'],
+                    options['seed'])
+                runs.append(result)
+                self.stdout.write(
+                    '{:<8} {:>8} {:>10.2f} {:>10.0f} {:>10.1f} {:>9.2f} '
+                    '{:>9.2f} {:>9.1f}'.format(
+                        name, size, result['build']['seconds'],
+                        result['build']['docs_per_second'],
+                        result['index_bytes'] / 2 ** 20,
+                        result['latency']['p50_ms'],
+                        result['latency']['p99_ms'],
+                        (result['throughput'] or {}).get(
+                            'queries_per_second', 0)))
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump({
+                    'date': timezone.now().isoformat(),
+                    'python': platform.python_version(),
+                    'sqlite': sqlite3.sqlite_version,
+                    'queries': options['queries'],
+                    'concurrency': options['concurrency'],
+                    'runs': runs,
+                }, output, indent=2)
+            self.stdout.write('Results written to {}.'.format(
+                options['output']))
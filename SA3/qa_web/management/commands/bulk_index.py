@@ -0,0 +1,36 @@
+"""Command rebuilding the search index with a pool of rendering processes."""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from qa_web.search.bulk import CHUNK_SIZE, bulk_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search index of questions in parallel chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                            help='Number of questions rendered and written '
+                                 'at once.')
+        parser.add_argument('--workers', type=int,
+                            help='Number of rendering processes, defaults to '
+                                 'the number of CPUs.')
+        parser.add_argument('--resume', action='store_true',
+                            help='Resume an interrupted rebuild after its '
+                                 'last written chunk.')
+        parser.add_argument('--checkpoint',
+                            default=settings.SEARCH_BULK_CHECKPOINT,
+                            help='Path of the file recording the progress.')
+
+    def handle(self, *args, **options):
+        def progress(num_documents, elapsed):
+            self.stdout.write('{} document(s) indexed, {:.1f} docs/sec'.format(
+                num_documents, num_documents / elapsed if elapsed else 0))
+
+        num_documents, elapsed = bulk_index(
+            options['checkpoint'], resume=options['resume'],
+            chunk_size=options['chunk_size'], workers=options['workers'],
+            progress=progress if options['verbosity'] > 1 else None)
+        self.stdout.write(
+            'Indexed {} question(s) in {:.1f} second(s), {:.1f} docs/sec.'
+            .format(num_documents, elapsed,
+                    num_documents / elapsed if elapsed else 0))
@@ -0,0 +1,21 @@
+"""Command generating the missing thumbnails of the users' pictures."""
+from django.core.management.base import BaseCommand
+from qa_web.models import User
+from qa_web.thumbnails import generate_thumbnails
+
+
+class Command(BaseCommand):
+    help = 'Generates the thumbnails missing from the pictures of the users.'
+
+    def handle(self, *args, **options):
+        names = set(User.objects.exclude(image='')
+                    .values_list('image', flat=True))
+        num_thumbnails = 0
+        for name in sorted(names):
+            try:
+                num_thumbnails += generate_thumbnails(name)
+            except OSError as error:
+                # Missing or unreadable picture
+                self.stderr.write('Skipped {}: {}'.format(name, error))
+        self.stdout.write('Generated {} thumbnail(s) of {} picture(s).'
+                          .format(num_thumbnails, len(names)))
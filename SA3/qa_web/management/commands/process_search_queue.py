@@ -0,0 +1,25 @@
+"""Command reindexing the questions queued by the search signal processor."""
+import time
+from django.core.management.base import BaseCommand
+from qa_web.search.queue import BATCH_SIZE, drain_queue
+
+
+class Command(BaseCommand):
+    help = 'Reindexes queued questions in batches until the queue is empty.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                            help='Number of queue entries read at once.')
+        parser.add_argument('--interval', type=float,
+                            help='Keep running, polling the queue every '
+                                 'INTERVAL seconds once it is empty.')
+
+    def handle(self, *args, **options):
+        while True:
+            num_questions = drain_queue(options['batch_size'])
+            if num_questions or options['interval'] is None:
+                self.stdout.write('Reindexed {} question(s).'
+                                  .format(num_questions))
+            if options['interval'] is None:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,14 @@
+"""Command recomputing the site-wide statistics stored in the database."""
+from django.core.management.base import BaseCommand
+from qa_web.stats import refresh_stats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the site-wide totals displayed by the listing ' \
+           'pages, e.g. after importing posts outside of the website.'
+
+    def handle(self, *args, **options):
+        stats = refresh_stats()
+        self.stdout.write('Site statistics refreshed: ' + ', '.join(
+            '{} {}'.format(total, name)
+            for name, total in sorted(stats.items())))
@@ -0,0 +1,20 @@
+"""Command storing the rendered HTML content of posts."""
+from django.core.management.base import BaseCommand
+from qa_web.rendering import BATCH_SIZE, render_posts
+
+
+class Command(BaseCommand):
+    help = 'Renders the Markdown content of the posts saved before their ' \
+           'HTML content was stored.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', dest='everything',
+                            help='Render every post again, e.g. after '
+                                 'changing the allowed markup.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                            help='Number of posts rendered within a '
+                                 'transaction.')
+
+    def handle(self, *args, **options):
+        count = render_posts(options['everything'], options['batch_size'])
+        self.stdout.write('Rendered {} post(s).'.format(count))
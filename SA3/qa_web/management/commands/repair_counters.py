@@ -0,0 +1,20 @@
+"""Command recomputing every denormalized counter from the posts tables."""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from qa_web.counters import recount_questions, recount_tags, recount_users
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized counters of the posts and the ' \
+           'statistics of the users in bulk.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            num_questions = recount_questions()
+            num_tags = recount_tags()
+            num_users = recount_users()
+        self.stdout.write('Recounted answers and comments of {} question(s).'
+                          .format(num_questions))
+        self.stdout.write('Recounted questions of {} tag(s).'.format(num_tags))
+        self.stdout.write('Recomputed statistics of {} user(s).'
+                          .format(num_users))
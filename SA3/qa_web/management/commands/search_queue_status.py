@@ -0,0 +1,13 @@
+"""Command reporting how far the search index lags behind the database."""
+from django.core.management.base import BaseCommand
+from qa_web.search.queue import queue_lag
+
+
+class Command(BaseCommand):
+    help = 'Reports the number and age of questions waiting to be reindexed.'
+
+    def handle(self, *args, **options):
+        num_entries, num_questions, age = queue_lag()
+        self.stdout.write(
+            '{} queued update(s) of {} question(s), oldest queued {:.0f} '
+            'second(s) ago.'.format(num_entries, num_questions, age))
@@ -0,0 +1,23 @@
+"""Command updating the precomputed related questions of the thread page."""
+from django.core.management.base import BaseCommand
+from qa_web.related import BATCH_SIZE, update_related_questions
+
+
+class Command(BaseCommand):
+    help = 'Computes the signatures of new and edited questions and updates ' \
+           'the related questions they affect.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true',
+                            help='Recompute every question rather than only '
+                                 'the changed ones.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                            help='Number of questions read or written at '
+                                 'once.')
+
+    def handle(self, *args, **options):
+        num_changed, num_updated = update_related_questions(
+            options['full'], options['batch_size'])
+        self.stdout.write('Computed {} signature(s), updated the related '
+                          'questions of {} question(s).'
+                          .format(num_changed, num_updated))
@@ -0,0 +1,115 @@
+"""Instrumentation of the SQL queries run by each request.
+
+Every query run while a request is processed goes through a wrapper of the
+database connections, which counts it, times it and records its shape: its
+SQL with parameters left out and lists of parameters collapsed, so that the
+same query run for different rows has a single shape. Shapes run more than
+once within a request usually reveal a query made per displayed row, which
+should be replaced by `select_related`, `prefetch_related` or annotations.
+
+The statistics are attached to the response as `query_stats`, read by the
+tests' query budgets, and reported:
+    - in `X-Query-*` response headers when DEBUG is on
+    - otherwise as a line of `key=value` pairs logged on `qa_web.queries`,
+      also passed as the record's `query_stats` attribute for structured
+      log handlers
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('qa_web.queries')
+
+# Lists of parameters, e.g. of `IN` clauses, whatever their length
+PARAMETER_LIST_RE = re.compile(r'\((?:%s, )*%s\)')
+
+# Number of duplicated shapes reported by the logs
+REPORTED_SHAPES = 3
+
+
+def query_shape(sql):
+    """Shape of a parametrized SQL query."""
+    return PARAMETER_LIST_RE.sub('(...)', sql)
+
+
+class QueryStats:
+    """Queries run while processing a request."""
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Runs a query, as a wrapper of the database connections."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time += time.perf_counter() - start
+            self.count += 1
+            self.shapes[query_shape(sql)] += 1
+
+    @property
+    def duplicates(self):
+        """Number of queries whose shape was already run."""
+        return sum(count - 1 for count in self.shapes.values())
+
+    def duplicated_shapes(self, limit=None):
+        """Shapes run more than once, from the most run.
+
+        :return: List of tuples of the shape and its number of runs
+        """
+        return [(shape, count) for shape, count
+                in self.shapes.most_common(limit) if count > 1]
+
+
+class QueryInstrumentationMiddleware:
+    """Records the queries run by each request, see the module's
+    documentation. Placed first so that the queries of the other
+    middleware are recorded too."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        response.query_stats = stats
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(stats.count)
+            response['X-Query-Time'] = '{:.1f}'.format(stats.time * 1000)
+            response['X-Query-Duplicates'] = str(stats.duplicates)
+        elif logger.isEnabledFor(logging.INFO):
+            view = _view_name(request)
+            logger.info(
+                'view=%s method=%s status=%d queries=%d sql_time_ms=%.1f '
+                'duplicates=%d', view, request.method, response.status_code,
+                stats.count, stats.time * 1000, stats.duplicates,
+                extra={'query_stats': {
+                    'view': view,
+                    'method': request.method,
+                    'status': response.status_code,
+                    'queries': stats.count,
+                    'sql_time_ms': round(stats.time * 1000, 1),
+                    'duplicates': stats.duplicates,
+                    'duplicated_shapes': stats.duplicated_shapes(
+                        REPORTED_SHAPES),
+                }})
+        return response
+
+
+def _view_name(request):
+    """Name of the view which processed a request, its path when no view
+    was resolved."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return request.path
+    return match.view_name
@@ -0,0 +1,35 @@
+# Generated by Django 2.0.13 on 2026-10-18 10:40
+
+from django.db import migrations
+from django.db.models import Count, Max
+
+
+def remove_duplicate_votes(apps, schema_editor):
+    """Keeps only the latest vote of a user on a post so that the unique
+    constraints can be created."""
+    Vote = apps.get_model('qa_web', 'Vote')
+    for post_field in ('question', 'answer', 'comment'):
+        duplicates = Vote.objects.filter(**{post_field + '__isnull': False}) \
+            .values('user', post_field) \
+            .annotate(num_votes=Count('id'), last_vote=Max('id')) \
+            .filter(num_votes__gt=1)
+        for duplicate in duplicates:
+            Vote.objects.filter(user=duplicate['user'],
+                                **{post_field: duplicate[post_field]}) \
+                .exclude(id=duplicate['last_vote']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0008_user_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_votes,
+                             migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='vote',
+            unique_together={('user', 'answer'), ('user', 'question'), ('user', 'comment')},
+        ),
+    ]
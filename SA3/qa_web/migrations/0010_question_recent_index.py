@@ -0,0 +1,17 @@
+# Generated by Django 2.0.13 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0009_vote_unique_per_post'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['creation_date', 'id'], name='question_recent_idx'),
+        ),
+    ]
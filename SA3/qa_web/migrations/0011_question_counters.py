@@ -0,0 +1,42 @@
+# Generated by Django 2.0.13 on 2026-10-18 10:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Counts the existing answers and comments of every question."""
+    Question = apps.get_model('qa_web', 'Question')
+    Answer = apps.get_model('qa_web', 'Answer')
+    Comment = apps.get_model('qa_web', 'Comment')
+
+    def count(model):
+        counts = model.objects.filter(question=OuterRef('pk')).order_by() \
+            .values('question').annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(counts, output_field=models.IntegerField()),
+                        0)
+
+    Question.objects.update(num_answers=count(Answer),
+                            num_comments=count(Comment))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0010_question_recent_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='num_answers',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='num_comments',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 2.0.13 on 2026-10-18 10:46
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def backfill_tag_usage(apps, schema_editor):
+    """Counts the existing questions classified under each tag."""
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    TaggedItem = apps.get_model('taggit', 'TaggedItem')
+    Question = apps.get_model('qa_web', 'Question')
+    TagUsage = apps.get_model('qa_web', 'TagUsage')
+    try:
+        question_type = ContentType.objects.get(app_label='qa_web',
+                                                model='question')
+    except ContentType.DoesNotExist:
+        # Fresh database, nothing was ever tagged
+        return
+    counts = TaggedItem.objects.filter(
+        content_type=question_type,
+        object_id__in=Question.objects.values('pk')) \
+        .values('tag').annotate(num_questions=Count('pk'))
+    TagUsage.objects.bulk_create(
+        TagUsage(tag_id=count['tag'], num_questions=count['num_questions'])
+        for count in counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('taggit', '0002_auto_20150616_2121'),
+        ('qa_web', '0011_question_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagUsage',
+            fields=[
+                ('tag', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='usage', serialize=False, to='taggit.Tag')),
+                ('num_questions', models.IntegerField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_tag_usage, migrations.RunPython.noop),
+    ]
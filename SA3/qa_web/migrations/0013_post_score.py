@@ -0,0 +1,45 @@
+# Generated by Django 2.0.13 on 2026-10-18 10:50
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_scores(apps, schema_editor):
+    """Computes the score of every existing post from its votes."""
+    for model_name in ('Question', 'Answer', 'Comment'):
+        apps.get_model('qa_web', model_name).objects.update(
+            score=F('upvotes') - F('downvotes'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0012_tag_usage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'correct_answer', 'score'], name='answer_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'creation_date'], name='answer_recent_idx'),
+        ),
+    ]
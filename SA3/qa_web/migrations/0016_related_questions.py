@@ -0,0 +1,35 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0015_search_index_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionSignature',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='qa_web.Question')),
+                ('signature', models.BinaryField()),
+                ('stale', models.BooleanField(db_index=True, default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedQuestion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('similarity', models.FloatField()),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='qa_web.Question')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='qa_web.Question')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='relatedquestion',
+            index=models.Index(fields=['question', '-similarity'], name='related_question_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0016_related_questions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='questionsignature',
+            name='text_signature',
+            field=models.BinaryField(null=True),
+        ),
+    ]
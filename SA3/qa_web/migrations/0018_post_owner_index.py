@@ -0,0 +1,25 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0017_question_text_signature'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['owner', 'creation_date', 'id'], name='answer_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['owner', 'creation_date', 'id'], name='comment_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['owner', 'creation_date', 'id'], name='question_owner_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:23
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+import django.db.models.deletion
+
+
+def backfill_stats(apps, schema_editor):
+    """Computes the statistics of every existing user from their posts."""
+    stats = {pk: apps.get_model('qa_web', 'UserStats')(user_id=pk)
+             for pk in apps.get_model('qa_web', 'User').objects
+             .values_list('pk', flat=True)}
+    for model_name, field in (('Question', 'num_questions'),
+                              ('Answer', 'num_answers'),
+                              ('Comment', 'num_comments')):
+        totals = apps.get_model('qa_web', model_name).objects \
+            .filter(owner__isnull=False).values('owner') \
+            .annotate(count=Count('pk'), score=Sum('score'))
+        for total in totals:
+            setattr(stats[total['owner']], field, total['count'])
+            stats[total['owner']].score += total['score']
+    accepted = apps.get_model('qa_web', 'Answer').objects \
+        .filter(owner__isnull=False, correct_answer=True).values('owner') \
+        .annotate(count=Count('pk'))
+    for total in accepted:
+        stats[total['owner']].num_accepted = total['count']
+    apps.get_model('qa_web', 'UserStats').objects.bulk_create(stats.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0018_post_owner_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('score', models.IntegerField(default=0)),
+                ('num_questions', models.IntegerField(default=0)),
+                ('num_answers', models.IntegerField(default=0)),
+                ('num_accepted', models.IntegerField(default=0)),
+                ('num_comments', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0019_user_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='content_html',
+            field=models.TextField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='content_html',
+            field=models.TextField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='content_html',
+            field=models.TextField(editable=False, null=True),
+        ),
+    ]
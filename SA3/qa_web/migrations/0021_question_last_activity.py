@@ -0,0 +1,40 @@
+# Generated by Django 2.0.13 on 2026-10-18 11:40
+
+from django.db import migrations, models
+from django.db.models import Max
+import django.utils.timezone
+
+
+def backfill_last_activity(apps, schema_editor):
+    """Sets the last activity on existing questions to the creation of the
+    most recent post of their thread."""
+    question_model = apps.get_model('qa_web', 'Question')
+    latest = dict(question_model.objects.values_list('pk', 'creation_date'))
+    for model_name, lookup in (('Answer', 'question'),
+                               ('Comment', 'question'),
+                               ('Comment', 'answer__question')):
+        dates = apps.get_model('qa_web', model_name).objects \
+            .filter(**{lookup + '__isnull': False}).values(lookup) \
+            .annotate(last=Max('creation_date')).values_list(lookup, 'last')
+        for question_id, date in dates:
+            latest[question_id] = max(latest[question_id], date)
+    for question_id, date in latest.items():
+        question_model.objects.filter(pk=question_id) \
+            .update(last_activity=date)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0020_post_content_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='last_activity',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_last_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.0.13 on 2026-10-18 12:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0021_question_last_activity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionIndexGeneration',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generation', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
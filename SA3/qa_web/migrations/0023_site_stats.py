@@ -0,0 +1,28 @@
+# Generated by Django 2.0.13 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0022_question_index_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('questions', models.IntegerField(default=0)),
+                ('answers', models.IntegerField(default=0)),
+                ('comments', models.IntegerField(default=0)),
+                ('votes', models.IntegerField(default=0)),
+                ('users', models.IntegerField(default=0)),
+                ('refreshed', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name_plural': 'site stats',
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.0.13 on 2026-10-18 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0023_site_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generation', models.IntegerField(unique=True)),
+                ('question_id', models.IntegerField()),
+            ],
+        ),
+    ]
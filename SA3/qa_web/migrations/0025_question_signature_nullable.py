@@ -0,0 +1,18 @@
+# Generated by Django 2.0.13 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa_web', '0024_question_change'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='questionsignature',
+            name='signature',
+            field=models.BinaryField(null=True),
+        ),
+    ]
@@ -0,0 +1,188 @@
+"""MinHash signatures estimating how similar questions are.
+
+A question is reduced to the set of its words and tags. Its signature holds,
+for each of `NUM_PERMUTATIONS` hash functions, the minimum hash of the set's
+elements. Two signatures agree on a hash function with a probability equal
+to the Jaccard similarity of both sets, so the fraction of agreeing values
+estimates it in a constant time however long the questions are.
+
+Locality-sensitive hashing (LSH) then finds similar questions without
+comparing a signature with every other one: signatures are split in bands of
+`rows_per_band` values and questions agreeing on a whole band share a bucket.
+A pair of similarity s shares at least one bucket with the probability
+1 - (1 - s^r)^b, where r is the number of rows per band and b the number of
+bands. Fewer rows per band find less similar questions at the cost of
+larger buckets.
+
+Hashes are computed with crc32 and fixed permutations so that signatures
+are the same in every process and can be stored.
+"""
+import random
+import re
+import zlib
+from array import array
+
+NUM_PERMUTATIONS = 64
+
+# Prime larger than any crc32, the permutations being (a * x + b) mod prime
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(341)
+PERMUTATIONS = [(_rng.randint(1, MERSENNE_PRIME - 1),
+                 _rng.randint(0, MERSENNE_PRIME - 1))
+                for _ in range(NUM_PERMUTATIONS)]
+
+# Words too common to tell questions apart
+STOP_WORDS = frozenset('''
+    a an and are as at be but by can do does for from had has have how i if
+    in is it its me my no not of on or so that the their then there these
+    this to was we what when where which who why will with would you your
+'''.split())
+
+WORD_RE = re.compile(r'\w+')
+
+
+def features(title, content, tags=()):
+    """Set of the words of a question and its tags, tags being distinguished
+    from the words they are spelled like.
+
+    :param tags: Names of the question's tags
+    :return: Set of strings
+    """
+    words = WORD_RE.findall('{} {}'.format(title or '', content or '').lower())
+    result = {word for word in words
+              if len(word) > 1 and word not in STOP_WORDS}
+    result.update('tag:' + tag.lower() for tag in tags)
+    return result
+
+
+def signature(elements):
+    """MinHash signature of a set.
+
+    :param elements: Set of strings, see `features`
+    :return: Array of `NUM_PERMUTATIONS` unsigned integers, empty for an
+             empty set
+    """
+    hashes = [zlib.crc32(element.encode('utf-8')) for element in elements]
+    if not hashes:
+        return array('I')
+    return array('I', (min((a * value + b) % MERSENNE_PRIME
+                           for value in hashes) & MAX_HASH
+                       for a, b in PERMUTATIONS))
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of the sets of two signatures."""
+    if not first or not second:
+        return 0.0
+    return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+def to_bytes(values):
+    """Packs a signature to be stored in a binary field."""
+    return values.tobytes()
+
+
+def from_bytes(data):
+    """Unpacks a signature packed by `to_bytes`."""
+    values = array('I')
+    values.frombytes(bytes(data))
+    return values
+
+
+class LSHIndex:
+    """In-memory index of signatures by key, looking up the keys of similar
+    signatures from the buckets they share.
+    """
+
+    def __init__(self, rows_per_band):
+        self.rows_per_band = rows_per_band
+        self._buckets = [{} for _ in
+                         range(NUM_PERMUTATIONS // rows_per_band)]
+        self._signatures = {}
+
+    def _bands(self, values):
+        # Buckets are keyed by the hash of the band's values, the rare
+        # collisions only adding candidates whose similarity is then checked.
+        # They are lists, most of them holding a single key.
+        rows = self.rows_per_band
+        return ((band, hash(values[band * rows:(band + 1) * rows].tobytes()))
+                for band in range(len(self._buckets)))
+
+    def add(self, key, values):
+        """Indexes the signature of a key, replacing its previous one.
+        Empty signatures are not indexed.
+        """
+        self.remove(key)
+        if not values:
+            return
+        self._signatures[key] = values
+        for band, bucket in self._bands(values):
+            self._buckets[band].setdefault(bucket, []).append(key)
+
+    def remove(self, key):
+        """Unindexes a key, if indexed."""
+        values = self._signatures.pop(key, None)
+        if values is None:
+            return
+        for band, bucket in self._bands(values):
+            keys = self._buckets[band][bucket]
+            keys.remove(key)
+            if not keys:
+                del self._buckets[band][bucket]
+
+    def signature(self, key):
+        """Indexed signature of a key, None if not indexed."""
+        return self._signatures.get(key)
+
+    def candidates(self, values, max_per_bucket=None):
+        """Keys sharing at least one bucket with a signature.
+
+        :param max_per_bucket: Maximum number of keys read from each bucket,
+                               the most recently indexed ones, bounding the
+                               number of candidates. Larger buckets mostly
+                               gather questions sharing common words.
+        """
+        result = set()
+        if values:
+            for band, bucket in self._bands(values):
+                keys = self._buckets[band].get(bucket, ())
+                if max_per_bucket is not None:
+                    # Keys are appended as they are indexed
+                    keys = keys[-max_per_bucket:]
+                result.update(keys)
+        return result
+
+    def query(self, values, limit, threshold=0.0, exclude=None,
+              max_per_bucket=None):
+        """Most similar keys to a signature.
+
+        :param values: Signature to compare with
+        :param limit: Maximum number of keys
+        :param threshold: Minimum estimated similarity of the keys
+        :param exclude: Key left out of the results, usually the signature's
+        :param max_per_bucket: See `candidates`
+        :return: List of tuples of the key and its estimated similarity, from
+                 the most similar
+        """
+        scored = []
+        for key in self.candidates(values, max_per_bucket):
+            if key == exclude:
+                continue
+            score = similarity(values, self._signatures[key])
+            if score >= threshold:
+                scored.append((score, key))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(key, score) for score, key in scored[:limit]]
+
+    def clear(self):
+        for buckets in self._buckets:
+            buckets.clear()
+        self._signatures.clear()
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def __contains__(self, key):
+        return key in self._signatures
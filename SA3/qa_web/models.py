@@ -8,6 +8,7 @@ from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from taggit.managers import TaggableManager
+from taggit.models import Tag
 
 
 class User(AbstractUser):
@@ -28,19 +29,25 @@ class Post(models.Model):
     on the website
     """
     content = models.TextField(null=True)
+    # `content` rendered to sanitized HTML when the post is saved, see
+    # qa_web.rendering. NULL for posts not rendered yet.
+    content_html = models.TextField(null=True, editable=False)
     owner = models.ForeignKey(settings.AUTH_USER_MODEL,
                               null=True, on_delete=models.SET_NULL)
     creation_date = models.DateTimeField(auto_now_add=True)
     upvotes = models.IntegerField(default=0)
     downvotes = models.IntegerField(default=0)
+    # Value based on the number of votes on the Post, `upvotes - downvotes`,
+    # stored so that posts can be sorted by it using an index.
+    # Maintained by qa_web.votes, and recomputed whenever a post is saved.
+    score = models.IntegerField(default=0)
 
     class Meta:
         abstract = True
 
-    @property
-    def score(self):
-        """Value based on the number of votes on the Post."""
-        return self.upvotes - self.downvotes
+    def save(self, *args, **kwargs):
+        self.score = self.upvotes - self.downvotes
+        super().save(*args, **kwargs)
 
 
 class Question(Post):
@@ -50,15 +57,34 @@ class Question(Post):
     """
     title = models.CharField(max_length=300, null=True)
     visits = models.IntegerField(default=0)
+    # Time of the last change to the question's thread, validating the
+    # cached copies of the pages displaying it, see qa_web.conditional
+    last_activity = models.DateTimeField(auto_now=True, db_index=True)
+    # Denormalized counters maintained by qa_web.signals, respectively the
+    # number of answers and the number of comments directly on the question
+    num_answers = models.IntegerField(default=0)
+    num_comments = models.IntegerField(default=0)
     voters = models.ManyToManyField(
         settings.AUTH_USER_MODEL, related_name='q_voters', through='Vote')
     tag = TaggableManager(blank=True)
 
+    class Meta:
+        indexes = [
+            # Listing questions from the most recent, see qa_web.pagination
+            models.Index(fields=['creation_date', 'id'],
+                         name='question_recent_idx'),
+            # Listing a user's questions, see qa_web.activity
+            models.Index(fields=['owner', 'creation_date', 'id'],
+                         name='question_owner_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
     def get_answer_queryset(self):
-        return Answer.objects.filter(question=self)
+        """Answers of the question, served from `prefetch_related('answer_set')`
+        when the question was loaded with it."""
+        return self.answer_set.all()
 
 
 class Answer(Post):
@@ -72,6 +98,18 @@ class Answer(Post):
     voters = models.ManyToManyField(
         settings.AUTH_USER_MODEL, related_name='a_voters', through='Vote')
 
+    class Meta:
+        indexes = [
+            # Sorting the answers of a question, see qa_web.threads
+            models.Index(fields=['question', 'correct_answer', 'score'],
+                         name='answer_score_idx'),
+            models.Index(fields=['question', 'creation_date'],
+                         name='answer_recent_idx'),
+            # Listing a user's answers, see qa_web.activity
+            models.Index(fields=['owner', 'creation_date', 'id'],
+                         name='answer_owner_idx'),
+        ]
+
 
 class Comment(Post):
     """A Comment is a lower-level response to either an Answer or Question.
@@ -83,6 +121,13 @@ class Comment(Post):
     voters = models.ManyToManyField(
         settings.AUTH_USER_MODEL, related_name='c_voters', through='Vote')
 
+    class Meta:
+        indexes = [
+            # Listing a user's comments, see qa_web.activity
+            models.Index(fields=['owner', 'creation_date', 'id'],
+                         name='comment_owner_idx'),
+        ]
+
 
 class Vote(models.Model):
     """Defines the relationship between a user voting and the post.
@@ -95,3 +140,156 @@ class Vote(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.SET_NULL, null=True)
     positive = models.BooleanField()
+
+    class Meta:
+        # A user can only vote once on a given post. Since the foreign keys of
+        # the other post types are NULL, they never conflict with each other.
+        unique_together = (('user', 'question'), ('user', 'answer'),
+                           ('user', 'comment'))
+
+
+class UserStats(models.Model):
+    """Reputation of a user, the total score of their posts, along with the
+    number of posts they wrote and of their answers selected as best.
+    Maintained by qa_web.reputation as posts are created, voted on, selected
+    or deleted, it allows displaying them without aggregating the posts
+    tables.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, primary_key=True,
+                                related_name='stats',
+                                on_delete=models.CASCADE)
+    score = models.IntegerField(default=0)
+    num_questions = models.IntegerField(default=0)
+    num_answers = models.IntegerField(default=0)
+    num_accepted = models.IntegerField(default=0)
+    num_comments = models.IntegerField(default=0)
+
+    def __str__(self):
+        return 'Statistics of user {}'.format(self.user_id)
+
+
+class TagUsage(models.Model):
+    """Number of questions classified under a tag.
+    Maintained by qa_web.signals as questions are tagged, untagged or deleted,
+    it allows displaying the most used tags without scanning the whole
+    tagging table.
+    """
+    tag = models.OneToOneField(Tag, primary_key=True, related_name='usage',
+                               on_delete=models.CASCADE)
+    num_questions = models.IntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return '{} ({})'.format(self.tag, self.num_questions)
+
+
+class SearchQueueEntry(models.Model):
+    """Question waiting to be reindexed by the search queue worker.
+    Entries are recorded in the same transaction as the change to the
+    question, see qa_web.search.queue. The question is not a foreign key as
+    its deletion must also be processed.
+    """
+    question_id = models.IntegerField(db_index=True)
+    queued_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return 'Question {} queued at {}'.format(self.question_id,
+                                                 self.queued_at)
+
+
+class SearchIndexGeneration(models.Model):
+    """Counter incremented each time the search index is written to, a
+    single row shared by the web and indexing processes.
+    See qa_web.search.cache.
+    """
+    generation = models.IntegerField(default=0)
+
+    def __str__(self):
+        return 'Search index generation {}'.format(self.generation)
+
+
+class QuestionIndexGeneration(models.Model):
+    """Counter incremented each time a question is saved or deleted, a
+    single row shared by the web processes. Each change is recorded as a
+    QuestionChange for the in-memory indexes of questions of the other
+    processes, see qa_web.search.suggest and qa_web.duplicates.
+    """
+    generation = models.IntegerField(default=0)
+
+    def __str__(self):
+        return 'Question index generation {}'.format(self.generation)
+
+
+class QuestionChange(models.Model):
+    """Question saved or deleted at a generation of QuestionIndexGeneration,
+    from which the in-memory indexes of questions of the other processes
+    apply the change. Only the most recent changes are kept, see
+    qa_web.search.cache.
+    """
+    generation = models.IntegerField(unique=True)
+    question_id = models.IntegerField()
+
+    def __str__(self):
+        return 'Question {} changed at generation {}'.format(
+            self.question_id, self.generation)
+
+
+class SiteStats(models.Model):
+    """Site-wide totals displayed by the listing pages, a single row shared
+    by the web processes. Each total is adjusted as objects are created and
+    deleted and recounted once `refreshed` is older than `SITE_STATS_TTL`,
+    see qa_web.stats.
+    """
+    questions = models.IntegerField(default=0)
+    answers = models.IntegerField(default=0)
+    comments = models.IntegerField(default=0)
+    votes = models.IntegerField(default=0)
+    users = models.IntegerField(default=0)
+    refreshed = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = 'site stats'
+
+    def __str__(self):
+        return 'Site statistics of {}'.format(self.refreshed)
+
+
+class QuestionSignature(models.Model):
+    """MinHash signatures of a question, see qa_web.minhash: `signature` of
+    its title, content and tags for qa_web.related, `text_signature` of its
+    title and content only for qa_web.duplicates. `stale` marks questions
+    edited since their signatures were computed, questions without
+    signatures being new ones. Both are picked up by qa_web.related.
+    `text_signature` is also stored by qa_web.signals once a question's
+    change is committed, before `signature` of a new question is computed.
+    """
+    question = models.OneToOneField(Question, primary_key=True,
+                                    related_name='signature',
+                                    on_delete=models.CASCADE)
+    signature = models.BinaryField(null=True)
+    text_signature = models.BinaryField(null=True)
+    stale = models.BooleanField(default=False, db_index=True)
+
+    def __str__(self):
+        return 'Signature of question {}'.format(self.question_id)
+
+
+class RelatedQuestion(models.Model):
+    """One of the questions most similar to another, precomputed by
+    qa_web.related.
+    """
+    question = models.ForeignKey(Question, related_name='related_links',
+                                 on_delete=models.CASCADE)
+    related = models.ForeignKey(Question, related_name='+',
+                                on_delete=models.CASCADE)
+    similarity = models.FloatField()
+
+    class Meta:
+        indexes = [
+            # Reading the related questions of a question, most similar first
+            models.Index(fields=['question', '-similarity'],
+                         name='related_question_idx'),
+        ]
+
+    def __str__(self):
+        return '{} -> {} ({:.2f})'.format(self.question_id, self.related_id,
+                                          self.similarity)
@@ -0,0 +1,111 @@
+"""Keyset (cursor) pagination of posts listed from the most recent.
+
+Offset pagination makes the database scan and discard every row preceding the
+requested page. Keyset pagination instead filters on the (`creation_date`,
+`id`) of the last post of the previous page, which an index on these columns
+serves directly whatever the depth of the page.
+
+Only the links to the next page carry a cursor. Links to a numbered page,
+e.g. the first, last or neighbouring pages of the listing, are served with
+an OFFSET, so their cost still grows with the number of the page.
+"""
+from datetime import datetime, timedelta
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+from django.utils import timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Ordering required for the cursors to be consistent across pages.
+ORDERING = ('-creation_date', '-id')
+
+
+def encode_cursor(post):
+    """Cursor pointing right after the given post.
+
+    :param post: Any model instance with a `creation_date`
+    :return: String in the format `<microseconds since epoch>_<id>`
+    """
+    delta = post.creation_date - EPOCH
+    microseconds = (delta.days * 86400 + delta.seconds) * 10 ** 6 + \
+        delta.microseconds
+    return '{}_{}'.format(microseconds, post.pk)
+
+
+def decode_cursor(cursor):
+    """Inverse of `encode_cursor`.
+
+    :param cursor: Cursor string
+    :return: Tuple of the post's creation date and id
+    :raises ValueError: If the cursor is malformed
+    """
+    microseconds, _, pk = cursor.partition('_')
+    return EPOCH + timedelta(microseconds=int(microseconds)), int(pk)
+
+
+def after_cursor(queryset, cursor):
+    """Filters a queryset ordered by `ORDERING` to the posts following the
+    cursor."""
+    creation_date, pk = decode_cursor(cursor)
+    # The bound on `creation_date` alone lets the database seek the index
+    # to the cursor rather than scanning it from the most recent post
+    return queryset.filter(
+        Q(creation_date__lte=creation_date) &
+        (Q(creation_date__lt=creation_date) | Q(id__lt=pk)))
+
+
+class KeysetPage(Page):
+    """Page of a `KeysetPaginator`, holding the cursor to the next page."""
+
+    @property
+    def next_cursor(self):
+        """Cursor to the following page, None on the last page."""
+        if len(self.object_list) < self.paginator.per_page:
+            return None
+        return encode_cursor(self.object_list[-1])
+
+    @property
+    def next_number(self):
+        """Number of the following page, without validating it against a
+        possibly approximate total."""
+        return self.number + 1
+
+
+class KeysetPaginator(Paginator):
+    """Paginator ordering posts by `ORDERING` which serves pages either by
+    number, using an offset, or following a cursor.
+
+    The total number of objects can be provided, e.g. from a cache, to avoid
+    a `COUNT(*)` query. Page numbers are then only as accurate as that total.
+    """
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super(KeysetPaginator, self).__init__(
+            object_list.order_by(*ORDERING), per_page, **kwargs)
+        if count is not None:
+            self.count = count
+
+    def page_after(self, cursor, number):
+        """Page of the objects following a cursor.
+
+        :param cursor: Cursor obtained from a previous page's `next_cursor`
+        :param number: Number given to the page for display
+        :return: KeysetPage instance
+        :raises ValueError: If the cursor is malformed
+        """
+        try:
+            number = min(max(int(number), 1), self.num_pages)
+        except (TypeError, ValueError):
+            number = 1
+        objects = list(after_cursor(self.object_list, cursor)[:self.per_page])
+        return self._get_page(objects, number, self)
+
+    def page(self, number):
+        """Page of a given number, read with an OFFSET."""
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            list(self.object_list[bottom:bottom + self.per_page]), number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return KeysetPage(*args, **kwargs)
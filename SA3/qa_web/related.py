@@ -0,0 +1,191 @@
+"""Related questions displayed on the thread page.
+
+Similarity is computed offline by `manage.py update_related_questions` so
+that displaying the related questions of a thread is a single indexed read
+of the RelatedQuestion table.
+
+Each question's title, content and tags are reduced to a MinHash signature
+stored in QuestionSignature (see qa_web.minhash). Signatures are loaded in
+an LSH index whose buckets give, for each question, the candidates to rank,
+at most the `MAX_PER_BUCKET` most recent questions of each bucket. Only the
+`RELATED_QUESTIONS_COUNT` most similar ones are kept.
+
+Updates are incremental: only new questions and questions marked stale by
+qa_web.signals when edited or retagged get a new signature. Their related
+questions are then recomputed along with those of every question which
+could now rank them differently, namely the questions already listing one
+of them and the questions sharing a bucket with one of them which it is
+more similar to than their least similar related question. Buckets being
+only held in memory, the index is loaded from every stored signature
+whenever some question changed.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from qa_web import minhash
+from qa_web.models import Question, QuestionSignature, RelatedQuestion
+
+# Rows per band of the LSH index, pairs of questions estimated about 20%
+# similar are found half of the time, pairs 50% similar almost always
+ROWS_PER_BAND = 2
+
+# Questions read from each bucket, the most recent ones, so that buckets of
+# common words do not make every question a candidate of every other one
+MAX_PER_BUCKET = 100
+
+# Number of questions read or written at once
+BATCH_SIZE = 500
+
+
+def _chunks(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def question_signature(question):
+    """Signature of a question, loaded with its tags prefetched."""
+    return minhash.signature(minhash.features(
+        question.title, question.content,
+        [tag.name for tag in question.tag.all()]))
+
+
+def update_signatures(question_ids, batch_size=BATCH_SIZE):
+    """Computes and stores the signatures of questions.
+
+    Stale flags are cleared before the questions are read, so that a
+    question edited meanwhile remains stale and is picked up by the next
+    update.
+    """
+    for chunk in _chunks(question_ids, batch_size):
+        QuestionSignature.objects.filter(pk__in=chunk).update(stale=False)
+        existing = set(QuestionSignature.objects.filter(pk__in=chunk)
+                       .values_list('pk', flat=True))
+        new_signatures = []
+        with transaction.atomic():
+            for question in Question.objects.filter(pk__in=chunk) \
+                    .only('title', 'content').prefetch_related('tag'):
+                data = {
+                    'signature': minhash.to_bytes(
+                        question_signature(question)),
+                    'text_signature': minhash.to_bytes(minhash.signature(
+                        minhash.features(question.title, question.content))),
+                }
+                if question.pk in existing:
+                    QuestionSignature.objects.filter(pk=question.pk) \
+                        .update(**data)
+                else:
+                    new_signatures.append(QuestionSignature(
+                        question_id=question.pk, **data))
+            QuestionSignature.objects.bulk_create(new_signatures)
+
+
+def load_index():
+    """LSH index of every stored signature by question id, added from the
+    oldest question so that buckets end with the most recent ones. New
+    questions whose text signature alone is stored are left out."""
+    index = minhash.LSHIndex(ROWS_PER_BAND)
+    for question_id, data in QuestionSignature.objects \
+            .filter(signature__isnull=False).order_by('pk') \
+            .values_list('question_id', 'signature').iterator():
+        index.add(question_id, minhash.from_bytes(data))
+    return index
+
+
+def update_related(index, question_ids, batch_size=BATCH_SIZE):
+    """Replaces the related questions of questions with the most similar
+    ones of an index."""
+    count = settings.RELATED_QUESTIONS_COUNT
+    for chunk in _chunks(question_ids, batch_size):
+        links = [RelatedQuestion(question_id=question_id,
+                                 related_id=related_id, similarity=score)
+                 for question_id in chunk
+                 for related_id, score in index.query(
+                     index.signature(question_id), count, exclude=question_id,
+                     max_per_bucket=MAX_PER_BUCKET)]
+        with transaction.atomic():
+            RelatedQuestion.objects.filter(question_id__in=chunk).delete()
+            RelatedQuestion.objects.bulk_create(links)
+
+
+def outranked_questions(index, changed, batch_size=BATCH_SIZE):
+    """Questions which would list one of the changed questions among their
+    related questions, it being more similar to them than the least similar
+    one they list, or them listing fewer than `RELATED_QUESTIONS_COUNT`.
+
+    :param index: LSH index holding the new signatures
+    :param changed: Set of ids of the changed questions
+    :return: Set of question ids, without the changed ones
+    """
+    similarities = {}
+    for question_id in changed:
+        values = index.signature(question_id)
+        for candidate in index.candidates(values, MAX_PER_BUCKET):
+            if candidate not in changed:
+                score = minhash.similarity(index.signature(candidate), values)
+                similarities[candidate] = max(
+                    score, similarities.get(candidate, 0.0))
+    count = settings.RELATED_QUESTIONS_COUNT
+    result = set()
+    for chunk in _chunks(similarities, batch_size):
+        listed = {question_id: (num_related, least)
+                  for question_id, num_related, least in RelatedQuestion
+                  .objects.filter(question_id__in=chunk)
+                  .values('question_id')
+                  .annotate(num_related=Count('pk'), least=Min('similarity'))
+                  .values_list('question_id', 'num_related', 'least')}
+        for question_id in chunk:
+            num_related, least = listed.get(question_id, (0, 0.0))
+            if num_related < count or similarities[question_id] >= least:
+                result.add(question_id)
+    return result
+
+
+def update_related_questions(full=False, batch_size=BATCH_SIZE):
+    """Updates signatures and related questions.
+
+    :param full: Recompute every signature and every question's related
+                 questions rather than only the changed ones
+    :param batch_size: Number of questions read or written at once
+    :return: Tuple of the number of signatures computed and the number of
+             questions whose related questions were recomputed
+    """
+    if full:
+        changed = set(Question.objects.values_list('pk', flat=True))
+    else:
+        changed = set(Question.objects.filter(signature__isnull=True)
+                      .values_list('pk', flat=True))
+        changed.update(QuestionSignature.objects.filter(stale=True)
+                       .values_list('pk', flat=True))
+    if not changed:
+        return 0, 0
+    update_signatures(sorted(changed), batch_size)
+
+    index = load_index()
+    affected = set(changed)
+    if not full:
+        affected.update(outranked_questions(index, changed, batch_size))
+        for chunk in _chunks(changed, batch_size):
+            affected.update(RelatedQuestion.objects
+                            .filter(related_id__in=chunk)
+                            .values_list('question_id', flat=True))
+    # Changed questions without any word keep no related questions
+    affected = sorted(pk for pk in affected if pk in index or pk in changed)
+    update_related(index, affected, batch_size)
+    return len(changed), len(affected)
+
+
+def mark_stale(question_id):
+    """Marks the signature of an edited question for recomputation."""
+    QuestionSignature.objects.filter(pk=question_id).update(stale=True)
+
+
+def related_questions(question):
+    """Precomputed related questions of a question, most similar first, read
+    with a single query.
+
+    :return: List of Question instances with only their title loaded
+    """
+    return [link.related for link in RelatedQuestion.objects
+            .filter(question=question).order_by('-similarity')
+            .select_related('related').only('related', 'related__title')]
@@ -0,0 +1,95 @@
+"""Rendering of the Markdown content of posts to HTML.
+
+Content is rendered and sanitized once, when a post is saved, into its
+`content_html` field by the receivers of qa_web.signals, so that pages
+output the stored HTML as is instead of converting every post in the
+browser. Editing a post only renders that post again.
+
+`manage.py render_posts` renders the posts saved before `content_html`
+existed, or every post with `--all` e.g. after changing the allowed markup.
+Until then, such posts are rendered on the fly by `post_html`.
+"""
+import bleach
+import markdown
+from django.db import transaction
+from django.utils.safestring import mark_safe
+from qa_web.models import Answer, Comment, Question
+
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+]
+
+# Markup kept by the sanitizer, the rest of the HTML written in posts being
+# escaped
+ALLOWED_TAGS = [
+    'a', 'abbr', 'b', 'blockquote', 'br', 'code', 'del', 'em', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'li', 'ol', 'p', 'pre', 's',
+    'strong', 'sub', 'sup', 'table', 'tbody', 'td', 'th', 'thead', 'tr',
+    'ul',
+]
+ALLOWED_ATTRIBUTES = {
+    'a': ['href', 'title'],
+    'abbr': ['title'],
+    'img': ['src', 'alt', 'title'],
+    'td': ['align'],
+    'th': ['align'],
+}
+ALLOWED_PROTOCOLS = ['http', 'https', 'mailto']
+
+POST_MODELS = (Question, Answer, Comment)
+
+# Number of posts rendered within a transaction by `render_posts`
+BATCH_SIZE = 500
+
+
+def render_markdown(text):
+    """Sanitized HTML of a Markdown text.
+
+    :param text: Markdown source, possibly None
+    :return: HTML string, safe to output without escaping
+    """
+    html = markdown.markdown(text or '', extensions=MARKDOWN_EXTENSIONS,
+                             output_format='html5')
+    return bleach.clean(html, tags=ALLOWED_TAGS,
+                        attributes=ALLOWED_ATTRIBUTES,
+                        protocols=ALLOWED_PROTOCOLS)
+
+
+def post_html(post):
+    """Rendered content of a post, from `content_html` unless the post was
+    saved before it existed."""
+    html = post.content_html
+    if html is None:
+        html = render_markdown(post.content)
+    return mark_safe(html)
+
+
+def render_posts(everything=False, batch_size=BATCH_SIZE):
+    """Stores the rendered content of posts.
+
+    :param everything: Render every post rather than only those without a
+                       rendered content
+    :param batch_size: Number of posts rendered within a transaction
+    :return: Number of posts rendered
+    """
+    count = 0
+    for model in POST_MODELS:
+        queryset = model.objects.order_by('pk')
+        if not everything:
+            queryset = queryset.filter(content_html__isnull=True)
+        last_pk = 0
+        while True:
+            posts = list(queryset.filter(pk__gt=last_pk)
+                         .values_list('pk', 'content')[:batch_size])
+            if not posts:
+                break
+            with transaction.atomic():
+                for pk, content in posts:
+                    # Not saved through save() so that the posts' other
+                    # denormalized data is left untouched
+                    model.objects.filter(pk=pk).update(
+                        content_html=render_markdown(content))
+            last_pk = posts[-1][0]
+            count += len(posts)
+    return count
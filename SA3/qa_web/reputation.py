@@ -0,0 +1,56 @@
+"""Reputation and activity statistics of users.
+
+UserStats rows hold the totals displayed by the profile page and the owner
+labels of threads, so that they never aggregate the posts tables. Each total
+is adjusted in the same transaction as the change it accounts for:
+    - posts created or deleted, by the receivers of qa_web.signals
+    - votes on a post, by qa_web.votes, which also changes the threads
+      displaying the reputation of the post's owner
+    - answers selected or deselected as best, by `set_best_answer`
+`manage.py repair_counters` recomputes them from the posts tables.
+"""
+from django.db import transaction
+from django.db.models import F
+from qa_web.conditional import touch_question, touch_user_threads
+from qa_web.models import Answer, UserStats
+
+
+def adjust_user_stats(user_id, **deltas):
+    """Atomically adds deltas to the statistics of a user, creating them if
+    missing.
+
+    :param user_id: Id of the user, statistics of deleted users (None) are
+                    ignored
+    :param deltas: Value added to each field of UserStats. A change of
+                   `score`, displayed next to each post of the user, is
+                   recorded as activity on the threads containing them.
+    """
+    if user_id is None:
+        return
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    if not UserStats.objects.filter(user_id=user_id).update(**updates):
+        UserStats.objects.get_or_create(user_id=user_id)
+        UserStats.objects.filter(user_id=user_id).update(**updates)
+    if deltas.get('score'):
+        touch_user_threads(user_id)
+
+
+def set_best_answer(answer, correct):
+    """Selects or deselects an answer as the best answer of its question and
+    counts it in its owner's accepted answers, in one transaction along with
+    the activity on its question.
+
+    :param answer: Answer instance, updated in place
+    :param correct: Whether the answer is selected
+    :return: Whether the answer changed
+    """
+    with transaction.atomic():
+        changed = Answer.objects \
+            .filter(pk=answer.pk, correct_answer=not correct) \
+            .update(correct_answer=correct)
+        if changed:
+            adjust_user_stats(answer.owner_id,
+                              num_accepted=1 if correct else -1)
+            touch_question(answer.question_id)
+    answer.correct_answer = correct
+    return bool(changed)
@@ -0,0 +1,4 @@
+"""Search of questions, built on top of haystack.
+For more information on haystack:
+    https://django-haystack.readthedocs.io/en/v2.8.0/
+"""
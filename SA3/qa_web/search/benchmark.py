@@ -0,0 +1,315 @@
+"""Benchmark suite of the search.
+
+A reproducible synthetic corpus of questions, with their owners, answers and
+tags, is generated in memory at the requested size (e.g. 10k, 100k or 1M
+questions) and rendered by qa_web.search_indexes.QuestionsIndex with its
+text template, exactly like real questions are, so that changes to the index,
+the template or the backend all show in the measurements. Words are drawn
+from a fixed vocabulary following Zipf's law so that queries mix frequent
+and rare terms like real questions do.
+
+For each backend the suite measures:
+    - the time spent rendering and writing the index, in batches
+    - the size of the index on disk
+    - latency percentiles of a fixed mix of queries, overall and per kind
+    - the throughput of concurrent searchers, each in its own thread
+"""
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from django.utils import timezone
+from haystack import connections
+from haystack.query import SearchQuerySet
+from taggit.models import Tag
+from qa_web.models import Answer, Question, User
+from qa_web.search.bulk import PreparedIndex
+
+ENGINES = {
+    'whoosh': 'haystack.backends.whoosh_backend.WhooshEngine',
+    'fts5': 'qa_web.search.fts5_backend.FTS5Engine',
+}
+
+VOCABULARY_SIZE = 20000
+NUM_TAGS = 500
+
+# Number of documents written to a backend at once
+BATCH_SIZE = 1000
+
+# Number of results read per query, a page of the search view
+RESULTS_PER_PAGE = 20
+
+# Kinds of queries of the mix, each generating its share of the queries
+QUERY_KINDS = ('frequent', 'rare', 'multiple', 'phrase', 'excluding')
+
+
+def _vocabulary(rng):
+    """Pronounceable made up words, from the most frequent."""
+    syllables = [consonant + vowel for consonant in 'bcdfghjklmnprstvz'
+                 for vowel in 'aeiou']
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add(''.join(rng.choice(syllables)
+                          for _ in range(rng.randint(1, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+class CorpusGenerator:
+    """Generates questions and queries from a seeded random generator, the
+    same seed always giving the same corpus and queries."""
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.words = _vocabulary(self.rng)
+        # Zipf's law, the frequency of a word is inversely proportional to
+        # its rank
+        self.cumulative_weights = []
+        total = 0
+        for rank in range(1, len(self.words) + 1):
+            total += 1 / rank
+            self.cumulative_weights.append(total)
+        self.tags = [Tag(pk=pk, name=word, slug=word) for pk, word in
+                     enumerate(self.words[:NUM_TAGS], start=1)]
+
+    def sentence(self, min_words, max_words):
+        return ' '.join(self.rng.choices(
+            self.words, cum_weights=self.cumulative_weights,
+            k=self.rng.randint(min_words, max_words)))
+
+    def questions(self, size):
+        """Generates questions which are never saved, their answers and tags
+        being set as if prefetched.
+
+        :param size: Number of questions
+        :return: Iterator of Question instances
+        """
+        start = timezone.now() - timedelta(days=365)
+        owners = [User(pk=pk, username='user{}'.format(pk))
+                  for pk in range(1, max(size // 20, 1) + 1)]
+        for pk in range(1, size + 1):
+            question = Question(
+                pk=pk, title=self.sentence(4, 12),
+                content=self.sentence(20, 120), owner=self.rng.choice(owners),
+                creation_date=start + timedelta(seconds=pk * 30))
+            question._prefetched_objects_cache = {
+                'answer': [Answer(content=self.sentence(10, 80),
+                                  question=question)
+                           for _ in range(self.rng.randint(0, 4))],
+                'tag': self.rng.sample(self.tags, self.rng.randint(1, 5)),
+            }
+            yield question
+
+    def queries(self, count):
+        """Generates the fixed mix of queries, each kind in turn.
+
+        :param count: Number of queries
+        :return: List of tuples of the kind and the query string
+        """
+        rng = random.Random(self.seed)
+        frequent = self.words[:100]
+        rare = self.words[len(self.words) // 2:]
+        queries = []
+        for i in range(count):
+            kind = QUERY_KINDS[i % len(QUERY_KINDS)]
+            if kind == 'frequent':
+                query = rng.choice(frequent)
+            elif kind == 'rare':
+                query = rng.choice(rare)
+            elif kind == 'multiple':
+                query = ' '.join(rng.sample(frequent, 2) +
+                                 [rng.choice(self.words[:2000])])
+            elif kind == 'phrase':
+                query = '"{} {}"'.format(*rng.sample(frequent, 2))
+            else:
+                query = '{} -{}'.format(*rng.sample(frequent, 2))
+            queries.append((kind, query))
+        return queries
+
+
+@contextmanager
+def temporary_backend(name):
+    """Registers a haystack connection to an empty index of a backend.
+
+    :param name: Key of `ENGINES`
+    :return: Context manager giving the alias of the connection and the
+             directory holding the index
+    """
+    directory = tempfile.mkdtemp()
+    alias = 'benchmark_' + name
+    connections.connections_info[alias] = {
+        'ENGINE': ENGINES[name],
+        'PATH': os.path.join(directory, 'index'),
+    }
+    try:
+        yield alias, directory
+    finally:
+        del connections.connections_info[alias]
+        getattr(connections.thread_local, 'connections', {}).pop(alias, None)
+        shutil.rmtree(directory)
+
+
+def directory_size(directory):
+    """Total size in bytes of the files in a directory."""
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(directory) for name in names)
+
+
+def build_index(alias, questions, batch_size=BATCH_SIZE):
+    """Renders questions and writes them to a backend, one write per batch.
+
+    :return: Tuple of the number of documents written, the seconds spent
+             rendering them and the seconds spent writing them
+    """
+    index = connections[alias].get_unified_index().get_index(Question)
+    prepared_index = PreparedIndex(index)
+    backend = connections[alias].get_backend()
+    num_documents = 0
+    render_seconds = write_seconds = 0
+
+    def write(batch):
+        start = time.perf_counter()
+        backend.update(prepared_index, batch)
+        return time.perf_counter() - start
+
+    batch = []
+    for question in questions:
+        start = time.perf_counter()
+        batch.append(dict(index.full_prepare(question)))
+        render_seconds += time.perf_counter() - start
+        if len(batch) == batch_size:
+            write_seconds += write(batch)
+            num_documents += len(batch)
+            batch = []
+    if batch:
+        write_seconds += write(batch)
+        num_documents += len(batch)
+    return num_documents, render_seconds, write_seconds
+
+
+def run_query(alias, query):
+    """Searches like the search view does, reading the first page of
+    results and the number of results."""
+    results = SearchQuerySet(using=alias).models(Question).auto_query(query)
+    list(results[:RESULTS_PER_PAGE])
+    return results.count()
+
+
+def percentile(sorted_values, fraction):
+    """Value below which a fraction of the sorted values fall."""
+    if not sorted_values:
+        return 0
+    return sorted_values[min(int(len(sorted_values) * fraction),
+                             len(sorted_values) - 1)]
+
+
+def latency_summary(latencies):
+    """Mean and percentiles of latencies, in milliseconds."""
+    latencies = sorted(latencies)
+    return {
+        'count': len(latencies),
+        'mean_ms': sum(latencies) / len(latencies) * 1000
+        if latencies else 0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0,
+    }
+
+
+def measure_latency(alias, queries):
+    """Runs queries one after the other.
+
+    :param queries: List of tuples of the kind and the query string
+    :return: Dictionary of the latency summary of all queries and of each
+             kind of query
+    """
+    latencies = {kind: [] for kind in QUERY_KINDS}
+    for kind, query in queries:
+        start = time.perf_counter()
+        run_query(alias, query)
+        latencies[kind].append(time.perf_counter() - start)
+    summary = latency_summary(
+        [latency for values in latencies.values() for latency in values])
+    summary['by_kind'] = {kind: latency_summary(values)
+                          for kind, values in latencies.items() if values}
+    return summary
+
+
+def measure_throughput(alias, queries, concurrency):
+    """Runs queries from concurrent searchers, each in its own thread and
+    with its own connection to the backend.
+
+    :param queries: List of tuples of the kind and the query string, each
+                    searcher running all of them
+    :param concurrency: Number of searchers
+    :return: Dictionary of the number of queries and queries per second
+    """
+    errors = []
+
+    def searcher():
+        try:
+            for _, query in queries:
+                run_query(alias, query)
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    threads = [threading.Thread(target=searcher) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    num_queries = len(queries) * concurrency
+    return {
+        'searchers': concurrency,
+        'queries': num_queries,
+        'seconds': seconds,
+        'queries_per_second': num_queries / seconds if seconds else 0,
+    }
+
+
+def benchmark_backend(name, size, num_queries, concurrency=4, seed=0):
+    """Indexes a corpus in a backend then measures queries against it.
+
+    :param name: Key of `ENGINES`
+    :param size: Number of questions
+    :param num_queries: Number of queries of the mix
+    :param concurrency: Number of concurrent searchers, 0 to skip measuring
+                        the throughput
+    :param seed: Seed of the generated corpus and queries
+    :return: Dictionary of measurements, ready to be written as JSON
+    """
+    generator = CorpusGenerator(seed)
+    queries = generator.queries(num_queries)
+    with temporary_backend(name) as (alias, directory):
+        num_documents, render_seconds, write_seconds = build_index(
+            alias, generator.questions(size))
+        index_bytes = directory_size(directory)
+        latency = measure_latency(alias, queries)
+        throughput = measure_throughput(alias, queries, concurrency) \
+            if concurrency else None
+    build_seconds = render_seconds + write_seconds
+    return {
+        'backend': name,
+        'size': size,
+        'seed': seed,
+        'build': {
+            'documents': num_documents,
+            'render_seconds': render_seconds,
+            'write_seconds': write_seconds,
+            'seconds': build_seconds,
+            'docs_per_second': num_documents / build_seconds
+            if build_seconds else 0,
+        },
+        'index_bytes': index_bytes,
+        'latency': latency,
+        'throughput': throughput,
+    }
@@ -0,0 +1,152 @@
+"""Parallel rebuild of the search index.
+
+Questions are split in chunks of consecutive primary keys. Each chunk is
+loaded with its owners and answers in a fixed number of queries and rendered
+to documents by a pool of worker processes, while the main process writes
+the rendered chunks to the index in order, one backend write per chunk. The
+primary key of the last written chunk is saved to a checkpoint file so that
+an interrupted rebuild can resume where it stopped.
+"""
+import json
+import multiprocessing
+import os
+import time
+from functools import partial
+from django import db
+from haystack import connections
+from haystack.constants import DEFAULT_ALIAS
+from haystack.exceptions import SkipDocument
+from qa_web.models import Question
+from qa_web.search.cache import bump_generation
+
+CHUNK_SIZE = 500
+
+
+class PreparedIndex:
+    """Proxy of a search index whose `full_prepare` receives documents which
+    were already rendered, allowing them to be written by the backend's
+    `update`."""
+
+    def __init__(self, index):
+        self._index = index
+
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+    def full_prepare(self, document):
+        return dict(document)
+
+
+def _get_index(using):
+    return connections[using].get_unified_index().get_index(Question)
+
+
+def chunk_bounds(after=None, chunk_size=CHUNK_SIZE, using=DEFAULT_ALIAS):
+    """Splits the indexed questions in chunks of consecutive primary keys.
+
+    :param after: Only questions with a greater primary key are included
+    :param chunk_size: Maximum number of questions per chunk
+    :return: List of tuples of the first and last primary keys of each chunk
+    """
+    pks = _get_index(using).index_queryset(using=using).order_by('pk')
+    if after is not None:
+        pks = pks.filter(pk__gt=after)
+    bounds = []
+    chunk = []
+    for pk in pks.values_list('pk', flat=True).iterator():
+        chunk.append(pk)
+        if len(chunk) == chunk_size:
+            bounds.append((chunk[0], chunk[-1]))
+            chunk = []
+    if chunk:
+        bounds.append((chunk[0], chunk[-1]))
+    return bounds
+
+
+def render_chunk(bounds, using=DEFAULT_ALIAS):
+    """Renders the documents of a chunk of questions.
+
+    :param bounds: Tuple of the first and last primary keys of the chunk
+    :return: Tuple of the last primary key and the list of documents
+    """
+    index = _get_index(using)
+    first, last = bounds
+    documents = []
+    for question in index.index_queryset(using=using) \
+            .filter(pk__gte=first, pk__lte=last).order_by('pk'):
+        try:
+            documents.append(dict(index.full_prepare(question)))
+        except SkipDocument:
+            pass
+    return last, documents
+
+
+def read_checkpoint(path):
+    """Primary key of the last question written by an interrupted rebuild,
+    None if there is none."""
+    try:
+        with open(path) as checkpoint:
+            return json.load(checkpoint)['last_pk']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_checkpoint(path, last_pk):
+    """Atomically saves the primary key of the last question written."""
+    with open(path + '.tmp', 'w') as checkpoint:
+        json.dump({'last_pk': last_pk}, checkpoint)
+    os.replace(path + '.tmp', path)
+
+
+def bulk_index(checkpoint, resume=False, chunk_size=CHUNK_SIZE, workers=None,
+               using=DEFAULT_ALIAS, progress=None):
+    """Writes every indexed question to the index.
+
+    :param checkpoint: Path of the checkpoint file
+    :param resume: Whether to start after the checkpoint rather than clearing
+                   the index
+    :param chunk_size: Number of questions rendered and written at once
+    :param workers: Number of rendering processes, rendering happens in the
+                    current process if 1, defaults to the number of CPUs
+    :param progress: Called with the number of documents written and the
+                     elapsed seconds after each chunk
+    :return: Tuple of the number of documents written and the elapsed seconds
+    """
+    index = _get_index(using)
+    backend = index.get_backend(using)
+    after = read_checkpoint(checkpoint) if resume else None
+    if after is None:
+        backend.clear(models=[Question])
+        bump_generation()
+    bounds = chunk_bounds(after, chunk_size, using)
+
+    workers = workers or multiprocessing.cpu_count()
+    pool = None
+    if workers > 1 and len(bounds) > 1:
+        # Forked workers open their own database connections
+        db.connections.close_all()
+        pool = multiprocessing.get_context('fork').Pool(workers)
+        chunks = pool.imap(partial(render_chunk, using=using), bounds)
+    else:
+        chunks = (render_chunk(chunk, using) for chunk in bounds)
+
+    prepared_index = PreparedIndex(index)
+    num_documents = 0
+    start = time.monotonic()
+    try:
+        # Chunks are received in order, so every question up to the last
+        # written one is in the index
+        for last_pk, documents in chunks:
+            if documents:
+                backend.update(prepared_index, documents)
+                bump_generation()
+            write_checkpoint(checkpoint, last_pk)
+            num_documents += len(documents)
+            if progress is not None:
+                progress(num_documents, time.monotonic() - start)
+    finally:
+        if pool is not None:
+            pool.terminate()
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return num_documents, time.monotonic() - start
@@ -0,0 +1,142 @@
+"""Cache of search results.
+
+Each process keeps the primary keys of the results of recent searches, keyed
+by normalized query and page, in a bounded LRU cache. Every process writing
+to the index increments a generation counter stored in the database once it
+commits; a cache seeing a new generation discards all of its entries, so
+results are never older than the index.
+
+The in-memory indexes of questions of qa_web.search.suggest and
+qa_web.duplicates follow the counter of QuestionIndexGeneration instead:
+each committed change of a question increments it and is recorded as a
+QuestionChange, while the counter's row is locked so that changes are
+recorded in order of generation. Every `QUESTION_INDEX_SYNC_INTERVAL`
+seconds at most, an index applies the changes recorded since its own
+generation by reading only the questions concerned. The last
+`QUESTION_CHANGES_KEPT` changes are kept, an index further behind is loaded
+again.
+"""
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from qa_web.models import (QuestionChange, QuestionIndexGeneration,
+                           SearchIndexGeneration)
+
+# Number of changes of questions kept for the in-memory indexes
+QUESTION_CHANGES_KEPT = 10000
+
+
+def current_generation(model=SearchIndexGeneration):
+    """Generation of the search index, 0 before it is first written to.
+
+    :param model: Model of the counter, e.g. QuestionIndexGeneration
+    """
+    generation = model.objects.values_list('generation', flat=True).first()
+    return generation or 0
+
+
+def bump_generation(model=SearchIndexGeneration):
+    """Records that the search index was written to, invalidating the cached
+    results of every process.
+
+    :param model: Model of the counter, e.g. QuestionIndexGeneration
+    :return: New generation, read back while the row is locked, so that it
+             is the previous generation plus one only when no other process
+             wrote in between
+    """
+    with transaction.atomic():
+        if not model.objects.update(generation=F('generation') + 1):
+            model.objects.create(generation=1)
+        return current_generation(model)
+
+
+def record_question_change(question_id):
+    """Records that a question was saved or deleted, for the in-memory
+    indexes of questions of every process. Called once the change is
+    committed.
+
+    :return: Generation of the change
+    """
+    with transaction.atomic():
+        generation = bump_generation(QuestionIndexGeneration)
+        QuestionChange.objects.create(generation=generation,
+                                      question_id=question_id)
+        QuestionChange.objects.filter(
+            generation__lte=generation - QUESTION_CHANGES_KEPT).delete()
+    return generation
+
+
+def question_changes(generation, questions):
+    """Questions changed after a generation of QuestionIndexGeneration.
+
+    :param generation: Generation reflected by an index
+    :param questions: Queryset of questions, or of a model whose primary
+                      key is a question's, narrowed down to the changed
+                      ones still existing
+    :return: Tuple of the latest generation, the set of ids of the changed
+             questions and the narrowed queryset. None when some of the
+             changes are no longer kept, the index having to be loaded
+             again.
+    """
+    changes = list(QuestionChange.objects.filter(generation__gt=generation)
+                   .order_by('generation')
+                   .values_list('generation', 'question_id'))
+    if not changes:
+        return generation, set(), questions.none()
+    if changes[0][0] != generation + 1:
+        return None
+    return changes[-1][0], {question_id for _, question_id in changes}, \
+        questions.filter(pk__in=QuestionChange.objects.filter(
+            generation__gt=generation, generation__lte=changes[-1][0])
+            .values('question_id'))
+
+
+def normalize_query(query):
+    """Query string stripped of case and repeated whitespace, so that
+    equivalent queries share the same cached results."""
+    return ' '.join(query.lower().split())
+
+
+class ResultCache:
+    """Thread-safe LRU cache of search results for a single index
+    generation."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = None
+
+    def _check_generation(self, generation):
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get(self, key, generation):
+        """Cached value of a key, None if missing or cached for another
+        generation of the index."""
+        with self._lock:
+            self._check_generation(generation)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation):
+        """Caches a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._check_generation(generation)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Discards every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+result_cache = ResultCache(settings.SEARCH_RESULT_CACHE_SIZE)
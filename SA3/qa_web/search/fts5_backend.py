@@ -0,0 +1,445 @@
+"""Haystack backend storing documents in a SQLite FTS5 table.
+
+Text fields of the search indexes (`CharField`s, including the document
+field) are columns of an FTS5 virtual table ranked with BM25. Other fields,
+e.g. dates, are columns of a regular table sharing the same rowids and can be
+filtered with `gt`, `gte`, `lt`, `lte` and `range` as well as sorted on.
+Queries are translated to the FTS5 query syntax, filters on dates always
+narrow the whole query whatever the connector they were combined with.
+
+Enable it with::
+
+    HAYSTACK_CONNECTIONS = {
+        'default': {
+            'ENGINE': 'qa_web.search.fts5_backend.FTS5Engine',
+            'PATH': os.path.join(BASE_DIR, 'search.sqlite3'),
+        },
+    }
+
+The tables are recreated, empty, whenever the fields of the indexes change.
+For more information on FTS5:
+    https://www.sqlite.org/fts5.html
+"""
+import logging
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from django.utils.encoding import force_text
+from haystack import connections
+from haystack.backends import (BaseEngine, BaseSearchBackend,
+                               BaseSearchQuery, SearchNode, log_query)
+from haystack.constants import DJANGO_CT, DJANGO_ID, ID
+from haystack.exceptions import SearchBackendError, SkipDocument
+from haystack.inputs import Clean, PythonData
+from haystack.models import SearchResult
+from haystack.utils import get_identifier, get_model_ct
+from haystack.utils.app_loading import haystack_get_model
+
+# Types of the haystack fields stored in the FTS5 table
+TEXT_FIELD_TYPES = ('string', 'edge_ngram', 'ngram')
+
+# Fixed width format so that dates compare as strings
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+RANGE_OPERATORS = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+# Words having a meaning in FTS5 queries
+RESERVED_WORDS = ('AND', 'OR', 'NOT', 'NEAR')
+
+# Maximum number of tokens in a highlighted snippet
+SNIPPET_TOKENS = 32
+
+
+def _quote(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+class FTS5SearchBackend(BaseSearchBackend):
+    """Backend reading and writing documents in a SQLite database."""
+
+    def __init__(self, connection_alias, **connection_options):
+        super(FTS5SearchBackend, self).__init__(connection_alias,
+                                                **connection_options)
+        if not connection_options.get('PATH'):
+            raise ImproperlyConfigured(
+                "You must specify a 'PATH' in your settings for connection "
+                "'{}'.".format(connection_alias))
+        self.path = connection_options['PATH']
+        self.setup_complete = False
+        self.content_field_name = None
+        self.text_fields = []
+        self.value_fields = {}
+        self._local = threading.local()
+        self.log = logging.getLogger('haystack')
+
+    @property
+    def connection(self):
+        """Connection to the database, one per thread."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path)
+            # Readers are not blocked by the writer
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    def setup(self):
+        """Creates the tables, or recreates them if the fields changed."""
+        unified_index = connections[self.connection_alias] \
+            .get_unified_index()
+        fields = unified_index.all_searchfields()
+        self.content_field_name = unified_index.document_field
+        self.text_fields = sorted(
+            name for name, field in fields.items()
+            if field.field_type in TEXT_FIELD_TYPES)
+        self.value_fields = {
+            name: field.field_type for name, field in fields.items()
+            if field.field_type not in TEXT_FIELD_TYPES}
+
+        columns = ['rowid', ID, DJANGO_CT, DJANGO_ID] + \
+            sorted(self.value_fields)
+        existing = [row[1] for row in self.connection.execute(
+            'PRAGMA table_info(documents)')]
+        fts_existing = [row[1] for row in self.connection.execute(
+            'PRAGMA table_info(documents_fts)')]
+        with self.connection:
+            if existing != columns or fts_existing != self.text_fields:
+                self.connection.execute('DROP TABLE IF EXISTS documents')
+                self.connection.execute('DROP TABLE IF EXISTS documents_fts')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS documents (rowid INTEGER PRIMARY '
+                'KEY, {} TEXT UNIQUE NOT NULL, {} TEXT NOT NULL, {} TEXT NOT '
+                'NULL{})'.format(
+                    _quote(ID), _quote(DJANGO_CT), _quote(DJANGO_ID),
+                    ''.join(', ' + _quote(name)
+                            for name in sorted(self.value_fields))))
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS documents_django_ct ON documents '
+                '({})'.format(_quote(DJANGO_CT)))
+            self.connection.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING '
+                "fts5({}, tokenize='porter unicode61')".format(
+                    ', '.join(_quote(name) for name in self.text_fields)))
+        self.setup_complete = True
+
+    def _delete(self, identifier):
+        rowid = self.connection.execute(
+            'SELECT rowid FROM documents WHERE {} = ?'.format(_quote(ID)),
+            (identifier,)).fetchone()
+        if rowid is not None:
+            self.connection.execute(
+                'DELETE FROM documents_fts WHERE rowid = ?', rowid)
+            self.connection.execute(
+                'DELETE FROM documents WHERE rowid = ?', rowid)
+
+    def update(self, index, iterable, commit=True):
+        if not self.setup_complete:
+            self.setup()
+        value_names = sorted(self.value_fields)
+        insert_document = 'INSERT INTO documents ({}) VALUES ({})'.format(
+            ', '.join(_quote(name) for name in
+                      [ID, DJANGO_CT, DJANGO_ID] + value_names),
+            ', '.join('?' * (len(value_names) + 3)))
+        insert_text = 'INSERT INTO documents_fts (rowid, {}) VALUES ({})' \
+            .format(', '.join(_quote(name) for name in self.text_fields),
+                    ', '.join('?' * (len(self.text_fields) + 1)))
+
+        # A single transaction for the whole batch
+        with self.connection:
+            for obj in iterable:
+                try:
+                    doc = index.full_prepare(obj)
+                except SkipDocument:
+                    self.log.debug('Indexing for object `%s` skipped', obj)
+                    continue
+                try:
+                    self._delete(doc[ID])
+                    cursor = self.connection.execute(insert_document, [
+                        doc[ID], doc[DJANGO_CT], doc[DJANGO_ID]] + [
+                            self._from_python(doc.get(name))
+                            for name in value_names])
+                    self.connection.execute(insert_text, [
+                        cursor.lastrowid] + [
+                            force_text(self._from_python(doc.get(name)) or '')
+                            for name in self.text_fields])
+                except sqlite3.Error:
+                    if not self.silently_fail:
+                        raise
+                    self.log.error('Error while preparing object for update',
+                                   exc_info=True,
+                                   extra={'data': {'index': index,
+                                                   'object': doc[ID]}})
+
+    def remove(self, obj_or_string, commit=True):
+        if not self.setup_complete:
+            self.setup()
+        with self.connection:
+            self._delete(get_identifier(obj_or_string))
+
+    def clear(self, models=None, commit=True):
+        if not self.setup_complete:
+            self.setup()
+        with self.connection:
+            if not models:
+                self.connection.execute('DELETE FROM documents_fts')
+                self.connection.execute('DELETE FROM documents')
+                return
+            for model in models:
+                self.connection.execute(
+                    'DELETE FROM documents_fts WHERE rowid IN (SELECT rowid '
+                    'FROM documents WHERE {} = ?)'.format(_quote(DJANGO_CT)),
+                    (get_model_ct(model),))
+                self.connection.execute(
+                    'DELETE FROM documents WHERE {} = ?'.format(
+                        _quote(DJANGO_CT)), (get_model_ct(model),))
+
+    @log_query
+    def search(self, query_string, sort_by=None, start_offset=0,
+               end_offset=None, highlight=False, models=None,
+               limit_to_registered_models=None, result_class=None,
+               range_filters=(), **kwargs):
+        if not self.setup_complete:
+            self.setup()
+        if not query_string:
+            return {'results': [], 'hits': 0}
+
+        if limit_to_registered_models is None:
+            limit_to_registered_models = getattr(
+                settings, 'HAYSTACK_LIMIT_TO_REGISTERED_MODELS', True)
+        if models:
+            model_choices = sorted(get_model_ct(model) for model in models)
+        elif limit_to_registered_models:
+            model_choices = self.build_models_list()
+        else:
+            model_choices = []
+
+        match = query_string != '*'
+        where = []
+        params = []
+        if match:
+            where.append('documents_fts MATCH ?')
+            params.append(query_string)
+        if model_choices:
+            where.append('d.{} IN ({})'.format(
+                _quote(DJANGO_CT), ', '.join('?' * len(model_choices))))
+            params.extend(model_choices)
+        for field, operator, value in range_filters:
+            if field not in self.value_fields:
+                raise SearchBackendError(
+                    "'{}' is not a date or number field.".format(field))
+            where.append('d.{} {} ?'.format(_quote(field), operator))
+            params.append(self._from_python(value))
+        # CROSS JOIN makes SQLite run the full text query first
+        sql_from = 'FROM documents_fts CROSS JOIN documents d ' \
+            'ON d.rowid = documents_fts.rowid' + \
+            (' WHERE ' + ' AND '.join(where) if where else '')
+
+        order_by = []
+        for field in sort_by or ():
+            name = field.lstrip('-')
+            if name not in self.value_fields and name not in self.text_fields:
+                raise SearchBackendError(
+                    "Cannot sort on unknown field '{}'.".format(name))
+            order_by.append('{} {}'.format(
+                _quote(name), 'DESC' if field.startswith('-') else 'ASC'))
+        order_by.append('rank' if match else 'd.rowid')
+
+        value_names = sorted(self.value_fields)
+        columns = ['d.' + _quote(DJANGO_CT), 'd.' + _quote(DJANGO_ID),
+                   'bm25(documents_fts)' if match else '0'] + \
+            ['d.' + _quote(name) for name in value_names] + \
+            ['documents_fts.' + _quote(name) for name in self.text_fields]
+        if highlight and match:
+            columns.append("snippet(documents_fts, {}, '<em>', '</em>', "
+                           "'...', {})".format(
+                               self.text_fields.index(self.content_field_name),
+                               SNIPPET_TOKENS))
+        limit = -1 if end_offset is None else end_offset - start_offset
+
+        try:
+            hits = self.connection.execute(
+                'SELECT COUNT(*) ' + sql_from, params).fetchone()[0]
+            rows = self.connection.execute(
+                'SELECT {} {} ORDER BY {} LIMIT ? OFFSET ?'.format(
+                    ', '.join(columns), sql_from, ', '.join(order_by)),
+                params + [limit, start_offset]).fetchall()
+        except sqlite3.OperationalError:
+            # Queries which are not valid FTS5 queries, e.g. only negated
+            if not self.silently_fail:
+                raise
+            self.log.error('Failed to query FTS5 with: %s', query_string,
+                           exc_info=True)
+            return {'results': [], 'hits': 0}
+
+        result_class = result_class or SearchResult
+        indexed_models = connections[self.connection_alias] \
+            .get_unified_index().get_indexed_models()
+        results = []
+        for row in rows:
+            app_label, model_name = row[0].split('.')
+            model = haystack_get_model(app_label, model_name)
+            if model is None or model not in indexed_models:
+                hits -= 1
+                continue
+            values = iter(row[3:])
+            fields = {name: self._to_python(self.value_fields[name],
+                                            next(values))
+                      for name in value_names}
+            fields.update((name, next(values)) for name in self.text_fields)
+            if highlight and match:
+                fields['highlighted'] = {self.content_field_name:
+                                         [next(values)]}
+            # BM25 scores are lower for better matches
+            results.append(result_class(app_label, model_name, row[1],
+                                        -row[2], **fields))
+        return {'results': results, 'hits': hits,
+                'spelling_suggestion': None}
+
+    def _from_python(self, value):
+        """Converts a value to be stored in SQLite."""
+        if isinstance(value, datetime):
+            if timezone.is_aware(value):
+                value = timezone.make_naive(value, timezone.utc)
+            return value.strftime(DATETIME_FORMAT)
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, (list, tuple, set)):
+            return ' '.join(force_text(item) for item in value)
+        return value
+
+    def _to_python(self, field_type, value):
+        """Converts a stored value back to the type of its field."""
+        if value is None:
+            return None
+        if field_type == 'datetime':
+            value = datetime.strptime(value, DATETIME_FORMAT)
+            return timezone.make_aware(value, timezone.utc) \
+                if settings.USE_TZ else value
+        if field_type == 'date':
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        if field_type == 'boolean':
+            return bool(value)
+        return value
+
+
+class FTS5SearchQuery(BaseSearchQuery):
+    """Translates haystack queries to FTS5 queries, collecting filters on
+    date and number fields in `range_filters`."""
+
+    def __init__(self, using='default'):
+        super(FTS5SearchQuery, self).__init__(using=using)
+        self.range_filters = []
+
+    def clean(self, query_fragment):
+        """Keeps only the words of the fragment, FTS5 operators being
+        lowercased to be searched as words."""
+        if not isinstance(query_fragment, str):
+            return query_fragment
+        return ' '.join(word.lower() if word in RESERVED_WORDS else word
+                        for word in re.findall(r'\w+', query_fragment))
+
+    def build_exact_query(self, query_string):
+        return '"{}"'.format(query_string.replace('"', '""'))
+
+    def build_params(self, spelling_query=None):
+        params = super(FTS5SearchQuery, self).build_params(spelling_query)
+        params['range_filters'] = self.range_filters
+        return params
+
+    def build_query(self):
+        self.range_filters = []
+        query, negated = self._build_node(self.query_filter)
+        if negated:
+            # Left to FTS5 to reject, it has no query matching everything
+            return 'NOT {}'.format(query)
+        return query or self.matching_all_fragment()
+
+    def _build_node(self, node):
+        """FTS5 query of a node of the query tree.
+        FTS5's NOT being a binary operator, negated children are subtracted
+        from the others, a node only made of negated children is returned as
+        the negation of the union of their queries.
+
+        :return: Tuple of the query and whether it is negated
+        """
+        positive = []
+        negated = []
+        for child in node.children:
+            if isinstance(child, SearchNode):
+                query, is_negated = self._build_node(child)
+            else:
+                expression, value = child
+                field, filter_type = node.split_expression(expression)
+                query = self.build_query_fragment(field, filter_type, value)
+                is_negated = False
+            if query:
+                (negated if is_negated else positive).append(query)
+
+        if not negated:
+            query = ' {} '.format(node.connector).join(positive)
+            is_negated = node.negated
+        elif not positive:
+            # NOT a AND NOT b == NOT (a OR b), NOT a OR NOT b == NOT (a AND b)
+            query = (' OR ' if node.connector == SearchNode.AND
+                     else ' AND ').join(negated)
+            is_negated = not node.negated
+        elif node.connector == SearchNode.AND:
+            query = ' NOT '.join([' AND '.join(positive)] + negated)
+            is_negated = node.negated
+        else:
+            raise SearchBackendError(
+                'FTS5 cannot match documents not matching a query.')
+        if len(positive) + len(negated) > 1:
+            query = '({})'.format(query)
+        return query, is_negated
+
+    def build_query_fragment(self, field, filter_type, value):
+        if filter_type in RANGE_OPERATORS:
+            self.range_filters.append(
+                (field, RANGE_OPERATORS[filter_type], value))
+            return ''
+        if filter_type == 'range':
+            self.range_filters.append((field, '>=', value[0]))
+            self.range_filters.append((field, '<=', value[1]))
+            return ''
+
+        if not hasattr(value, 'input_type_name'):
+            if hasattr(value, 'values_list'):
+                value = list(value)
+            value = Clean(value) if isinstance(value, str) \
+                else PythonData(value)
+        prepared = value.prepare(self)
+
+        if filter_type == 'in':
+            query = ' OR '.join(self.build_exact_query(force_text(item))
+                                for item in prepared)
+        else:
+            if not isinstance(prepared, str):
+                prepared = self.clean(force_text(
+                    self.backend._from_python(prepared)))
+            if filter_type == 'exact' and value.input_type_name != 'exact':
+                query = self.build_exact_query(prepared)
+            elif filter_type == 'startswith' and prepared:
+                query = prepared + '*'
+            else:
+                query = prepared
+        if not query.strip():
+            return ''
+
+        if not self.backend.setup_complete:
+            self.backend.setup()
+        column = self.backend.content_field_name if field == 'content' \
+            else field
+        if column not in self.backend.text_fields:
+            raise SearchBackendError(
+                "'{}' is not a text field.".format(field))
+        return '{{{}}} : ({})'.format(column, query)
+
+
+class FTS5Engine(BaseEngine):
+    backend = FTS5SearchBackend
+    query = FTS5SearchQuery
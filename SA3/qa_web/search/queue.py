@@ -0,0 +1,98 @@
+"""Durable queue of questions waiting to be reindexed.
+
+Rendering a question and writing it to the search index takes a lock on the
+index, doing it inside requests serializes them under write load. Changed
+questions are instead recorded in the `SearchQueueEntry` table, committed or
+rolled back along with the change itself, and a worker process
+(`manage.py process_search_queue`) reindexes them in batches. Questions
+queued several times before the worker reaches them are only indexed once.
+"""
+from django.db.models import Max
+from django.utils import timezone
+from haystack import connection_router, connections
+from qa_web.models import Question, SearchQueueEntry
+from qa_web.search.cache import bump_generation
+
+# Number of queue entries read at once by the worker
+BATCH_SIZE = 100
+
+
+def enqueue(*question_ids):
+    """Records that questions need to be reindexed.
+
+    :param question_ids: Ids of the questions which changed or were deleted
+    """
+    SearchQueueEntry.objects.bulk_create(
+        [SearchQueueEntry(question_id=question_id)
+         for question_id in question_ids if question_id is not None])
+
+
+def queue_lag():
+    """State of the queue, as an indication of how far the index lags
+    behind the database.
+
+    :return: Tuple of the number of entries, the number of distinct questions
+             and the age in seconds of the oldest entry, 0 if empty
+    """
+    entries = SearchQueueEntry.objects.all()
+    num_entries = entries.count()
+    if not num_entries:
+        return 0, 0, 0
+    num_questions = entries.values('question_id').distinct().count()
+    oldest = entries.order_by('id').values_list('queued_at', flat=True)[0]
+    return num_entries, num_questions, \
+        (timezone.now() - oldest).total_seconds()
+
+
+def reindex(question_ids):
+    """Writes the current state of questions to the search index.
+    Existing questions are updated in one write per backend, the others are
+    removed from the index.
+
+    :param question_ids: Collection of question ids
+    """
+    for using in connection_router.for_write(models=[Question]):
+        index = connections[using].get_unified_index().get_index(Question)
+        backend = index.get_backend(using)
+        questions = list(index.index_queryset(using=using)
+                         .filter(pk__in=question_ids))
+        if questions:
+            backend.update(index, questions)
+        for question_id in set(question_ids) - {q.pk for q in questions}:
+            backend.remove('qa_web.question.{}'.format(question_id))
+    bump_generation()
+
+
+def process_batch(batch_size=BATCH_SIZE):
+    """Reindexes the questions of the oldest entries of the queue.
+    Every entry of these questions queued before they are read is consumed,
+    including entries beyond the batch.
+
+    :param batch_size: Maximum number of entries read
+    :return: Number of questions reindexed, 0 once the queue is empty
+    """
+    batch = list(SearchQueueEntry.objects.order_by('id')
+                 .values_list('id', 'question_id')[:batch_size])
+    if not batch:
+        return 0
+    question_ids = {question_id for _, question_id in batch}
+    # Entries up to this one are covered by reading the questions afterwards
+    last_id = SearchQueueEntry.objects.aggregate(last_id=Max('id'))['last_id']
+    reindex(question_ids)
+    SearchQueueEntry.objects.filter(id__lte=batch[-1][0]).delete()
+    SearchQueueEntry.objects.filter(question_id__in=question_ids,
+                                    id__lte=last_id).delete()
+    return len(question_ids)
+
+
+def drain_queue(batch_size=BATCH_SIZE):
+    """Processes batches until the queue is empty.
+
+    :return: Number of questions reindexed
+    """
+    total = 0
+    num_questions = process_batch(batch_size)
+    while num_questions:
+        total += num_questions
+        num_questions = process_batch(batch_size)
+    return total
@@ -0,0 +1,74 @@
+"""Haystack signal processor queuing changed questions, see
+qa_web.search.queue.
+
+Only changes to the data rendered in the index cause a question to be queued.
+The indexed fields of questions and answers are recorded when instances are
+loaded and compared when they are saved, so that e.g. selecting a best answer
+or editing a question without changing it does not reindex anything. As the
+index holds the content of answers, the question of an answer which is
+created, edited or deleted is queued.
+"""
+from django.db.models.signals import post_delete, post_init, post_save
+from haystack.signals import BaseSignalProcessor
+from qa_web.models import Answer, Question
+from qa_web.search.queue import enqueue
+
+# Fields of each model on which the documents of the index depend, see
+# qa_web.search_indexes.QuestionsIndex and its text template
+INDEXED_FIELDS = {
+    Question: ('title', 'content', 'owner_id', 'creation_date'),
+    Answer: ('content', 'question_id'),
+}
+
+# Placeholder for fields which were not loaded
+_DEFERRED = object()
+
+
+def _indexed_state(instance):
+    """Values of the indexed fields of an instance, read without loading
+    deferred fields."""
+    return tuple(instance.__dict__.get(field, _DEFERRED)
+                 for field in INDEXED_FIELDS[type(instance)])
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """Queues questions whose indexed data changed to be reindexed by the
+    search queue worker instead of updating the index within the request."""
+
+    def setup(self):
+        for model in INDEXED_FIELDS:
+            post_init.connect(self.handle_init, sender=model)
+            post_save.connect(self.handle_save, sender=model)
+            post_delete.connect(self.handle_delete, sender=model)
+
+    def teardown(self):
+        for model in INDEXED_FIELDS:
+            post_init.disconnect(self.handle_init, sender=model)
+            post_save.disconnect(self.handle_save, sender=model)
+            post_delete.disconnect(self.handle_delete, sender=model)
+
+    def handle_init(self, sender, instance, **kwargs):
+        """Records the indexed state of a loaded or new instance."""
+        instance._indexed_state = _indexed_state(instance)
+
+    def handle_save(self, sender, instance, created=False, **kwargs):
+        """Queues the question of a created instance or of an instance whose
+        indexed fields changed."""
+        last_state = instance._indexed_state
+        instance._indexed_state = _indexed_state(instance)
+        if not created and last_state == instance._indexed_state:
+            return
+        if sender is Question:
+            enqueue(instance.pk)
+            return
+        question_ids = {instance.question_id}
+        last_question_id = last_state[INDEXED_FIELDS[Answer].index(
+            'question_id')]
+        if not created and last_question_id is not _DEFERRED:
+            # An answer moved to another question leaves its former question
+            question_ids.add(last_question_id)
+        enqueue(*question_ids)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        """Queues a deleted question or the question of a deleted answer."""
+        enqueue(instance.pk if sender is Question else instance.question_id)
@@ -0,0 +1,211 @@
+"""Type-ahead suggestion of question titles.
+
+Titles are held in memory in arrays sorted by lowercased title, the titles
+starting with a prefix are found with two binary searches. The index is
+loaded from the database on first use, then kept up to date by the question
+signal receivers of qa_web.signals once changes are committed. The changes
+made by other processes are applied from the titles of the changed
+questions alone, at most every `QUESTION_INDEX_SYNC_INTERVAL` seconds (see
+qa_web.search.cache), so that suggesting titles runs no query in between.
+
+A 50 characters title takes around 370 bytes: the lowercased key and the
+displayed title (both truncated to `SUGGEST_TITLE_LENGTH` characters), their
+slots in the sorted arrays and an entry of the id to key mapping. 1M titles
+would hence take about 370MB per process, so at most `SUGGEST_MAX_TITLES`
+titles are kept, the oldest questions being left out (200 000 titles, about
+75MB, by default). Looking up a prefix takes around 10 microseconds.
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from django.conf import settings
+from qa_web.models import Question, QuestionIndexGeneration
+from qa_web.search.cache import current_generation, question_changes
+
+
+class PrefixIndex:
+    """Thread-safe index of titles sorted by lowercased title, keeping the
+    titles of the most recent questions once full."""
+
+    def __init__(self, max_titles, title_length):
+        self.max_titles = max_titles
+        self.title_length = title_length
+        self._lock = threading.Lock()
+        self._keys = []
+        self._entries = []
+        # Keys by id, in the order questions were added
+        self._key_by_id = {}
+        self.loaded = False
+        # Generation of the questions reflected by the index
+        self.generation = None
+        # Monotonic time of the last load or application of changes
+        self.synced_at = None
+
+    def _entry(self, question_id, title):
+        """Lowercased key, id and displayed title of a question."""
+        title = (title or '')[:self.title_length]
+        return title.lower(), question_id, title
+
+    def load(self, titles, generation=None):
+        """Replaces the content of the index.
+
+        :param titles: Iterable of tuples of question id and title, from the
+                       oldest question
+        :param generation: Generation of the questions, read before them
+        """
+        entries = deque((self._entry(question_id, title)
+                         for question_id, title in titles),
+                        maxlen=self.max_titles)
+        key_by_id = {question_id: key for key, question_id, _ in entries}
+        entries = sorted(entries)
+        with self._lock:
+            self._keys = [key for key, _, _ in entries]
+            self._entries = [(question_id, title)
+                             for _, question_id, title in entries]
+            self._key_by_id = key_by_id
+            self.loaded = True
+            self.generation = generation
+            self.synced_at = time.monotonic()
+
+    def _position(self, question_id, key):
+        """Position of a question's title in the sorted arrays."""
+        position = bisect_left(self._keys, key)
+        while self._entries[position][0] != question_id:
+            position += 1
+        return position
+
+    def _remove(self, question_id):
+        key = self._key_by_id.pop(question_id, None)
+        if key is not None:
+            position = self._position(question_id, key)
+            del self._keys[position]
+            del self._entries[position]
+
+    def _advance(self, generation):
+        """Records a change of the given generation, unless changes of other
+        generations were missed."""
+        if generation is not None and self.generation is not None and \
+                generation == self.generation + 1:
+            self.generation = generation
+
+    def _add(self, question_id, title):
+        key, _, title = self._entry(question_id, title)
+        self._remove(question_id)
+        if len(self._key_by_id) >= self.max_titles:
+            self._remove(next(iter(self._key_by_id)))
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._entries.insert(position, (question_id, title))
+        self._key_by_id[question_id] = key
+
+    def add(self, question_id, title, generation=None):
+        """Adds or replaces the title of a question, dropping the oldest
+        title when full. Ignored until the index is loaded.
+
+        :param generation: Generation of the change, see `load`
+        """
+        with self._lock:
+            if not self.loaded:
+                return
+            self._add(question_id, title)
+            self._advance(generation)
+
+    def apply(self, question_ids, titles, generation):
+        """Applies the changes of questions up to a generation. Ignored until
+        the index is loaded.
+
+        :param question_ids: Ids of the changed questions
+        :param titles: Iterable of tuples of question id and title of the
+                       changed questions still existing
+        :param generation: Latest generation of the changes
+        """
+        with self._lock:
+            if not self.loaded:
+                return
+            for question_id in question_ids:
+                self._remove(question_id)
+            for question_id, title in titles:
+                self._add(question_id, title)
+            self.generation = generation
+            self.synced_at = time.monotonic()
+
+    def sync_due(self, interval):
+        """Whether the changes of other processes are to be applied, the
+        first caller once `interval` seconds passed since the last sync
+        claiming it."""
+        now = time.monotonic()
+        with self._lock:
+            if self.synced_at is None or now - self.synced_at < interval:
+                return False
+            self.synced_at = now
+            return True
+
+    def remove(self, question_id, generation=None):
+        """Removes the title of a question, if indexed.
+
+        :param generation: Generation of the change, see `load`
+        """
+        with self._lock:
+            self._remove(question_id)
+            self._advance(generation)
+
+    def suggest(self, prefix, limit):
+        """Titles starting with a prefix, ignoring case.
+
+        :param prefix: Beginning of the title
+        :param limit: Maximum number of titles
+        :return: List of tuples of question id and title, sorted by title
+        """
+        key = prefix[:self.title_length].lower()
+        with self._lock:
+            start = bisect_left(self._keys, key)
+            return [entry for key_, entry in
+                    zip(self._keys[start:start + limit],
+                        self._entries[start:start + limit])
+                    if key_.startswith(key)]
+
+    def clear(self):
+        """Empties the index, which is loaded again on next use."""
+        with self._lock:
+            self._keys = []
+            self._entries = []
+            self._key_by_id = {}
+            self.loaded = False
+            self.generation = None
+            self.synced_at = None
+
+    def __len__(self):
+        return len(self._keys)
+
+
+title_index = PrefixIndex(settings.SUGGEST_MAX_TITLES,
+                          settings.SUGGEST_TITLE_LENGTH)
+
+
+def _load_titles():
+    """Loads the title of every question into the index."""
+    generation = current_generation(QuestionIndexGeneration)
+    title_index.load(Question.objects.order_by('id')
+                     .values_list('id', 'title').iterator(), generation)
+
+
+def suggest_titles(prefix, limit):
+    """Titles of questions starting with a prefix, loading the index on
+    first use and applying the changes of other processes once due.
+
+    :return: List of tuples of question id and title
+    """
+    if not title_index.loaded:
+        _load_titles()
+    elif title_index.sync_due(settings.QUESTION_INDEX_SYNC_INTERVAL):
+        changes = question_changes(title_index.generation,
+                                   Question.objects.order_by('id'))
+        if changes is None:
+            _load_titles()
+        else:
+            generation, question_ids, questions = changes
+            title_index.apply(question_ids,
+                              questions.values_list('id', 'title'),
+                              generation)
+    return title_index.suggest(prefix, limit)
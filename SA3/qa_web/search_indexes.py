@@ -17,6 +17,9 @@ class QuestionsIndex(indexes.SearchIndex, indexes.Indexable):
         return Question
 
     def index_queryset(self, using=None):
-        """Used when the entire index for model is updated."""
+        """Used when the entire index for model is updated.
+        The owner and answers rendered in the documents are loaded along with
+        the questions."""
         return self.get_model().objects.filter(
-            creation_date__lte=timezone.now())
+            creation_date__lte=timezone.now()) \
+            .select_related('owner').prefetch_related('answer_set')
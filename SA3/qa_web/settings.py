@@ -35,6 +35,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'qa_web.middleware.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -117,6 +118,14 @@ STATICFILES_DIRS = (
     os.path.join(BASE_DIR, 'qa_web/static'),  # static file path
 )
 
+# Static files are collected to STATIC_ROOT by `manage.py collectstatic`
+# under fingerprinted names, with gzipped copies of text files, see
+# qa_web.storage. Development servers serve them from STATICFILES_DIRS as is.
+STATIC_ROOT = os.path.join(BASE_DIR, 'static_root')
+if not DEBUG:
+    STATICFILES_STORAGE = \
+        'qa_web.storage.CompressedManifestStaticFilesStorage'
+
 # User identification and custom profile
 AUTH_USER_MODEL = 'qa_web.User'
 
@@ -127,4 +136,61 @@ HAYSTACK_CONNECTIONS = {
     },
 }
 
-HAYSTACK_SIGNAL_PROCESSOR = 'haystack.signals.RealtimeSignalProcessor'
+# Changed questions are queued and indexed by `manage.py process_search_queue`
+HAYSTACK_SIGNAL_PROCESSOR = 'qa_web.search.signals.QueuedSignalProcessor'
+
+# Progress of `manage.py bulk_index`, used to resume an interrupted rebuild.
+# Kept out of the package, next to the database.
+SEARCH_BULK_CHECKPOINT = os.path.join(BASE_DIR, 'bulk_index.checkpoint')
+
+# Number of pages of search results cached by each process
+SEARCH_RESULT_CACHE_SIZE = 1000
+
+# In-memory indexes of questions apply the changes made by other processes
+# at most this often, see qa_web.search.cache
+QUESTION_INDEX_SYNC_INTERVAL = 1  # seconds
+
+# Type-ahead suggestions of question titles, see qa_web.search.suggest
+SUGGEST_MAX_TITLES = 200000
+SUGGEST_TITLE_LENGTH = 80  # characters
+SUGGEST_LIMIT = 10  # titles per suggestion
+
+# Number of related questions displayed on the thread page, see
+# qa_web.related
+RELATED_QUESTIONS_COUNT = 5
+
+# Likely duplicates suggested when posting a question, see qa_web.duplicates
+DUPLICATES_LIMIT = 5  # questions
+DUPLICATES_THRESHOLD = 0.5  # estimated similarity of title and content
+
+# Number of posts per page of the activity lists of the profile page, see
+# qa_web.activity
+PROFILE_PAGE_SIZE = 20
+
+# Square thumbnails of the pictures uploaded by users, generated by a pool of
+# worker threads in each process, see qa_web.thumbnails
+THUMBNAIL_SIZES = (32, 64, 256)  # pixels
+THUMBNAIL_WORKERS = 2
+
+# Question visits are buffered in memory and written to the database once
+# either limit is reached.
+VISITS_FLUSH_INTERVAL = 30  # seconds
+VISITS_FLUSH_THRESHOLD = 100  # pending visits
+
+# Site-wide statistics are recounted once older than this, see qa_web.stats
+SITE_STATS_TTL = 60  # seconds
+
+# Queries run by each request are reported in X-Query-* response headers
+# when DEBUG is on, and otherwise logged on qa_web.queries, see
+# qa_web.middleware
+if not DEBUG:
+    LOGGING = {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {
+            'console': {'class': 'logging.StreamHandler'},
+        },
+        'loggers': {
+            'qa_web.queries': {'handlers': ['console'], 'level': 'INFO'},
+        },
+    }
@@ -0,0 +1,188 @@
+"""Signal receivers keeping cached and denormalized data in sync with the
+models.
+For more information on signals:
+    https://docs.djangoproject.com/en/2.0/topics/signals/
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from taggit.models import TaggedItem
+from qa_web.conditional import touch_question, touch_thread
+from qa_web.duplicates import (duplicate_index, store_text_signature,
+                               text_signature)
+from qa_web.models import (Answer, Comment, Question, TagUsage, User,
+                           UserStats, Vote)
+from qa_web.related import mark_stale
+from qa_web.rendering import render_markdown
+from qa_web.reputation import adjust_user_stats
+from qa_web.search.cache import record_question_change
+from qa_web.search.suggest import title_index
+from qa_web.stats import adjust_stat
+
+
+@receiver(pre_save, sender=Question)
+@receiver(pre_save, sender=Answer)
+@receiver(pre_save, sender=Comment)
+def post_rendered(sender, instance, **kwargs):
+    """Renders the possibly edited content of a post being saved."""
+    instance.content_html = render_markdown(instance.content)
+
+
+def _question_indexed(question_id, title, content):
+    """Updates the in-memory indexes of questions once a question's change
+    is committed, so that rolled back changes are never indexed.
+    The change is recorded for the other processes to apply it to their
+    indexes, once its signature is stored for them to read."""
+    values = text_signature(title, content)
+    store_text_signature(question_id, values)
+    generation = record_question_change(question_id)
+    title_index.add(question_id, title, generation)
+    duplicate_index.add(question_id, values, generation)
+
+
+def _question_unindexed(question_id):
+    """Removes a question from the in-memory indexes of questions once its
+    deletion is committed, see `_question_indexed`."""
+    generation = record_question_change(question_id)
+    title_index.remove(question_id, generation)
+    duplicate_index.remove(question_id, generation)
+
+
+@receiver(post_save, sender=Question)
+def question_saved(sender, instance, created, **kwargs):
+    """Counts a new question in the site's and its owner's statistics,
+    suggests its possibly edited title, checks it for duplicates and marks
+    its related questions for recomputation."""
+    if created:
+        adjust_stat('questions', 1)
+        adjust_user_stats(instance.owner_id, num_questions=1)
+    else:
+        mark_stale(instance.pk)
+    question_id, title, content = instance.pk, instance.title, \
+        instance.content
+    transaction.on_commit(
+        lambda: _question_indexed(question_id, title, content))
+
+
+@receiver(post_delete, sender=Question)
+def question_deleted(sender, instance, **kwargs):
+    """Uncounts a deleted question from the site's and its owner's
+    statistics and stops suggesting its title or reporting it as a
+    duplicate."""
+    adjust_stat('questions', -1)
+    adjust_user_stats(instance.owner_id, num_questions=-1,
+                      score=-instance.score)
+    question_id = instance.pk
+    transaction.on_commit(lambda: _question_unindexed(question_id))
+
+
+@receiver(post_save, sender=Answer)
+def answer_saved(sender, instance, created, **kwargs):
+    """Counts a new answer on its question and in the site's and its owner's
+    statistics, and records the activity on its question."""
+    if created:
+        touch_question(instance.question_id, num_answers=1)
+        adjust_stat('answers', 1)
+        adjust_user_stats(instance.owner_id, num_answers=1)
+    else:
+        touch_question(instance.question_id)
+
+
+@receiver(post_delete, sender=Answer)
+def answer_deleted(sender, instance, **kwargs):
+    """Uncounts a deleted answer from its question and the site's and its
+    owner's statistics, and records the activity on its question."""
+    touch_question(instance.question_id, num_answers=-1)
+    adjust_stat('answers', -1)
+    adjust_user_stats(instance.owner_id, num_answers=-1,
+                      num_accepted=-1 if instance.correct_answer else 0,
+                      score=-instance.score)
+
+
+def _comment_changed(comment, **counters):
+    """Records the activity on the thread of a comment, adding values to the
+    counters of its question when directly on it."""
+    if comment.question_id is not None:
+        touch_question(comment.question_id, **counters)
+    elif comment.answer_id is not None:
+        touch_thread('answer', comment.answer_id)
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    """Counts a new comment on its question and in the site's and its
+    owner's statistics, and records the activity on its thread."""
+    if created:
+        _comment_changed(instance, num_comments=1)
+        adjust_stat('comments', 1)
+        adjust_user_stats(instance.owner_id, num_comments=1)
+    else:
+        _comment_changed(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    """Uncounts a deleted comment from its question and the site's and its
+    owner's statistics, and records the activity on its thread."""
+    _comment_changed(instance, num_comments=-1)
+    adjust_stat('comments', -1)
+    adjust_user_stats(instance.owner_id, num_comments=-1,
+                      score=-instance.score)
+
+
+@receiver(post_save, sender=Vote)
+def vote_saved(sender, instance, created, **kwargs):
+    """Counts a new vote in the site's statistics."""
+    if created:
+        adjust_stat('votes', 1)
+
+
+@receiver(post_delete, sender=Vote)
+def vote_deleted(sender, instance, **kwargs):
+    """Uncounts a deleted vote from the site's statistics."""
+    adjust_stat('votes', -1)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    """Counts a new user in the site's statistics and starts their own."""
+    if created:
+        adjust_stat('users', 1)
+        UserStats.objects.get_or_create(user_id=instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    """Uncounts a deleted user from the site's statistics."""
+    adjust_stat('users', -1)
+
+
+def _is_question_tag(tagged_item):
+    """Whether a tagged item classifies a question."""
+    return tagged_item.content_type_id == \
+        ContentType.objects.get_for_model(Question).id
+
+
+@receiver(post_save, sender=TaggedItem)
+def tagged_item_saved(sender, instance, created, **kwargs):
+    """Counts a newly tagged question in its tag's usage, marks its related
+    questions for recomputation and records the activity on it."""
+    if created and _is_question_tag(instance):
+        TagUsage.objects.get_or_create(tag_id=instance.tag_id)
+        TagUsage.objects.filter(tag_id=instance.tag_id) \
+            .update(num_questions=F('num_questions') + 1)
+        mark_stale(instance.object_id)
+        touch_question(instance.object_id)
+
+
+@receiver(post_delete, sender=TaggedItem)
+def tagged_item_deleted(sender, instance, **kwargs):
+    """Uncounts an untagged question from its tag's usage, marks its related
+    questions for recomputation and records the activity on it."""
+    if _is_question_tag(instance):
+        TagUsage.objects.filter(tag_id=instance.tag_id) \
+            .update(num_questions=F('num_questions') - 1)
+        mark_stale(instance.object_id)
+        touch_question(instance.object_id)
@@ -0,0 +1,24 @@
+/*JAVASCRIPT common to every page of QA_Web*/
+
+// Fills the navbar's search suggestions with the titles of questions
+// starting with the typed text.
+$(function () {
+    var searchInput = $("input[data-suggest-url]"),
+        lastPrefix = null;
+    searchInput.on("input", function () {
+        var prefix = $.trim(searchInput.val());
+        if (prefix === lastPrefix) {
+            return;
+        }
+        lastPrefix = prefix;
+        $.getJSON(searchInput.data("suggest-url"), {q: prefix}, function (data) {
+            if (prefix !== lastPrefix) {
+                return;
+            }
+            var list = $("#search-suggestions").empty();
+            $.each(data.suggestions, function (i, suggestion) {
+                list.append($("<option>").val(suggestion.title));
+            });
+        });
+    });
+});
@@ -0,0 +1,48 @@
+/*JAVASCRIPT for the user profile page*/
+
+// Builds the markup of a post of the activity, mirroring
+// templates/qa_web/includes/profile_post.html
+function activityPost(post) {
+    var element = $("<div>").addClass("activity-post"),
+        date = $("<small>").text(new Date(post.creation_date).toLocaleString()),
+        link = $("<b>").append($("<a>").attr({href: post.url, target: "_blank"})
+                                      .text(post.title));
+    if (post.type === "question") {
+        element.append($("<h3>").text(post.title));
+    }
+    // Content is rendered and sanitized by the server, see qa_web.rendering
+    element.append($("<div>").addClass("marked").html(post.content_html),
+                   " ", date);
+    if (post.type === "answer") {
+        element.append(" ", $("<small>").append("Answer to question: ", link));
+    } else if (post.type === "comment") {
+        element.append(" ", $("<small>").append("Comment to ", link));
+    }
+    return element.append("<br><br>");
+}
+
+// Appends the following page of posts to a list, hiding the button on the
+// last page.
+function loadMoreCallback(event) {
+    var button = $(event.currentTarget),
+        params = {cursor: button.data("cursor")};
+    if (button.data("type")) {
+        params.type = button.data("type");
+    }
+    button.prop("disabled", true);
+    $.getJSON(button.data("url"), params, function (data) {
+        var list = $(button.data("target"));
+        $.each(data.posts, function (i, post) {
+            list.append(activityPost(post));
+        });
+        if (data.next_cursor) {
+            button.data("cursor", data.next_cursor).prop("disabled", false);
+        } else {
+            button.remove();
+        }
+    });
+}
+
+$(function () {
+    $(".load-more").on("click", loadMoreCallback);
+});
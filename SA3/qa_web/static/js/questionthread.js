@@ -1,20 +1,5 @@
 /*JAVASCRIPT for QA_Web*/
 
-/*Function that populates all the necessary divs with markdown, 
-using markdown-it library. This is only proper to answerspage.html for now
-*/
-function prepareMarkdown() {
-    var md = window.markdownit();
-
-    $(".marked").each(function () {
-        var textToMark = $(this).text();
-        var result = md.render(textToMark);
-        $(this).html(result);
-        $(this).find("p").css("margin-bottom", 0);
-    });
-}
-
-
 // Callback for voting, sends ajax request to server 
 // then updates the corresponding score.
 function voteCallback(event) {
@@ -101,9 +86,6 @@ function getCookie(name) {
 }
 
 $(document).ready(function () {
-    // Displays text in answers pages as MD
-    prepareMarkdown();
-
     var converter = Markdown.getSanitizingConverter();
     var editor = new Markdown.Editor(converter);
     editor.run();
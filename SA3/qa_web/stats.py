@@ -0,0 +1,57 @@
+"""Site-wide statistics displayed by the listing pages.
+
+Totals of questions, answers, comments, votes and users are kept in the
+single SiteStats row so that views never count the tables, whichever process
+serves them. Each total is adjusted atomically as objects are created and
+deleted (see qa_web.signals) and recomputed from the database once older than
+`SITE_STATS_TTL` seconds, which bounds any drift from bulk operations.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from qa_web.models import Answer, Comment, Question, SiteStats, User, Vote
+
+STATS_MODELS = {
+    'questions': Question,
+    'answers': Answer,
+    'comments': Comment,
+    'votes': Vote,
+    'users': User,
+}
+
+SITE_STATS_ID = 1
+
+
+def refresh_stats():
+    """Recomputes every total from the database.
+
+    :return: Dictionary of each total by name
+    """
+    stats = {name: model.objects.count()
+             for name, model in STATS_MODELS.items()}
+    SiteStats.objects.update_or_create(
+        id=SITE_STATS_ID, defaults=dict(stats, refreshed=timezone.now()))
+    return stats
+
+
+def get_stats():
+    """Site-wide totals, only recomputed when missing or older than
+    `SITE_STATS_TTL`.
+
+    :return: Dictionary of each total by name
+    """
+    row = SiteStats.objects.filter(id=SITE_STATS_ID) \
+        .values('refreshed', *STATS_MODELS).first()
+    if row is None or row.pop('refreshed') < timezone.now() - timedelta(
+            seconds=settings.SITE_STATS_TTL):
+        return refresh_stats()
+    return row
+
+
+def adjust_stat(name, delta):
+    """Atomically adds `delta` to a stored total.
+    Missing totals are left to be recomputed on next read.
+    """
+    SiteStats.objects.filter(id=SITE_STATS_ID).update(
+        **{name: F(name) + delta})
@@ -0,0 +1,71 @@
+"""Storage of the static files collected for deployment.
+
+`manage.py collectstatic` copies every static file to `STATIC_ROOT` under a
+name including the hash of its content, e.g. `css/bootstrap.min.<hash>.css`,
+and records the hashed names in a manifest through which `{% static %}`
+renders its URLs. References between static files, such as the `url()` of
+stylesheets, are rewritten to the hashed names as well.
+
+A hashed name changes whenever the file does, so the web server can let
+browsers cache static files forever instead of revalidating them on every
+page. Text files are also gzipped once at collection time, next to their
+originals, for the web server to send as is to the browsers accepting them
+rather than compressing them on every request. See the README for the
+matching web server configuration.
+"""
+import gzip
+import os
+from io import BytesIO
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+# Files worth compressing, images other than SVG being compressed already
+COMPRESSED_EXTENSIONS = ('.css', '.js', '.json', '.svg', '.txt', '.html')
+
+# Smaller files fit in a single packet anyway
+MIN_COMPRESSED_SIZE = 256  # bytes
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest storage also writing a gzipped copy, with the `.gz` suffix,
+    of the text files it collects."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        """Hashes the collected files, then compresses the original and
+        hashed copies of each text file."""
+        names = set()
+        for name, hashed_name, processed in super().post_process(
+                paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                names.update((name, hashed_name))
+            yield name, hashed_name, processed
+        for name in sorted(names):
+            self.compress(name)
+
+    def compress(self, name):
+        """Writes the gzipped copy of a file, unless it is not a text file
+        or compression does not make it smaller.
+
+        :param name: Name of the file in the storage
+        :return: Name of the compressed copy, None if not written
+        """
+        if os.path.splitext(name)[1].lower() not in COMPRESSED_EXTENSIONS:
+            return None
+        with self.open(name) as file:
+            content = file.read()
+        if len(content) < MIN_COMPRESSED_SIZE:
+            return None
+        # A fixed mtime keeps the output, and thus its ETag, identical
+        # between deployments
+        output = BytesIO()
+        with gzip.GzipFile(filename='', mode='wb', fileobj=output,
+                           compresslevel=9, mtime=0) as gzip_file:
+            gzip_file.write(content)
+        compressed = output.getvalue()
+        if len(compressed) >= len(content):
+            return None
+        compressed_name = name + '.gz'
+        if self.exists(compressed_name):
+            self.delete(compressed_name)
+        self._save(compressed_name, ContentFile(compressed))
+        return compressed_name
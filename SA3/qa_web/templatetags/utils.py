@@ -1,54 +1,78 @@
 """
-Template tags that allow for quick backend operation calls
-from the templates
+Template tags formatting posts and their owners.
+They only read values loaded along with the posts, annotated by
+`qa_web.activity` or selected by `qa_web.threads`, and never query the
+database, whatever the number of posts displayed.
 """
 
 from django import template
-from qa_web.models import Answer, Question, Comment, User
+from qa_web import rendering, thumbnails
 register = template.Library()
 
 @register.simple_tag
-def get_answer_parent_title(question_id):
+def get_answer_parent_title(answer):
     """
-    Method that obtains a question's title
-    :param question_id: question' unique id
+    Method that obtains the title of an answer's question
+    :param answer: Answer annotated with its `question_title`
     :return: Question title in string
     """
-    question = Question.objects.get(id=question_id)
-    return question.title
+    return answer.question_title
 
 @register.simple_tag
-def get_comment_question_id(question_id, answer_id):
+def get_comment_question_id(comment):
     """
-    Method that obtains a comment's question id or answer on
+    Method that obtains the id of the question a comment belongs to on
     user profile page
-    :param question_id: Possible question id
-    :param answer_id: Possible answer id
+    :param comment: Comment annotated with its `answer_question_id`
     :return: if comment to question, return that question id
-    else if comment to answer, return answer's comment id
+    else if comment to answer, return answer's question id
     """
-    if answer_id is None:
-        return question_id
-    else:
-        answer = Answer.objects.get(id=answer_id)
-        return answer.question_id
+    if comment.answer_id is None:
+        return comment.question_id
+    return comment.answer_question_id
 
 @register.simple_tag
-def get_comment_parent(comment_id):
+def get_comment_parent(comment):
     """
     Method that obtains part of the message to be displayed below a comment
     on the user profile page
-    :param comment_id: comment's unique id
+    :param comment: Comment annotated with its `parent_owner` username, None
+                    when the parent's owner was deleted
     :return: String indicating who's question or answer it was
     """
-    comment = Comment.objects.get(id=comment_id)
+    owner = comment.parent_owner or 'a deleted user'
     if comment.answer_id is None:
-        parent_question = Question.objects.get(id=comment.question_id)
-        parent_owner = User.objects.get(id=parent_question.owner_id)
-        info = parent_owner.username + "'s question"
-        return info
-    else:
-        parent_answer = Answer.objects.get(id=comment.answer_id)
-        parent_owner = User.objects.get(id=parent_answer.owner_id)
-        info = parent_owner.username + "'s answer"
-        return info
+        return owner + "'s question"
+    return owner + "'s answer"
+
+@register.filter
+def owner_label(user):
+    """
+    Method that formats the name of a post's owner along with their
+    reputation
+    :param user: User loaded along with their `stats`
+    :return: String of the username followed by the user's total score
+    """
+    stats = getattr(user, 'stats', None)
+    if stats is None:
+        return str(user)
+    return '{} ({})'.format(user, stats.score)
+
+@register.simple_tag
+def thumbnail_url(image, size):
+    """
+    Method that obtains the url of a picture's thumbnail
+    :param image: Picture uploaded by a user, see qa_web.thumbnails
+    :param size: Size in pixels, one of THUMBNAIL_SIZES
+    :return: url of the thumbnail, of the picture until it is generated
+    """
+    return thumbnails.thumbnail_url(image.name, size)
+
+@register.filter
+def post_html(post):
+    """
+    Method that obtains the content of a post rendered from Markdown
+    :param post: Question, answer or comment, see qa_web.rendering
+    :return: Sanitized HTML of the post's content
+    """
+    return rendering.post_html(post)
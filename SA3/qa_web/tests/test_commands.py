@@ -0,0 +1,396 @@
+"""
+Submodule that defines test cases to be ran for management commands
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from PIL import Image
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from haystack.query import SearchQuerySet
+from qa_web.models import (Answer, Comment, Question, QuestionSignature,
+                           SearchQueueEntry, TagUsage, User)
+from qa_web.related import related_questions
+from qa_web.stats import adjust_stat, get_stats
+from qa_web.thumbnails import (generate_thumbnails, store_picture,
+                               thumbnail_name)
+
+credentials = {'username': 'test', 'password': 'test'}
+
+
+class RepairCountersTest(TestCase):
+    """Test cases for the repair_counters command"""
+
+    def setUp(self):
+        """
+        Method that sets up a question whose answers and comments are
+        counted
+        """
+        user = User.objects.create_user(**credentials)
+        self.question = Question.objects.create(
+            title="Test question", content="Test content", owner=user)
+        for i in range(3):
+            answer = Answer.objects.create(
+                content="answer content", owner=user, question=self.question)
+            Comment.objects.create(content="comment content", owner=user,
+                                   answer=answer)
+        Comment.objects.create(content="comment content", owner=user,
+                               question=self.question)
+
+    def test_repair_counters(self):
+        """
+        Tests that counters which drifted are recomputed from the posts
+        """
+        Question.objects.update(num_answers=42, num_comments=-1)
+        Question.objects.create(title="Unanswered", content="Test content",
+                                owner=self.question.owner, num_answers=7)
+        out = StringIO()
+        call_command('repair_counters', stdout=out)
+
+        question = Question.objects.get(pk=self.question.id)
+        self.assertEqual(question.num_answers, 3)
+        self.assertEqual(question.num_comments, 1)
+        self.assertEqual(
+            Question.objects.get(title="Unanswered").num_answers, 0)
+        self.assertIn('2 question(s)', out.getvalue())
+
+    def test_repair_tag_usage(self):
+        """
+        Tests that tag usage which drifted is recomputed from the tagging
+        table
+        """
+        self.question.tag.add('test', 'other')
+        TagUsage.objects.update(num_questions=42)
+        TagUsage.objects.filter(tag__name='other').delete()
+        call_command('repair_counters', stdout=StringIO())
+
+        self.assertEqual(
+            dict(TagUsage.objects.values_list('tag__name', 'num_questions')),
+            {'test': 1, 'other': 1})
+
+
+class RefreshStatsTest(TestCase):
+    """Test cases for the refresh_stats command"""
+
+    def test_refresh_stats(self):
+        """
+        Tests that stored totals which drifted are recomputed
+        """
+        User.objects.create_user(**credentials)
+        get_stats()
+        adjust_stat('users', 41)
+        out = StringIO()
+        call_command('refresh_stats', stdout=out)
+        self.assertEqual(get_stats()['users'], 1)
+        self.assertIn('1 users', out.getvalue())
+
+
+class SearchQueueTest(TestCase):
+    """Test cases for the process_search_queue and search_queue_status
+    commands"""
+
+    def setUp(self):
+        """
+        Method that sets up questions queued for indexing
+        """
+        user = User.objects.create_user(**credentials)
+        self.question = Question.objects.create(
+            title="Zanzibar question", content="Test content", owner=user)
+        self.question.title = "Zanzibar question edited"
+        self.question.save()
+        Question.objects.create(title="Other question",
+                                content="Test content", owner=user)
+
+    def _search(self, keyword):
+        """
+        Helper method that searches the index
+        :return: List of the ids of matching questions
+        """
+        return [int(result.pk) for result in
+                SearchQuerySet().models(Question).filter(content=keyword)]
+
+    def test_process_search_queue(self):
+        """
+        Tests that queued questions are indexed once and removed from the
+        queue, deleted questions being removed from the index
+        """
+        self.assertEqual(SearchQueueEntry.objects.count(), 3)
+        out = StringIO()
+        call_command('search_queue_status', stdout=out)
+        self.assertIn('3 queued update(s) of 2 question(s)', out.getvalue())
+
+        out = StringIO()
+        call_command('process_search_queue', batch_size=1, stdout=out)
+        self.assertIn('Reindexed 2 question(s).', out.getvalue())
+        self.assertFalse(SearchQueueEntry.objects.exists())
+        self.assertEqual(self._search('zanzibar'), [self.question.id])
+
+        self.question.delete()
+        call_command('process_search_queue', stdout=StringIO())
+        self.assertEqual(self._search('zanzibar'), [])
+
+    def test_only_indexed_changes_queued(self):
+        """
+        Tests that questions are only queued when data rendered in the index
+        changes, including the content of their answers
+        """
+        SearchQueueEntry.objects.all().delete()
+        question = Question.objects.get(pk=self.question.id)
+        question.visits += 1
+        question.save()
+        self.assertFalse(SearchQueueEntry.objects.exists())
+
+        answer = Answer.objects.create(content="answer content",
+                                       owner=question.owner, question=question)
+        answer.correct_answer = True
+        answer.save()
+        answer = Answer.objects.get(pk=answer.id)
+        answer.content = "edited answer content"
+        answer.save()
+        answer.delete()
+        question.content = "edited content"
+        question.save()
+        self.assertEqual(
+            list(SearchQueueEntry.objects.values_list('question_id',
+                                                      flat=True)),
+            [question.id] * 4)
+
+
+class BulkIndexTest(TestCase):
+    """Test cases for the bulk_index command"""
+
+    def setUp(self):
+        """
+        Method that sets up answered questions to be indexed
+        """
+        user = User.objects.create_user(**credentials)
+        for i in range(5):
+            question = Question.objects.create(
+                title="Question {}".format(i), content="Test content",
+                owner=user)
+            Answer.objects.create(content="Quokka {}".format(i), owner=user,
+                                  question=question)
+        directory = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(directory, 'checkpoint')
+        self.addCleanup(os.rmdir, directory)
+
+    def test_bulk_index(self):
+        """
+        Tests that every question is indexed with its answers
+        """
+        out = StringIO()
+        call_command('bulk_index', chunk_size=2, workers=1,
+                     checkpoint=self.checkpoint, stdout=out)
+        self.assertIn('Indexed 5 question(s)', out.getvalue())
+        self.assertEqual(
+            SearchQuerySet().models(Question).filter(content='quokka').count(),
+            5)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_resume_bulk_index(self):
+        """
+        Tests that a resumed rebuild only indexes the questions following
+        the checkpoint
+        """
+        third = Question.objects.order_by('id')[2]
+        with open(self.checkpoint, 'w') as checkpoint:
+            checkpoint.write('{{"last_pk": {}}}'.format(third.id))
+        out = StringIO()
+        call_command('bulk_index', workers=1, resume=True,
+                     checkpoint=self.checkpoint, stdout=out)
+        self.assertIn('Indexed 2 question(s)', out.getvalue())
+
+
+class RelatedQuestionsTest(TestCase):
+    """Test cases for the update_related_questions command"""
+
+    def setUp(self):
+        """
+        Method that sets up two similar questions and an unrelated one
+        """
+        user = User.objects.create_user(**credentials)
+        self.first = Question.objects.create(
+            title="Filter a django queryset on a related model",
+            content="How do I filter a django queryset on the fields of a "
+                    "related model without writing raw sql?", owner=user)
+        self.first.tag.add('django', 'queryset')
+        self.second = Question.objects.create(
+            title="Django queryset filter on related model fields",
+            content="Filter a django queryset on fields of a related model, "
+                    "raw sql is not an option.", owner=user)
+        self.second.tag.add('django', 'queryset')
+        self.other = Question.objects.create(
+            title="Baking sourdough bread at home",
+            content="My sourdough starter never rises, what flour should I "
+                    "use for baking bread?", owner=user)
+
+    def test_update_related_questions(self):
+        """
+        Tests that similar questions are related to each other only
+        """
+        out = StringIO()
+        call_command('update_related_questions', stdout=out)
+        self.assertIn('Computed 3 signature(s)', out.getvalue())
+        self.assertEqual(related_questions(self.first), [self.second])
+        self.assertEqual(related_questions(self.second), [self.first])
+        self.assertEqual(related_questions(self.other), [])
+
+    def test_incremental_update(self):
+        """
+        Tests that only edited questions get a new signature and that the
+        questions they become similar to list them
+        """
+        call_command('update_related_questions', stdout=StringIO())
+        self.other.title = "Filter a django queryset on a related model"
+        self.other.content = self.first.content
+        self.other.save()
+        self.assertTrue(QuestionSignature.objects.get(pk=self.other.id).stale)
+
+        out = StringIO()
+        call_command('update_related_questions', stdout=out)
+        self.assertIn('Computed 1 signature(s)', out.getvalue())
+        self.assertFalse(QuestionSignature.objects.get(pk=self.other.id).stale)
+        self.assertEqual(related_questions(self.first)[0], self.other)
+        self.assertIn(self.first, related_questions(self.other))
+
+    @override_settings(RELATED_QUESTIONS_COUNT=1)
+    def test_outranked_only(self):
+        """
+        Tests that a new question only updates the questions it ranks
+        among their related questions
+        """
+        call_command('update_related_questions', stdout=StringIO())
+        # Sharing buckets with the first question, but less similar to it
+        # than the second one
+        new = Question.objects.create(
+            title="Order a django queryset on a related model",
+            content="How do I order a django queryset by the fields of a "
+                    "related model?", owner=self.first.owner)
+        new.tag.add('django')
+        out = StringIO()
+        call_command('update_related_questions', stdout=out)
+        self.assertIn('Computed 1 signature(s), updated the related '
+                      'questions of 1 question(s)', out.getvalue())
+        self.assertEqual(related_questions(self.first), [self.second])
+        self.assertIn(related_questions(new)[0], [self.first, self.second])
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class GenerateThumbnailsTest(TestCase):
+    """Test cases for the generate_thumbnails command"""
+
+    def setUp(self):
+        """
+        Method that sets up users with a picture and without
+        """
+        self.addCleanup(shutil.rmtree, settings.MEDIA_ROOT)
+        output = BytesIO()
+        Image.new('RGB', (300, 500)).save(output, 'JPEG')
+        self.name = store_picture(
+            SimpleUploadedFile('photo.jpg', output.getvalue()))
+        User.objects.create_user(image=self.name, **credentials)
+        User.objects.create_user(username='other', password='other')
+
+    def test_generate_thumbnails(self):
+        """
+        Tests that missing thumbnails are generated at their size
+        """
+        generate_thumbnails(self.name)
+        os.remove(os.path.join(settings.MEDIA_ROOT,
+                               thumbnail_name(self.name, 64)))
+        out = StringIO()
+        call_command('generate_thumbnails', stdout=out)
+        self.assertIn('Generated 1 thumbnail(s) of 1 picture(s)',
+                      out.getvalue())
+        for size in settings.THUMBNAIL_SIZES:
+            with Image.open(os.path.join(settings.MEDIA_ROOT,
+                                         thumbnail_name(self.name, size))) \
+                    as thumbnail:
+                self.assertEqual(thumbnail.size, (size, size))
+
+
+class RenderPostsTest(TestCase):
+    """Test cases for the render_posts command"""
+
+    def setUp(self):
+        """
+        Method that sets up posts saved before their content was rendered
+        """
+        user = User.objects.create_user(**credentials)
+        question = Question.objects.create(title='Title', content='*a*',
+                                           owner=user)
+        Answer.objects.create(question=question, content='*b*', owner=user)
+        Comment.objects.create(question=question, content='*c*', owner=user)
+        for model in (Question, Answer, Comment):
+            model.objects.update(content_html=None)
+
+    def test_render_posts(self):
+        """
+        Tests that posts without rendered content are rendered, and every
+        post with --all
+        """
+        out = StringIO()
+        call_command('render_posts', stdout=out)
+        self.assertIn('Rendered 3 post(s).', out.getvalue())
+        self.assertEqual(Answer.objects.get().content_html,
+                         '<p><em>b</em></p>')
+        out = StringIO()
+        call_command('render_posts', stdout=out)
+        self.assertIn('Rendered 0 post(s).', out.getvalue())
+        out = StringIO()
+        call_command('render_posts', '--all', '--batch-size', '1',
+                     stdout=out)
+        self.assertIn('Rendered 3 post(s).', out.getvalue())
+
+
+@override_settings(
+    STATIC_ROOT=tempfile.mkdtemp(),
+    STATICFILES_STORAGE='qa_web.storage.CompressedManifestStaticFilesStorage')
+class CollectStaticTest(TestCase):
+    """Test cases for the collection of static files"""
+
+    def setUp(self):
+        """
+        Method that collects the static files
+        """
+        self.addCleanup(shutil.rmtree, settings.STATIC_ROOT)
+        call_command('collectstatic', interactive=False, verbosity=0,
+                     ignore_patterns=['media'])
+
+    def read(self, name):
+        """
+        Reads a collected file
+        """
+        with open(os.path.join(settings.STATIC_ROOT, name), 'rb') as file:
+            return file.read()
+
+    def test_hashed_names(self):
+        """
+        Tests that static URLs include the hash of the collected files,
+        also in references between them
+        """
+        url = staticfiles_storage.url('css/bootstrap.min.css')
+        self.assertRegex(url,
+                         r'^/static/css/bootstrap\.min\.[0-9a-f]{12}\.css$')
+        stylesheet = self.read(staticfiles_storage.stored_name(
+            'css/pagedown.css'))
+        self.assertIn(staticfiles_storage.stored_name(
+            'img/wmd-buttons.svg').split('/')[-1].encode(), stylesheet)
+
+    def test_compressed_files(self):
+        """
+        Tests that text files are gzipped next to their originals, but not
+        images
+        """
+        name = staticfiles_storage.stored_name('css/bootstrap.min.css')
+        self.assertEqual(gzip.decompress(self.read(name + '.gz')),
+                         self.read(name))
+        self.assertFalse(os.path.exists(os.path.join(
+            settings.STATIC_ROOT,
+            staticfiles_storage.stored_name('img/01.jpg') + '.gz')))
@@ -3,8 +3,16 @@ Submodule that defines test cases to be ran for models (object instantiation)
 """
 
 import random
-from django.test import TestCase
-from qa_web.models import Question, Comment, Answer, User, Vote
+from datetime import timedelta
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from qa_web.counters import recount_users
+from qa_web.models import (Question, Comment, Answer, SiteStats, TagUsage,
+                           User, UserStats, Vote)
+from qa_web.reputation import set_best_answer
+from qa_web.stats import get_stats, refresh_stats
+from qa_web.threads import ANSWER_ORDERINGS
+from qa_web.votes import cast_vote
 
 credentials = {'username': 'johnny', 'password': 'password123'}
 
@@ -103,6 +111,30 @@ class CommentModel(TestCase):
         self.assertQuerysetEqual(
             Comment.objects.filter(content="quick content"), [])
 
+    def test_question_counters(self):
+        """
+        Tests that a question's answers and comments are counted as they
+        are created and deleted
+        """
+        user1, question, _ = obtain_sample_objects_as_tuple()
+        answer = Answer.objects.create(content='Test answer', owner=user1,
+                                       question=question)
+        Answer.objects.create(content='Test answer', owner=user1,
+                              question=question)
+        comment = Comment.objects.create(content="quick content",
+                                         owner=user1, question=question)
+        Comment.objects.create(content="quick content", owner=user1,
+                               answer=answer)
+        question.refresh_from_db()
+        self.assertEqual(question.num_answers, 2)
+        self.assertEqual(question.num_comments, 1)
+
+        answer.delete()
+        comment.delete()
+        question.refresh_from_db()
+        self.assertEqual(question.num_answers, 1)
+        self.assertEqual(question.num_comments, 0)
+
     def test_comments_originator(self):
         """
         Tests the number of questions owned by a user after
@@ -139,17 +171,358 @@ class VoteModel(TestCase):
         create_many_users()
         _, question, _ = obtain_sample_objects_as_tuple()
 
+        expected = 0
         for user in User.objects.all():
             positive = random.choice([True, False])
-            if positive:
-                question.upvotes += 1
-            else:
-                question.downvotes += 1
-
-            vote = Vote.objects.create(question=question, user=user,
-                                       positive=positive)
-            self.assertIsNone(vote.answer)
-            self.assertIsNone(vote.comment)
-
-        self.assertTrue(question.score >= -15)
-        self.assertTrue(question.score <= 15)
+            expected += 1 if positive else -1
+            score = cast_vote(user, 'question', question.pk, positive)
+            self.assertEqual(score, expected)
+
+        question.refresh_from_db()
+        self.assertEqual(question.score, expected)
+        self.assertEqual(question.upvotes - question.downvotes, expected)
+        vote = Vote.objects.filter(question=question).first()
+        self.assertIsNone(vote.answer)
+        self.assertIsNone(vote.comment)
+
+    def test_score_recomputed_on_save(self):
+        """
+        Tests that saving a post keeps its score consistent with its votes
+        """
+        _, question, _ = obtain_sample_objects_as_tuple()
+        question.upvotes = 3
+        question.downvotes = 1
+        question.score = 10
+        question.save()
+        question.refresh_from_db()
+        self.assertEqual(question.score, 2)
+
+    def test_single_vote_per_post(self):
+        """
+        Tests that a user cannot vote twice on the same post while still
+        being able to vote on other posts
+        """
+        user1, question, _ = obtain_sample_objects_as_tuple()
+        answer = Answer.objects.create(content='Test answer', owner=user1,
+                                       question=question)
+        Vote.objects.create(question=question, user=user1, positive=True)
+        Vote.objects.create(answer=answer, user=user1, positive=True)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Vote.objects.create(question=question, user=user1, positive=False)
+        self.assertEqual(Vote.objects.filter(user=user1).count(), 2)
+
+
+class TagUsageModel(TestCase):
+    """Test cases for TagUsage model"""
+
+    def setUp(self):
+        """
+        Method that sets up the test case environment for
+        testing of tag usage
+        """
+        user1 = User.objects.create_user(**credentials)
+        for i in range(3):
+            Question.objects.create(title="Question {}".format(i),
+                                    content="Test content", owner=user1)
+
+    def _usage(self):
+        """
+        Helper method that obtains the usage of every tag
+        :return: Dictionary of tag names to their number of questions
+        """
+        return dict(TagUsage.objects.values_list('tag__name',
+                                                 'num_questions'))
+
+    def test_tagging_questions(self):
+        """
+        Tests that tagging, untagging and deleting questions updates the
+        usage of their tags
+        """
+        first, second, third = Question.objects.order_by('id')
+        first.tag.add('python', 'django')
+        second.tag.add('python')
+        third.tag.add('python')
+        self.assertEqual(self._usage(), {'python': 3, 'django': 1})
+
+        second.tag.remove('python')
+        third.delete()
+        self.assertEqual(self._usage(), {'python': 1, 'django': 1})
+        first.tag.clear()
+        self.assertEqual(self._usage(), {'python': 0, 'django': 0})
+
+
+class SiteStatsTest(TestCase):
+    """Test cases for the stored site-wide statistics"""
+
+    def setUp(self):
+        """
+        Method that sets up the test case environment for
+        testing of site statistics
+        """
+        User.objects.create_user(**credentials)
+
+    def test_incremental_stats(self):
+        """
+        Tests that stored totals follow creations and deletions without
+        counting the tables
+        """
+        user1 = User.objects.first()
+        self.assertEqual(get_stats(), {'questions': 0, 'answers': 0,
+                                       'comments': 0, 'votes': 0, 'users': 1})
+        question = Question.objects.create(title="Question", content="Test",
+                                           owner=user1)
+        answer = Answer.objects.create(question=question, content="Test",
+                                       owner=user1)
+        Comment.objects.create(answer=answer, content="Test", owner=user1)
+        Vote.objects.create(user=user1, question=question, positive=True)
+        with self.assertNumQueries(1):
+            stats = get_stats()
+        self.assertEqual(stats, {'questions': 1, 'answers': 1, 'comments': 1,
+                                 'votes': 1, 'users': 1})
+
+        answer.delete()  # Cascades to its comment
+        self.assertEqual(get_stats()['answers'], 0)
+        self.assertEqual(get_stats()['comments'], 0)
+
+    def test_refresh_stats(self):
+        """
+        Tests that refreshing recomputes totals which drifted
+        """
+        get_stats()
+        Question.objects.bulk_create(  # No signal is sent
+            [Question(title="Question", content="Test") for _ in range(3)])
+        self.assertEqual(get_stats()['questions'], 0)
+        self.assertEqual(refresh_stats()['questions'], 3)
+        self.assertEqual(get_stats()['questions'], 3)
+
+    @override_settings(SITE_STATS_TTL=60)
+    def test_stats_expiry(self):
+        """
+        Tests that totals older than SITE_STATS_TTL are recounted
+        """
+        get_stats()
+        Question.objects.bulk_create(
+            [Question(title="Question", content="Test") for _ in range(3)])
+        refreshed = SiteStats.objects.get().refreshed
+        SiteStats.objects.update(refreshed=refreshed - timedelta(seconds=61))
+        self.assertEqual(get_stats()['questions'], 3)
+
+    def test_admin_refresh(self):
+        """
+        Tests the admin action recounting the totals
+        """
+        User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        get_stats()
+        Question.objects.bulk_create(
+            [Question(title="Question", content="Test") for _ in range(3)])
+        self.client.login(username='admin', password='admin')
+        response = self.client.post('/admin/qa_web/sitestats/', {
+            'action': 'refresh',
+            '_selected_action': [SiteStats.objects.get().pk]}, follow=True)
+        self.assertContains(response, 'Site statistics refreshed')
+        self.assertEqual(get_stats()['questions'], 3)
+
+
+class AnswerScoreTest(TestCase):
+    """Test cases for the stored score of posts and the sorting of answers"""
+
+    def setUp(self):
+        """
+        Method that sets up the test case environment for
+        testing of answer sorting
+        """
+        user1 = User.objects.create_user(**credentials)
+        question = Question.objects.create(title="Question", content="Test",
+                                           owner=user1)
+        for i in range(5):
+            Answer.objects.create(question=question, content=str(i),
+                                  owner=user1)
+
+    def _query_plan(self, queryset):
+        """
+        Helper method that obtains the query plan of a queryset
+        :return: Plan as a single string, one step per line
+        """
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return '\n'.join(row[-1] for row in cursor.fetchall())
+
+    def test_score_follows_votes(self):
+        """
+        Tests that votes keep the stored score of posts up to date
+        """
+        user1, question, answer = obtain_sample_objects_as_tuple()
+        self.assertEqual(cast_vote(user1, 'question', question.id, True), 1)
+        self.assertEqual(cast_vote(user1, 'answer', answer.id, False), -1)
+        self.assertEqual(cast_vote(user1, 'answer', answer.id, True), 1)
+        question.refresh_from_db()
+        answer.refresh_from_db()
+        self.assertEqual(question.score, question.upvotes - question.downvotes)
+        self.assertEqual(answer.score, answer.upvotes - answer.downvotes)
+        self.assertEqual(answer.score, 1)
+
+    def test_answer_orderings_use_index(self):
+        """
+        Tests that every sorting of answers is read from an index instead of
+        being sorted
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest('Query plans are specific to SQLite')
+        question = Question.objects.first()
+        for ordering in ANSWER_ORDERINGS.values():
+            plan = self._query_plan(
+                Answer.objects.filter(question=question)
+                .select_related('owner').order_by(*ordering))
+            self.assertRegex(plan, r'answer_(score|recent)_idx')
+            self.assertNotIn('TEMP B-TREE', plan)
+
+
+class UserStatsTest(TestCase):
+    """Test cases for the statistics of users"""
+
+    def setUp(self):
+        """
+        Method that sets up a question answered by another user
+        """
+        self.asker = User.objects.create_user(**credentials)
+        self.answerer = User.objects.create_user(username='answerer',
+                                                 password='answerer')
+        self.question = Question.objects.create(
+            title="Question", content="Test", owner=self.asker)
+        self.answer = Answer.objects.create(
+            question=self.question, content="Test", owner=self.answerer)
+        Comment.objects.create(answer=self.answer, content="Test",
+                               owner=self.asker)
+
+    def _stats(self, user):
+        """
+        Helper method that obtains the statistics of a user
+        :return: Tuple of the score and of the number of questions, answers,
+                 accepted answers and comments
+        """
+        return UserStats.objects.filter(user=user).values_list(
+            'score', 'num_questions', 'num_answers', 'num_accepted',
+            'num_comments').get()
+
+    def test_incremental_stats(self):
+        """
+        Tests that statistics follow posts, votes and best answers
+        """
+        cast_vote(self.asker, 'answer', self.answer.id, True)
+        cast_vote(self.answerer, 'question', self.question.id, False)
+        set_best_answer(self.answer, True)
+        self.assertEqual(self._stats(self.asker), (-1, 1, 0, 0, 1))
+        self.assertEqual(self._stats(self.answerer), (1, 0, 1, 1, 0))
+
+        # Selecting twice is only counted once
+        self.assertFalse(set_best_answer(self.answer, True))
+        cast_vote(self.asker, 'answer', self.answer.id, True)  # Cancelled
+        self.assertEqual(self._stats(self.answerer), (0, 0, 1, 1, 0))
+
+        cast_vote(self.asker, 'answer', self.answer.id, False)
+        # Deleted as by the delete view, which loads the question's score
+        self.question.refresh_from_db()
+        self.question.delete()  # Cascades to its answer and comment
+        self.assertEqual(self._stats(self.asker), (0, 0, 0, 0, 0))
+        self.assertEqual(self._stats(self.answerer), (0, 0, 0, 0, 0))
+
+    def test_recount_users(self):
+        """
+        Tests that recounting recomputes statistics which drifted
+        """
+        cast_vote(self.asker, 'answer', self.answer.id, True)
+        set_best_answer(self.answer, True)
+        expected = self._stats(self.answerer)
+        UserStats.objects.update(score=42, num_answers=-1)
+        UserStats.objects.filter(user=self.asker).delete()
+
+        self.assertEqual(recount_users(), 2)
+        self.assertEqual(self._stats(self.answerer), expected)
+        self.assertEqual(self._stats(self.asker), (0, 1, 0, 0, 1))
+
+
+class RenderedContentTest(TestCase):
+    """Test cases for the rendering of the content of posts"""
+
+    def setUp(self):
+        """
+        Method that sets up a question
+        """
+        self.user = User.objects.create_user(**credentials)
+        self.question = Question.objects.create(
+            title='Markdown', content='Some **bold** text', owner=self.user)
+
+    def test_rendered_on_save(self):
+        """
+        Tests that the content of posts is rendered when saved, and again
+        when edited
+        """
+        self.assertEqual(self.question.content_html,
+                         '<p>Some <strong>bold</strong> text</p>')
+        answer = Answer.objects.create(question=self.question,
+                                       content='* item', owner=self.user)
+        self.assertIn('<li>item</li>', Answer.objects.get(pk=answer.pk)
+                      .content_html)
+        self.question.content = '`code`'
+        self.question.save()
+        self.assertEqual(Question.objects.get(pk=self.question.pk)
+                         .content_html, '<p><code>code</code></p>')
+
+    def test_sanitized(self):
+        """
+        Tests that markup outside of the allowed tags, attributes and
+        protocols does not get through
+        """
+        comment = Comment.objects.create(
+            question=self.question, owner=self.user,
+            content='<script>alert(1)</script> [link](javascript:alert(1)) '
+                    '<b onclick="alert(1)">b</b>')
+        self.assertNotIn('<script>', comment.content_html)
+        self.assertNotIn('javascript:', comment.content_html)
+        self.assertNotIn('onclick', comment.content_html)
+        self.assertIn('&lt;script&gt;', comment.content_html)
+
+
+class LastActivityTest(TestCase):
+    """Test cases for the last activity on questions"""
+
+    def setUp(self):
+        """
+        Method that sets up a question with an answer and a comment on it
+        """
+        self.user = User.objects.create_user(**credentials)
+        self.question = Question.objects.create(
+            title='Title', content='Content', owner=self.user)
+        self.answer = Answer.objects.create(
+            question=self.question, content='Answer', owner=self.user)
+        self.comment = Comment.objects.create(
+            answer=self.answer, content='Comment', owner=self.user)
+
+    def _last_activity(self):
+        return Question.objects.values_list('last_activity', flat=True) \
+            .get(pk=self.question.pk)
+
+    def assertTouched(self, change):
+        """
+        Asserts that a change records activity on the question
+        """
+        before = self._last_activity()
+        change()
+        self.assertGreater(self._last_activity(), before)
+
+    def test_activity_recorded(self):
+        """
+        Tests that changes to any post of the thread record activity on its
+        question
+        """
+        self.assertTouched(self.comment.save)
+        self.assertTouched(lambda: cast_vote(self.user, 'comment',
+                                             self.comment.pk, True))
+        self.assertTouched(lambda: set_best_answer(self.answer, True))
+        self.assertTouched(lambda: self.question.tag.add('tag'))
+        self.assertTouched(self.comment.delete)
+        self.assertTouched(self.answer.delete)
+        self.assertEqual(Question.objects.get(pk=self.question.pk)
+                         .num_answers, 0)
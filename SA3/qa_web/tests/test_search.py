@@ -0,0 +1,141 @@
+"""
+Submodule that defines test cases to be ran for the search backends
+"""
+
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from haystack import connections
+from haystack.query import SQ, SearchQuerySet
+from qa_web.models import Answer, Question, User
+from qa_web.search.benchmark import QUERY_KINDS, CorpusGenerator, \
+    benchmark_backend, temporary_backend
+
+credentials = {'username': 'test', 'password': 'test'}
+
+
+class FTS5BackendTest(TestCase):
+    """Test cases for the SQLite FTS5 search backend"""
+
+    def setUp(self):
+        """
+        Method that sets up questions indexed in an FTS5 index
+        """
+        user = User.objects.create_user(**credentials)
+        other = User.objects.create_user(username='other', password='test')
+        self.first = Question.objects.create(
+            title="Capybara habitat", content="Where do capybaras live?",
+            owner=user)
+        self.second = Question.objects.create(
+            title="Capybara diet", content="What do they eat?", owner=other)
+        Answer.objects.create(content="Capybaras eat grass and capybara "
+                                      "pellets", owner=user,
+                              question=self.second)
+        Question.objects.update(creation_date=timezone.now())
+        Question.objects.filter(pk=self.first.pk).update(
+            creation_date=timezone.now() - timedelta(days=10))
+
+        context = temporary_backend('fts5')
+        self.alias, _ = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        self.backend = connections[self.alias].get_backend()
+        self.index = connections[self.alias].get_unified_index() \
+            .get_index(Question)
+        self.backend.update(self.index, self.index.index_queryset())
+
+    def _search(self):
+        """
+        Helper method that starts a search on the FTS5 index
+        """
+        return SearchQuerySet(using=self.alias).models(Question)
+
+    def test_ranked_search(self):
+        """
+        Tests that results are ranked with BM25 and highlighted
+        """
+        results = list(self._search().auto_query('capybara').highlight())
+        self.assertEqual(sorted(int(result.pk) for result in results),
+                         [self.first.id, self.second.id])
+        self.assertGreater(results[0].score, results[1].score)
+        self.assertIn('<em>Capybara</em>',
+                      results[0].highlighted['text'][0])
+        results = self._search().auto_query('eat grass')
+        self.assertEqual(results[0].owner, 'other')
+        self.assertEqual(self._search().auto_query('capybara -grass')[0].pk,
+                         str(self.first.id))
+        self.assertEqual(self._search().auto_query('"capybara diet"')
+                         .count(), 1)
+
+    def test_field_filters(self):
+        """
+        Tests filtering and sorting on the owner and creation date
+        """
+        results = self._search().filter(content='capybara', owner='test')
+        self.assertEqual([result.pk for result in results],
+                         [str(self.first.id)])
+        recent = self._search().filter(
+            content='capybara',
+            creation_date__gte=timezone.now() - timedelta(days=1))
+        self.assertEqual([result.pk for result in recent],
+                         [str(self.second.id)])
+        ordered = self._search().filter(content='capybara') \
+            .order_by('creation_date')
+        self.assertEqual([result.pk for result in ordered],
+                         [str(self.first.id), str(self.second.id)])
+        self.assertEqual(self._search().filter(
+            SQ(content='habitat') | SQ(content='grass')).count(), 2)
+
+    def test_remove_and_clear(self):
+        """
+        Tests that documents are removed from the index
+        """
+        self.backend.remove(self.first)
+        self.assertEqual(self._search().auto_query('capybara').count(), 1)
+        self.backend.clear(models=[Question])
+        self.assertEqual(self._search().auto_query('capybara').count(), 0)
+
+
+class BenchmarkTest(TestCase):
+    """Test cases for the comparison of search backends"""
+
+    def test_benchmark_backend(self):
+        """
+        Tests that backends index a generated corpus and answer queries
+        """
+        for backend in ('fts5', 'whoosh'):
+            result = benchmark_backend(backend, size=20, num_queries=10,
+                                       concurrency=2)
+            self.assertEqual(result['build']['documents'], 20)
+            self.assertGreater(result['index_bytes'], 0)
+            self.assertEqual(result['latency']['count'], 10)
+            self.assertEqual(set(result['latency']['by_kind']),
+                             set(QUERY_KINDS))
+            self.assertLessEqual(result['latency']['p50_ms'],
+                                 result['latency']['p99_ms'])
+            self.assertEqual(result['throughput']['queries'], 20)
+
+    def test_corpus_is_reproducible(self):
+        """
+        Tests that the same seed generates the same corpus and queries
+        """
+        first, second = CorpusGenerator(seed=1), CorpusGenerator(seed=1)
+        self.assertEqual([q.title for q in first.questions(10)],
+                         [q.title for q in second.questions(10)])
+        self.assertEqual(first.queries(10), second.queries(10))
+
+    def test_json_output(self):
+        """
+        Tests that the command writes its results as JSON
+        """
+        with tempfile.NamedTemporaryFile(suffix='.json') as output:
+            call_command('benchmark_search', size=[10], queries=5,
+                         concurrency=0, backends=['fts5'],
+                         output=output.name, stdout=StringIO())
+            results = json.load(output)
+        self.assertEqual(len(results['runs']), 1)
+        self.assertEqual(results['runs'][0]['size'], 10)
+        self.assertIsNone(results['runs'][0]['throughput'])
@@ -2,15 +2,55 @@
 Submodule that defines test cases to be ran for views
 """
 
+import functools
+import os
 import re
+import shutil
+import tempfile
 from datetime import date
-from django.test import TestCase
-from qa_web.models import User, Question, Answer, Comment
+from io import BytesIO
+from PIL import Image
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from haystack import connections
+from qa_web import minhash
+from qa_web.duplicates import (duplicate_index, find_duplicates,
+                               store_text_signature, text_signature)
+from qa_web.middleware import query_shape
+from qa_web.models import (User, Question, Answer, Comment, Vote,
+                           QuestionChange, QuestionSignature,
+                           RelatedQuestion)
+from qa_web.pagination import ORDERING, after_cursor, encode_cursor
+from qa_web.search.cache import (bump_generation, record_question_change,
+                                 result_cache)
+from qa_web.search.queue import drain_queue
+from qa_web.search.suggest import PrefixIndex, title_index
+from qa_web.stats import get_stats
+from qa_web.thumbnails import THUMBNAIL_DIRECTORY, thumbnail_pool
 from qa_web.views import QuestionDisplayView
+from qa_web.visits import flush_visits, visit_buffer
+from qa_web.votes import cast_vote
 
 credentials = {'username': 'test', 'password': 'test'}
 
 
+def _picture(name, size=(600, 400)):
+    """
+    Helper function that generates an uploaded PNG picture
+    :param name: Name of the uploaded file
+    :param size: Width and height of the picture
+    :return: SimpleUploadedFile object
+    """
+    output = BytesIO()
+    Image.new('RGB', size, (200, 30, 30)).save(output, 'PNG')
+    return SimpleUploadedFile(name, output.getvalue(),
+                              content_type='image/png')
+
+
 def _populate_db(user, num_answers, comments_per_answer):
     """
     Helper function that populates test database with a question containing
@@ -33,16 +73,73 @@ def _populate_db(user, num_answers, comments_per_answer):
     return question
 
 
+def run_on_commit():
+    """
+    Helper function that runs the callbacks waiting for the test's
+    transaction to commit, which it never does, those of rolled back
+    savepoints being already discarded
+    """
+    callbacks, connection.run_on_commit = connection.run_on_commit, []
+    for _, callback in callbacks:
+        callback()
+
+
+def query_budget(budget, sizes=(1, 20)):
+    """
+    Decorator of view test methods taking a data size, running them once
+    per size and failing when a request they make through the test client
+    runs more queries than its budget, see qa_web.middleware
+    :param budget: Maximum number of queries of each request, the same
+    whatever the size so that queries made per row are caught
+    :param sizes: Sizes of the data created by the test method
+    """
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(self):
+            request = self.client.request
+
+            def budgeted_request(**kwargs):
+                response = request(**kwargs)
+                stats = response.query_stats
+                self.assertLessEqual(
+                    stats.count, budget,
+                    '{} ran {} queries, over its budget of {}. Duplicated '
+                    'queries: {}'.format(kwargs['PATH_INFO'], stats.count,
+                                         budget, stats.duplicated_shapes()))
+                return response
+
+            self.client.request = budgeted_request
+            try:
+                for size in sizes:
+                    with self.subTest(size=size):
+                        test(self, size)
+            finally:
+                del self.client.request
+        return wrapper
+    return decorator
+
+
 class ViewTest(TestCase):
     """This class contains test methods for view functions"""
 
     def setUp(self):
         """
         Method that sets up the test case environment for
-        testing of qa_web core functionalities
+        testing of qa_web core functionalities, visits being only flushed
+        when the tests do so
         """
+        visit_buffer.clear()
         User.objects.create_user(**credentials)
 
+    def tearDown(self):
+        """
+        Discards visits left in the buffer so that they are never flushed
+        outside of the test database, and duplicates of questions which were
+        rolled back
+        """
+        visit_buffer.clear()
+        duplicate_index.clear()
+
     def _login(self):
         """
         Helper method that logs in the user with global credentials
@@ -119,6 +216,42 @@ class ViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Enter a valid date.")
 
+    def test_uploading_profile_picture(self):
+        """
+        Tests that uploaded pictures are stored under the hash of their
+        content and displayed from their thumbnail once generated
+        """
+        cache.clear()
+        self._login()
+        values = {
+            'prename': 'Test', 'surname': 'User', 'email': 'test@example.com',
+            'age': '23', 'birthday': '1960-01-01', 'motherland': 'Test',
+            'school': 'Test', 'major': 'Test', 'city': 'Test'
+        }
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        with override_settings(MEDIA_ROOT=media_root):
+            for _ in range(2):
+                values['image'] = _picture('photo.png')
+                self.client.post('/edit_profile/', data=values)
+            user = User.objects.get_by_natural_key(credentials['username'])
+            self.assertRegex(user.image.name, r'^profile_img/[0-9a-f]{64}\.png$')
+            # Identical uploads share the same file
+            self.assertEqual(os.listdir(os.path.join(media_root,
+                                                     'profile_img')),
+                             [os.path.basename(user.image.name)])
+
+            response = self.client.get('/profile/{}/'.format(user.id))
+            self.assertContains(response, user.image.url)
+            self.assertEqual(thumbnail_pool.submit(user.image.name).result(),
+                             len(settings.THUMBNAIL_SIZES))
+            # Generated thumbnails are recorded, the storage is not checked
+            # again
+            shutil.rmtree(os.path.join(media_root, THUMBNAIL_DIRECTORY))
+            response = self.client.get('/profile/{}/'.format(user.id))
+            self.assertContains(response, '_256.jpg')
+            self.assertContains(response, '_32.jpg')  # Navbar
+
     def test_displaying_profile(self):
         """
         Tests the opening of a user profile page
@@ -133,8 +266,99 @@ class ViewTest(TestCase):
         self.assertIsNotNone(question)
         response = self.client.get('/profile/{}/'.format(user.id))
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.context['answers'].count(), num_answers)
-        self.assertEqual(response.context['questions'].count(), 1)
+        self.assertEqual(len(response.context['answers']), num_answers)
+        self.assertEqual(len(response.context['questions']), 1)
+        self.assertContains(response, 'Reputation: 0')
+        self.assertContains(response, 'Answers: {}'.format(num_answers))
+
+    def test_profile_query_count(self):
+        """
+        Tests that displaying a profile runs the same number of queries no
+        matter how many posts the user made
+        """
+        user = User.objects.get_by_natural_key(credentials['username'])
+        other = User.objects.create_user(username='other', password='other')
+        query_counts = []
+        for num_posts in (1, 10):
+            question = _populate_db(other, num_posts, 0)
+            Answer.objects.bulk_create([
+                Answer(content="answer", owner=user, question=question)
+                for i in range(num_posts)])
+            Comment.objects.bulk_create(
+                [Comment(content="comment", owner=user, question=question)
+                 for i in range(num_posts)] +
+                [Comment(content="comment", owner=user, answer=answer)
+                 for answer in Answer.objects.filter(owner=other)])
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get('/profile/{}/'.format(user.id))
+            query_counts.append(len(context.captured_queries))
+
+        self.assertContains(response, "other&#39;s question")
+        self.assertContains(response, "other&#39;s answer")
+        self.assertContains(response, 'href="/questions/{}"'
+                            .format(question.id))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_profile_deleted_parent_owner(self):
+        """
+        Tests that comments on the posts of a deleted user are displayed
+        """
+        user = User.objects.get_by_natural_key(credentials['username'])
+        other = User.objects.create_user(username='other', password='other')
+        question = _populate_db(other, 0, 0)
+        Comment.objects.create(content="comment", owner=user,
+                               question=question)
+        other.delete()
+        response = self.client.get('/profile/{}/'.format(user.id))
+        self.assertContains(response, "a deleted user&#39;s question")
+        data = self.client.get('/profile/{}/activity/'.format(user.id),
+                               {'type': 'comment'}).json()
+        self.assertEqual(data['posts'][0]['title'],
+                         "a deleted user's question")
+
+    @override_settings(PROFILE_PAGE_SIZE=3)
+    def test_profile_activity_pages(self):
+        """
+        Tests that the profile only displays the first page of each list and
+        that following pages, including the merged activity stream, are
+        loaded from the activity endpoint
+        """
+        user = User.objects.get_by_natural_key(credentials['username'])
+        question = _populate_db(user, 4, 1)
+        response = self.client.get('/profile/{}/'.format(user.id))
+        self.assertEqual(len(response.context['answers']), 3)
+        self.assertEqual(len(response.context['comments']), 3)
+        self.assertIsNone(response.context['questions_cursor'])
+        # Comments were created last, each after its answer
+        self.assertEqual(
+            [post.post_type for post in response.context['activity']],
+            ['comment', 'answer', 'comment'])
+
+        url = '/profile/{}/activity/'.format(user.id)
+        data = self.client.get(url, {
+            'type': 'answer',
+            'cursor': response.context['answers_cursor']}).json()
+        self.assertEqual([post['content'] for post in data['posts']],
+                         ['answer content 0'])
+        self.assertEqual(data['posts'][0]['title'], question.title)
+        self.assertIsNone(data['next_cursor'])
+
+        posts, cursor = [], response.context['activity_cursor']
+        while cursor:
+            data = self.client.get(url, {'cursor': cursor}).json()
+            posts.extend(data['posts'])
+            cursor = data['next_cursor']
+        self.assertEqual([post['type'] for post in posts],
+                         ['answer', 'comment', 'answer', 'comment', 'answer',
+                          'question'])
+        self.assertEqual(posts[-1]['url'],
+                         '/questions/{}/'.format(question.id))
+
+        self.assertEqual(self.client.get(url, {'type': 'vote'}).status_code,
+                         404)
+        self.assertEqual(self.client.get(url, {'cursor': 'x'}).status_code,
+                         404)
 
     def test_signup(self):
         """
@@ -185,6 +409,81 @@ class ViewTest(TestCase):
         response = self.client.post('/questions/', data=form_data)
         self.assertTemplateUsed(response, 'qa_web/posting_question.html')
 
+    def test_asking_duplicate_question(self):
+        """
+        Tests that likely duplicates are suggested before a question is
+        created, and that it can be posted anyway
+        """
+        user = User.objects.get(pk=1)
+        original = Question.objects.create(
+            title="How to reverse a list in python",
+            content="What is the fastest way to reverse a python list in "
+                    "place without copying it?", owner=user)
+        Question.objects.create(title="Unrelated", content="Sourdough bread",
+                                owner=user)
+        # Their signatures are stored once committed, for qa_web.related to
+        # compute the rest
+        run_on_commit()
+        self.assertTrue(QuestionSignature.objects.get(pk=original.pk).stale)
+        self._login()
+        form_data = {
+            'title': 'How to reverse a list in python?',
+            'content': "What is the fastest way to reverse a python list "
+                       "in place without copying it",
+            'tag': 'python'
+        }
+        response = self.client.post('/questions/', data=form_data)
+        self.assertTemplateUsed(response, 'qa_web/posting_question.html')
+        self.assertEqual(response.context['duplicates'], [original])
+        self.assertContains(response, 'name="ignore_duplicates"')
+        self.assertEqual(Question.objects.count(), 2)
+
+        form_data['ignore_duplicates'] = '1'
+        response = self.client.post('/questions/', data=form_data)
+        self.assertRedirects(
+            response, '/questions/{}/'.format(Question.objects.last().id))
+        self.assertEqual(Question.objects.count(), 3)
+        # The new question is itself indexed once committed
+        self.assertEqual(len(duplicate_index), 2)
+        run_on_commit()
+        self.assertEqual(len(duplicate_index), 3)
+
+    @override_settings(QUESTION_INDEX_SYNC_INTERVAL=0)
+    def test_duplicates_other_process(self):
+        """
+        Tests that the changes of another process are applied from the
+        stored signatures of the changed questions, questions without any
+        being left out rather than hashed
+        """
+        user = User.objects.get(pk=1)
+        title, content = "Reverse a list", "In python without copying it"
+        self.assertEqual(find_duplicates(title, content), [])
+        # Created without the signal receivers of this process
+        Question.objects.bulk_create([
+            Question(title=title, content=content, owner=user),
+            Question(title=title, content=content, owner=user)])
+        signed, unsigned = Question.objects.order_by('id')
+        store_text_signature(signed.pk, text_signature(title, content))
+        record_question_change(signed.pk)
+        record_question_change(unsigned.pk)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(find_duplicates(title, content), [signed])
+        self.assertFalse(any('"qa_web_question"."content"' in query['sql']
+                             for query in queries.captured_queries))
+
+    def test_duplicates_bucket_limit(self):
+        """
+        Tests that questions sharing a crowded bucket are still compared,
+        from the most recently indexed ones
+        """
+        index = minhash.LSHIndex(4)
+        values = text_signature("Reverse a list", "In python")
+        for question_id in range(1, 5):
+            index.add(question_id, values)
+        self.assertEqual(index.candidates(values, max_per_bucket=2), {3, 4})
+        self.assertEqual(index.query(values, 10, max_per_bucket=2),
+                         [(3, 1.0), (4, 1.0)])
+
     def test_answers_simple(self):
         """
         Tests the display of answers and comments on questions page
@@ -206,6 +505,57 @@ class ViewTest(TestCase):
             response, 'Be the first to answer this question!')
         self.assertFalse(response.context['bestAnswer'])
 
+    def test_answers_query_count(self):
+        """
+        Tests that displaying a thread runs the same number of queries no
+        matter how many answers, comments and votes it holds
+        """
+        user = User.objects.get(pk=1)
+        self._login()
+        query_counts = []
+        for num_answers, comments_per_answer in [(1, 1), (10, 5)]:
+            question = _populate_db(user, num_answers, comments_per_answer)
+            Comment.objects.create(content="question comment", owner=user,
+                                   question=question)
+            best_answer = Answer.objects.filter(question=question).first()
+            best_answer.correct_answer = True
+            best_answer.save()
+            Vote.objects.create(user=user, question=question, positive=True)
+            for answer in Answer.objects.filter(question=question):
+                Vote.objects.create(user=user, answer=answer, positive=False)
+            for comment in Comment.objects.filter(answer__question=question):
+                Vote.objects.create(user=user, comment=comment, positive=True)
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    '/questions/{}/'.format(question.id))
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.context['bestAnswer'])
+            self.assertTrue(response.context['pos_v_q'])
+            self.assertEqual(len(response.context['neg_v_a']), num_answers)
+            query_counts.append(len(context.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_answers_related_questions(self):
+        """
+        Tests that the precomputed related questions of a thread are
+        displayed from a single query
+        """
+        user = User.objects.get(pk=1)
+        question = _populate_db(user, 1, 1)
+        related = Question.objects.create(
+            title="Related question", content="Test content", owner=user)
+        RelatedQuestion.objects.create(question=question, related=related,
+                                       similarity=0.5)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/questions/{}/'.format(question.id))
+        self.assertEqual(response.context['related_questions'], [related])
+        self.assertContains(response, 'href="/questions/{}/"'
+                            .format(related.id))
+        self.assertEqual(len([query for query in context.captured_queries
+                              if 'relatedquestion' in query['sql']]), 1)
+
     def test_answers_select_best(self):
         """
         Tests the process of selecting and deselecting a best answer
@@ -283,6 +633,35 @@ class ViewTest(TestCase):
             response = self.client.get('/questions/{}/'.format(question.id))
 
         self.assertContains(response, '{} visits'.format(amount))
+        # Visits are buffered until flushed to the database in one update
+        self.assertEqual(Question.objects.get(pk=question.id).visits, 0)
+        self.assertEqual(flush_visits(), amount)
+        self.assertEqual(Question.objects.get(pk=question.id).visits, amount)
+        response = self.client.get('/questions/{}/'.format(question.id))
+        self.assertContains(response, '{} visits'.format(amount + 1))
+
+    def test_visits_flush_failure(self):
+        """
+        Tests that visits which could not be written are logged and kept
+        pending without failing the request
+        """
+        def failing_update(execute, sql, params, many, context):
+            if sql.startswith('UPDATE') and '"visits"' in sql:
+                raise DatabaseError('database is locked')
+            return execute(sql, params, many, context)
+
+        user = User.objects.get(pk=1)
+        question = _populate_db(user, 0, 0)
+        self._login()
+        url = '/questions/{}/'.format(question.id)
+        with self.settings(VISITS_FLUSH_THRESHOLD=1), \
+                connection.execute_wrapper(failing_update), \
+                self.assertLogs('qa_web.visits', 'ERROR'):
+            response = self.client.get(url)
+        self.assertContains(response, '1 visits')
+        self.assertEqual(visit_buffer.pending(question.id), 1)
+        self.assertEqual(flush_visits(), 1)
+        self.assertEqual(Question.objects.get(pk=question.id).visits, 1)
 
     def test_ordering_answers(self):
         """
@@ -379,6 +758,16 @@ class ViewTest(TestCase):
         self.assertEqual(response.json(), {
             'id': 'score_{}_comment'.format(question.id), 'new_score': 1})
 
+    def test_vote_missing_post(self):
+        """
+        Tests voting on a post that does not exist
+        """
+        self._login()
+        for button in ['upvote_42_question', 'downvote_42_answer',
+                       'upvote_42_comment', 'upvote_42_other']:
+            response = self.client.post('/vote/', data={'button': button})
+            self.assertEqual(response.status_code, 404)
+
     def test_question_comment(self):
         """
         Tests the process of posting a comment for a
@@ -477,13 +866,92 @@ class ViewTest(TestCase):
             '/questions/{}/edit_answers/{}/'.format(question.id, answer.id))
         self.assertEqual(response.status_code, 200)
         values = {
-            'content': 'New content displayed!'
+            'content': 'New content *displayed*!'
         }
         self.client.post(
             '/questions/{}/edit_answers/{}/'.format(question.id, answer.id),
             data=values)
         self.assertEqual(Answer.objects.get(
             pk=answer.id).content, values['content'])
+        response = self.client.get('/questions/{}/'.format(question.id))
+        self.assertContains(response, 'New content <em>displayed</em>!')
+
+    def test_thread_not_modified(self):
+        """
+        Tests that the thread page is answered with a 304 response until
+        the thread changes or another user views it
+        """
+        self._login()
+        user = User.objects.get_by_natural_key(credentials['username'])
+        question = _populate_db(user, 2, 1)
+        url = '/questions/{}/'.format(question.id)
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # Only the question's last activity is read, the thread itself is
+        # not loaded
+        self.assertFalse(any('"qa_web_answer"' in query['sql'] or
+                             '"qa_web_userstats"' in query['sql']
+                             for query in queries.captured_queries))
+        # Dates alone do not validate the page
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+
+        # Votes elsewhere change the reputation of the displayed owners
+        other = _populate_db(user, 0, 0)
+        cast_vote(user, 'question', other.id, True)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # Voting on a comment of an answer changes the thread
+        comment = Comment.objects.first()
+        self.client.post('/vote/', data={
+            'button': 'upvote_{}_comment'.format(comment.id)})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        etag = response['ETag']
+
+        # So does answering, the answer being displayed
+        self.client.post(url, data={'answer_form': '',
+                                    'content': 'A new answer'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, 'A new answer')
+        etag = response['ETag']
+
+        # Users see their own votes and permissions
+        self.client.logout()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_listing_not_modified(self):
+        """
+        Tests that the listing pages are answered with a 304 response until
+        one of their questions changes
+        """
+        cache.clear()
+        user = User.objects.get_by_natural_key(credentials['username'])
+        question = _populate_db(user, 1, 0)
+        question.tag.add('python')
+        for url in ('/question_index/', '/tag/python/'):
+            response = self.client.get(url)
+            etag = response['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            answer = Answer.objects.create(content='New answer', owner=user,
+                                           question=question)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            etag = response['ETag']
+            # Deleting the answer does not leave the question unchanged
+            answer.delete()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
 
     def test_quick_search(self):
         """
@@ -505,6 +973,7 @@ class QuestionDisplayViewTest(TestCase):
         testing of questions display page
         """
         User.objects.create_user(**credentials)
+        cache.clear()
 
     def test_pagination(self):
         """
@@ -540,6 +1009,73 @@ class QuestionDisplayViewTest(TestCase):
             '/question_index/', data={'question_page': 5})
         self.assertEqual(response.status_code, 200)
 
+    def test_cursor_pagination(self):
+        """
+        Tests that following the cursor of a page gives the same page as
+        the page number while only counting questions once
+        """
+        user = User.objects.get(pk=1)
+        num_questions = 25
+        for i in range(num_questions):
+            _populate_db(user, 1, 0)
+
+        response = self.client.get('/question_index/')
+        first_page = response.context['latest_current_page']
+        self.assertIsNotNone(first_page.next_cursor)
+
+        response = self.client.get('/question_index/', data={
+            'question_page': 2, 'after': first_page.next_cursor})
+        cursor_page = response.context['latest_current_page']
+        response = self.client.get('/question_index/',
+                                   data={'question_page': 2})
+        number_page = response.context['latest_current_page']
+        self.assertEqual(cursor_page.number, 2)
+        self.assertEqual(list(cursor_page), list(number_page))
+        self.assertEqual(response.context['left'], range(1, 2))
+        self.assertEqual(response.context['right'], range(3, 4))
+        self.assertNotIn(first_page[0], cursor_page)
+
+        response = self.client.get('/question_index/', data={
+            'question_page': 3, 'after': cursor_page.next_cursor})
+        last_page = response.context['latest_current_page']
+        self.assertEqual(len(last_page), num_questions % 10)
+        self.assertIsNone(last_page.next_cursor)
+
+        # Total number of questions is cached
+        with CaptureQueriesContext(connection) as context:
+            self.client.get('/question_index/', data={'after': 'malformed'})
+        count_query = 'SELECT COUNT(*) AS "__count" FROM "qa_web_question"'
+        self.assertFalse(any(query['sql'] == count_query
+                             for query in context.captured_queries))
+
+    def test_listing_without_aggregates(self):
+        """
+        Tests that listed questions display their tags without aggregating
+        the tagging table
+        """
+        _populate_db(User.objects.get(pk=1), 0, 0).tag.add('python')
+        _populate_db(User.objects.get(pk=1), 0, 0)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/question_index/')
+        self.assertContains(response, 'tag:', count=1)
+        self.assertFalse(any('GROUP BY' in query['sql']
+                             for query in context.captured_queries))
+
+    def test_cursor_index_seek(self):
+        """
+        Tests that the page following a cursor is read by seeking the index
+        on the questions' creation date rather than scanning it
+        """
+        question = _populate_db(User.objects.get(pk=1), 0, 0)
+        queryset = after_cursor(Question.objects.order_by(*ORDERING),
+                                encode_cursor(question))[:10]
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertIn('SEARCH', plan)
+        self.assertIn('question_recent_idx', plan)
+
 
 class QuestionsByTagViewTest(TestCase):
     """Test cases for QuestionByTagView"""
@@ -569,3 +1105,248 @@ class QuestionsByTagViewTest(TestCase):
         self.assertEqual(len(response.context['latest_current_page']), 4)
         response = self.client.get('/tag/test/')
         self.assertEqual(len(response.context['latest_current_page']), 10)
+
+        # The sidebar lists tags from the most used with their usage
+        tags = [(usage.tag.slug, usage.num_questions)
+                for usage in response.context['tags']]
+        self.assertEqual(tags, [('test', 10), ('other', 4)])
+        Question.objects.last().delete()  # tagged with 'other'
+        response = self.client.get('/question_index/')
+        tags = [(usage.tag.slug, usage.num_questions)
+                for usage in response.context['tags']]
+        self.assertEqual(tags, [('test', 9), ('other', 3)])
+
+
+class SearchViewTest(TestCase):
+    """Test cases for the cached search view"""
+
+    def setUp(self):
+        """
+        Method that sets up the test case environment for
+        testing of searches
+        """
+        user = User.objects.create_user(**credentials)
+        for i in range(3):
+            Question.objects.create(title="Okapi {}".format(i),
+                                    content="Test content", owner=user)
+        drain_queue()
+        result_cache.clear()
+
+    def test_cached_search(self):
+        """
+        Tests that repeated searches are served from the cache until the
+        index is written to
+        """
+        response = self.client.get('/search/', {'q': 'okapi'})
+        self.assertEqual(len(response.context['page'].object_list), 3)
+
+        # Equivalent queries are answered without searching the index
+        connections['default'].get_backend().clear(models=[Question])
+        with self.assertNumQueries(2):  # Generation and results
+            response = self.client.get('/search/', {'q': '  OKAPI '})
+        self.assertEqual(
+            sorted(result.object.title
+                   for result in response.context['page'].object_list),
+            ['Okapi 0', 'Okapi 1', 'Okapi 2'])
+
+        bump_generation()
+        response = self.client.get('/search/', {'q': 'okapi'})
+        self.assertEqual(len(response.context['page'].object_list), 0)
+
+
+class SuggestViewTest(TestCase):
+    """Test cases for the type-ahead suggestion of titles"""
+
+    def setUp(self):
+        """
+        Method that sets up the test case environment for
+        testing of suggestions
+        """
+        title_index.clear()
+        self.addCleanup(title_index.clear)
+        self.user = User.objects.create_user(**credentials)
+        for title in ["Python decorators", "python generators", "Django"]:
+            Question.objects.create(title=title, content="Test content",
+                                    owner=self.user)
+
+    def _suggest(self, prefix):
+        """
+        Helper method that requests suggestions
+        :return: List of suggested titles
+        """
+        response = self.client.get('/suggest/', {'q': prefix})
+        return [suggestion['title']
+                for suggestion in response.json()['suggestions']]
+
+    def test_suggest(self):
+        """
+        Tests that titles starting with a prefix are suggested as questions
+        are created, edited and deleted
+        """
+        self.assertEqual(self._suggest('PYTH'),
+                         ["Python decorators", "python generators"])
+        self.assertEqual(self._suggest(''), [])
+
+        question = Question.objects.get(title="Django")
+        question.title = "Python and Django"
+        question.save()
+        Question.objects.get(title="python generators").delete()
+        Question.objects.create(title="Pythonic code", content="Test",
+                                owner=self.user)
+        # Changes are indexed once committed
+        self.assertEqual(len(self._suggest('python')), 2)
+        run_on_commit()
+        # Changes of this process are applied without any query
+        with self.assertNumQueries(0):
+            self.assertEqual(self._suggest('python'),
+                             ["Python and Django", "Python decorators",
+                              "Pythonic code"])
+
+    def test_rolled_back(self):
+        """
+        Tests that titles of questions rolled back are never suggested
+        """
+        self._suggest('python')
+        with self.assertRaises(ValueError), transaction.atomic():
+            Question.objects.create(title="Python rolled back",
+                                    content="Test", owner=self.user)
+            raise ValueError
+        run_on_commit()
+        self.assertEqual(self._suggest('python'),
+                         ["Python decorators", "python generators"])
+
+    @override_settings(QUESTION_INDEX_SYNC_INTERVAL=0)
+    def test_other_process(self):
+        """
+        Tests that the changes of another process are applied from the
+        changed questions only, the index being loaded again once they are
+        no longer kept
+        """
+        self._suggest('python')
+        # Created and deleted without the signal receivers of this process
+        Question.objects.bulk_create([
+            Question(title="Python elsewhere", content="Test",
+                     owner=self.user)])
+        record_question_change(Question.objects.last().id)
+        question = Question.objects.get(title="python generators")
+        Question.objects.filter(pk=question.pk).delete()
+        record_question_change(question.pk)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._suggest('python'),
+                             ["Python decorators", "Python elsewhere"])
+        self.assertTrue(any('"qa_web_questionchange"."generation" >'
+                            in query['sql']
+                            for query in queries.captured_queries))
+        self.assertFalse(any('"qa_web_question"."title"' in query['sql'] and
+                             '"qa_web_questionchange"' not in query['sql']
+                             for query in queries.captured_queries))
+
+        Question.objects.bulk_create([
+            Question(title="Python pruned", content="Test",
+                     owner=self.user)])
+        record_question_change(Question.objects.last().id)
+        # Only found by loading every title again
+        QuestionChange.objects.filter(
+            generation=title_index.generation + 1).delete()
+        record_question_change(Question.objects.get(title="Django").id)
+        self.assertEqual(self._suggest('python p'), ["Python pruned"])
+
+    def test_bounded_index(self):
+        """
+        Tests that only the titles of the most recent questions are kept
+        """
+        index = PrefixIndex(max_titles=2, title_length=5)
+        index.load([(1, "abcdefgh"), (2, "abd"), (3, "Abc")])
+        self.assertEqual(index.suggest('ab', 10), [(3, "Abc"), (2, "abd")])
+        index.add(4, "abz")
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.suggest('ab', 10), [(3, "Abc"), (4, "abz")])
+
+
+class QueryBudgetTest(TestCase):
+    """Test cases for the number of queries run by the main views"""
+
+    def setUp(self):
+        """
+        Method that logs in a user, starting from empty caches
+        """
+        cache.clear()
+        visit_buffer.clear()
+        self.user = User.objects.create_user(**credentials)
+        self.other = User.objects.create_user(username='other',
+                                              password='other')
+        self.assertTrue(self.client.login(**credentials))
+
+    def tearDown(self):
+        """
+        Discards visits and duplicates left in memory
+        """
+        visit_buffer.clear()
+        duplicate_index.clear()
+
+    def test_instrumentation(self):
+        """
+        Tests that the queries of a request are reported in headers when
+        debugging and logged otherwise
+        """
+        with self.settings(DEBUG=True):
+            response = self.client.get('/question_index/')
+        self.assertEqual(response['X-Query-Count'],
+                         str(response.query_stats.count))
+        self.assertIn('X-Query-Time', response)
+        self.assertEqual(response['X-Query-Duplicates'], '0')
+        with self.assertLogs('qa_web.queries', 'INFO') as logs:
+            response = self.client.get('/question_index/')
+        self.assertNotIn('X-Query-Count', response)
+        self.assertIn('view=question_index method=GET status=200 '
+                      'queries={} '.format(response.query_stats.count),
+                      logs.output[0])
+        self.assertEqual(query_shape('SELECT 1 WHERE id IN (%s, %s, %s)'),
+                         query_shape('SELECT 1 WHERE id IN (%s)'))
+
+    @query_budget(8)
+    def test_thread(self, size):
+        """
+        Tests the queries of the thread page with the user's votes on every
+        post
+        """
+        question = _populate_db(self.other, size, 2)
+        question.tag.add('python', 'django')
+        Vote.objects.create(user=self.user, question=question, positive=True)
+        for answer in Answer.objects.filter(question=question):
+            Vote.objects.create(user=self.user, answer=answer, positive=True)
+            Comment.objects.create(content='comment', owner=self.user,
+                                   question=question)
+        response = self.client.get('/questions/{}/'.format(question.id))
+        self.assertEqual(response.status_code, 200)
+
+    @query_budget(6)
+    def test_profile(self, size):
+        """
+        Tests the queries of the profile page of a user answering and
+        commenting on another's questions
+        """
+        question = _populate_db(self.other, 0, 0)
+        for _ in range(size):
+            answer = Answer.objects.create(content='answer', owner=self.user,
+                                           question=question)
+            Comment.objects.create(content='comment', owner=self.user,
+                                   answer=answer)
+            Comment.objects.create(content='comment', owner=self.user,
+                                   question=question)
+        response = self.client.get('/profile/{}/'.format(self.user.id))
+        self.assertEqual(response.status_code, 200)
+
+    @query_budget(8)
+    def test_listings(self, size):
+        """
+        Tests the queries of the listing pages with tagged questions
+        """
+        # Site totals are read from their row, only counted once per
+        # SITE_STATS_TTL
+        get_stats()
+        for _ in range(size):
+            _populate_db(self.other, 1, 0).tag.add('python')
+        for url in ('/question_index/', '/tag/python/'):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
@@ -0,0 +1,104 @@
+"""Loading of a question's thread for display.
+
+A thread is loaded with a fixed number of queries no matter how many answers,
+comments or votes it contains:
+    - every answer of the question along with its owner and their statistics
+    - every comment on the question or one of its answers along with its owner
+      and their statistics
+    - the current user's votes on any post of the thread
+"""
+from django.db.models import Q
+from qa_web.models import Answer, Comment, Vote
+
+DEFAULT_ORDERING = 'highestScore'
+
+# Sorting options available on the thread page, mapped to the ordering of
+# the answers' queryset. Unknown options fall back to the most recent first.
+# Each ordering follows one of Answer's indexes so that the answers of a
+# question are read in order from the index rather than sorted. Best answers
+# are separated from the others once loaded.
+ANSWER_ORDERINGS = {
+    'highestScore': ('-correct_answer', '-score'),
+    'lowestScore': ('correct_answer', 'score'),
+    'leastRecent': ('creation_date',),
+    'mostRecent': ('-creation_date',),
+}
+
+
+class Thread:
+    """A question along with all of its answers, comments and the votes cast
+    by a user on any of these posts.
+
+    Answers of the thread hold their own comments in `thread_comments`.
+    Votes are keyed by `(post_type, post_id)` where `post_type` is one of
+    `'question'`, `'answer'` or `'comment'`, the value being the vote's
+    direction.
+    """
+
+    def __init__(self, question, answers, best_answer, comments, votes):
+        self.question = question
+        self.answers = answers
+        self.best_answer = best_answer
+        self.comments = comments
+        self.votes = votes
+
+    def has_voted(self, post_type, post_id, positive):
+        """Whether the user voted in the given direction on a post."""
+        return self.votes.get((post_type, post_id)) is positive
+
+    def voted_ids(self, post_type, positive):
+        """Set of ids of the posts of a type voted on in a given direction."""
+        return {post_id for (type_, post_id), direction in self.votes.items()
+                if type_ == post_type and direction is positive}
+
+
+def load_thread(question, user, ordering=DEFAULT_ORDERING):
+    """Loads the thread of a question for display.
+
+    :param question: Question at the head of the thread
+    :param user: User viewing the thread, votes are only loaded for
+                 authenticated users
+    :param ordering: Key of `ANSWER_ORDERINGS` to sort answers with
+    :return: Thread instance
+    """
+    order_by = ANSWER_ORDERINGS.get(ordering, ANSWER_ORDERINGS['mostRecent'])
+    all_answers = list(
+        Answer.objects.filter(question=question).select_related('owner__stats')
+        .order_by(*order_by))
+
+    best_answer = None
+    answers = []
+    for answer in all_answers:
+        answer.thread_comments = []
+        if not answer.correct_answer:
+            answers.append(answer)
+        elif best_answer is None or answer.id > best_answer.id:
+            best_answer = answer
+
+    answers_by_id = {answer.id: answer for answer in all_answers}
+    question_comments = []
+    comments = Comment.objects.filter(
+        Q(question=question) | Q(answer__question=question)) \
+        .select_related('owner__stats').order_by('id')
+    for comment in comments:
+        if comment.answer_id is None:
+            question_comments.append(comment)
+        else:
+            answers_by_id[comment.answer_id].thread_comments.append(comment)
+
+    votes = {}
+    if user.is_authenticated:
+        user_votes = Vote.objects.filter(user=user).filter(
+            Q(question=question) | Q(answer__question=question) |
+            Q(comment__question=question) |
+            Q(comment__answer__question=question)) \
+            .values_list('question_id', 'answer_id', 'comment_id', 'positive')
+        for question_id, answer_id, comment_id, positive in user_votes:
+            if question_id is not None:
+                votes[('question', question_id)] = positive
+            elif answer_id is not None:
+                votes[('answer', answer_id)] = positive
+            else:
+                votes[('comment', comment_id)] = positive
+
+    return Thread(question, answers, best_answer, question_comments, votes)
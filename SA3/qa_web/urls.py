@@ -2,12 +2,12 @@
 
 from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path
 from django.conf.urls.static import static
 from qa_web import views
 
 urlpatterns = [
-    path(r'search/', include('haystack.urls')),
+    path('search/', views.search_view, name='haystack_search'),
     path('admin/', admin.site.urls),
     path('login/', views.login, name='login'),
     path('logout/', views.logout_view, name='logout'),
@@ -24,9 +24,12 @@ urlpatterns = [
     path('edit_profile/', views.edit_profile, name='edit_user_profile'),
     path('profile/<int:id_>/', views.display_profile,
          name='display_user_profile'),
+    path('profile/<int:id_>/activity/', views.profile_activity,
+         name='profile_activity'),
     path('questions/<int:id_>/delete/', views.delete, name='delete_question'),
     path('questions/<int:id_>/edit_answers/<int:a_id>/', views.edit_answers,
          name='edit_answers'),
-    path('quick_search/', views.quick_search, name='search_keyword')
+    path('quick_search/', views.quick_search, name='search_keyword'),
+    path('suggest/', views.suggest, name='suggest'),
 ]
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
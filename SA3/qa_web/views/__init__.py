@@ -8,3 +8,4 @@ from .auth import *
 from .home import *
 from .profile import *
 from .question_operations import *
+from .search import *
@@ -4,8 +4,10 @@ involving post creation, edit or deletion
 """
 
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.shortcuts import render, HttpResponseRedirect, get_object_or_404
 from django.http import HttpResponseForbidden
+from qa_web.duplicates import find_duplicates
 from qa_web.forms import QuestionsForm, EditForm
 from qa_web.models import Question, Answer
 
@@ -14,11 +16,14 @@ from qa_web.models import Question, Answer
 def questions(request):
     """Displays the form to post a question or redirects to the question's
     thread once it has been successfully created.
+    Likely duplicates of the question are suggested before it is created,
+    submitting the form again posts it anyway.
     Requires the user to be logged in.
 
     :param request: Request data provided by the WSGI
-    :return: Rendered template displaying the posting question form on a GET,
-            else redirects to the question thread
+    :return: Rendered template displaying the posting question form on a GET
+            or when duplicates are found, else redirects to the question
+            thread
     """
     if request.method == 'GET':
         return render(request, 'qa_web/posting_question.html', context={})
@@ -27,16 +32,26 @@ def questions(request):
         if form.is_valid():
             content = request.POST['content']
             title = request.POST['title']
+            if 'ignore_duplicates' not in request.POST:
+                duplicates = find_duplicates(title, content)
+                if duplicates:
+                    return render(request, 'qa_web/posting_question.html',
+                                  context={'duplicates': duplicates,
+                                           'title': title, 'content': content,
+                                           'tag': request.POST['tag']})
             tag = request.POST['tag'].split(';')
             owner = request.user
-            question = Question(content=content, title=title, owner=owner)
-            question.save()
-
-            # Since a question can be submitted with no tag, filtering empty
-            # and blank strings.
-            for each_tag in tag:
-                if each_tag.strip() != '':
-                    question.tag.add(each_tag)
+            # Tags' usage is counted within the same transaction
+            with transaction.atomic():
+                question = Question(content=content, title=title,
+                                    owner=owner)
+                question.save()
+
+                # Since a question can be submitted with no tag, filtering
+                # empty and blank strings.
+                for each_tag in tag:
+                    if each_tag.strip() != '':
+                        question.tag.add(each_tag)
 
             return HttpResponseRedirect('/questions/{q.id}/'.format(q=question))
         else:
@@ -82,7 +97,10 @@ def delete(request, id_):
     question = get_object_or_404(Question, pk=id_)
     if question.owner != request.user:
         return HttpResponseForbidden()
-    question.delete()
+    # Counters and statistics of the deleted posts' owners are updated
+    # within the same transaction
+    with transaction.atomic():
+        question.delete()
     return HttpResponseRedirect('/question_index/')
 
 
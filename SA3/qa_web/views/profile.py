@@ -3,9 +3,13 @@ Controller for profile page operations
 """
 
 from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
 from django.shortcuts import render, HttpResponseRedirect, get_object_or_404
+from qa_web.activity import (ACTIVITY_QUERYSETS, activity_page,
+                             activity_stream, merge_pages, serialize_post)
 from qa_web.forms import UserProfile
-from qa_web.models import Answer, Comment, Question, User
+from qa_web.models import User
+from qa_web.thumbnails import schedule_thumbnails, store_picture
 
 
 @login_required(login_url='/login/')
@@ -50,7 +54,13 @@ def edit_profile(request):
             user.school = form.cleaned_data.get('school')
             user.major = form.cleaned_data.get('major')
             user.city = form.cleaned_data.get('city')
-            user.image = form.cleaned_data.get('image')
+            image = form.cleaned_data.get('image')
+            if image:
+                # Stored under the hash of its content, its thumbnails are
+                # generated in the background
+                image = store_picture(image)
+                schedule_thumbnails(image)
+            user.image = image
 
             user.save()
 
@@ -61,19 +71,52 @@ def edit_profile(request):
 
 
 def display_profile(request, id_):
-    """Displays a User's profile information and recent post activity
+    """Displays a User's profile information and the first page of their
+    questions, answers, comments and of the activity stream merging them.
+    Following pages are loaded from `profile_activity`.
     Any user can look at a user's profile page
 
     :param request: Request data provided by the WSGI
     :param id_: The user to be displayed's id
     :return: Rendered template for displaying the given user's profile
     """
-    displayed_user = get_object_or_404(User, pk=id_)
-    user_questions = Question.objects.filter(owner_id=id_)
-    user_answers = Answer.objects.filter(owner_id=id_)
-    user_comments = Comment.objects.filter(owner_id=id_)
-    return render(request, 'qa_web/user_profile.html',
-                  context={'displayed_user': displayed_user,
-                           'questions': user_questions,
-                           'answers': user_answers,
-                           'comments': user_comments})
+    displayed_user = get_object_or_404(User.objects.select_related('stats'),
+                                       pk=id_)
+    context = {'displayed_user': displayed_user}
+    pages = []
+    for post_type, name in (('question', 'questions'), ('answer', 'answers'),
+                            ('comment', 'comments')):
+        posts, cursor = activity_page(post_type, id_)
+        context[name] = posts
+        context[name + '_cursor'] = cursor
+        pages.append(posts)
+    # The first page of the stream is made of the first page of each list
+    context['activity'], context['activity_cursor'] = merge_pages(pages)
+    return render(request, 'qa_web/user_profile.html', context=context)
+
+
+def profile_activity(request, id_):
+    """Receives AJAX queries for the following pages of a user's activity
+    displayed on their profile page.
+
+    :param request: Request data containing the `cursor` returned along the
+                    previous page and the `type` of posts, one of `question`,
+                    `answer` or `comment`, the merged activity stream when
+                    omitted
+    :param id_: The user's id
+    :return: JSONResponse with the page's `posts` and the `next_cursor`,
+             null on the last page
+    """
+    post_type = request.GET.get('type')
+    cursor = request.GET.get('cursor')
+    if post_type is not None and post_type not in ACTIVITY_QUERYSETS:
+        raise Http404('Unknown post type.')
+    try:
+        if post_type is None:
+            posts, next_cursor = activity_stream(id_, cursor)
+        else:
+            posts, next_cursor = activity_page(post_type, id_, cursor)
+    except ValueError:
+        raise Http404('Malformed cursor.')
+    return JsonResponse({'posts': [serialize_post(post) for post in posts],
+                         'next_cursor': next_cursor})
@@ -3,16 +3,25 @@ Controller for Q&A website additional features operations
 """
 
 from django.shortcuts import get_object_or_404, render, HttpResponseRedirect
-from django.http import JsonResponse
-from django.db.models import Count, F
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.http import Http404, JsonResponse
+from django.db import transaction
 from django.views.generic import ListView
 from django.views.decorators.csrf import csrf_exempt
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.decorators import login_required
-from taggit.models import Tag, TaggedItem
-from qa_web.models import Answer, Comment, Question, Vote
+from qa_web.conditional import listing_validators, thread_validators
+from qa_web.models import Answer, Comment, Question, TagUsage
 from qa_web.forms import AnswersForm
+from qa_web.pagination import KeysetPaginator
+from qa_web.related import related_questions
+from qa_web.reputation import set_best_answer
+from qa_web.stats import get_stats
+from qa_web.threads import DEFAULT_ORDERING, load_thread
+from qa_web.visits import visit_buffer
+from qa_web.votes import POST_TYPES, cast_vote
+
+# Maximum number of tags displayed in the listing pages' sidebar
+TAG_CLOUD_SIZE = 50
 
 def answers(request, id_):
     """Manages the different actions that occur when displaying a question:
@@ -25,31 +34,46 @@ def answers(request, id_):
     :param request: Request data provided by the WSGI
     :param id_: The question's id
     :return: Rendered template displaying the question's thread including
-            answers and comments as well as the answering/commenting form
+            answers and comments as well as the answering/commenting form,
+            or a 304 response when the client's copy is current
     """
-    question = get_object_or_404(Question, pk=id_)
+    # Validated from the question's last activity alone, before the thread
+    # is loaded
+    validators = thread_validators(id_, request.user)
+    if validators is not None:
+        response = validators.not_modified(request)
+        if response is not None:
+            if request.user.is_authenticated:
+                visit_buffer.record(id_)
+            return response
+
+    question = get_object_or_404(
+        Question.objects.select_related('owner__stats'), pk=id_)
     answer_id = [int(key.replace('select_', ''))
                  for key in request.POST.keys() if key.startswith('select_')]
     if request.method == 'POST' and 'answer_form' in request.POST:
         # Answering a question
         form = AnswersForm(request.POST)
         if form.is_valid():
-            Answer.objects.create(
-                content=request.POST['content'], owner=request.user,
-                question=question)
+            # Question counters are updated within the same transaction
+            with transaction.atomic():
+                Answer.objects.create(
+                    content=request.POST['content'], owner=request.user,
+                    question=question)
 
     elif request.method == 'POST' and 'deselect' in request.POST and \
             question.owner.id == request.user.id:
-        # Deselecting best answer
+        # Deselecting best answer, its owner's statistics are updated within
+        # the same transaction
         update_answer = Answer.objects.filter(
             question=question, correct_answer=True).last()
-        update_answer.correct_answer = False
-        update_answer.save()
+        if update_answer is not None:
+            set_best_answer(update_answer, False)
     elif answer_id and question.owner.id == request.user.id:
         # Selecting best answer
-        update_answer = Answer.objects.get(id=answer_id[0])
-        update_answer.correct_answer = True
-        update_answer.save()
+        update_answer = get_object_or_404(Answer, id=answer_id[0],
+                                          question=question)
+        set_best_answer(update_answer, True)
     elif any(key.startswith("comment_form_answer") for key in request.POST.keys()):
         # Commenting on an answer
         answer_id = [int(key.replace('comment_form_answer_', '')) for key
@@ -57,89 +81,44 @@ def answers(request, id_):
         answer = Answer.objects.get(id=answer_id[0])
         comment = Comment(content=request.POST['content'],
                           owner=request.user, answer=answer)
-        comment.save()
+        with transaction.atomic():
+            comment.save()
     elif request.method == 'POST' and 'comment_form_question' in request.POST:
         # Commenting on the question
         comment = Comment(content=request.POST['content'],
                           owner=request.user, question=question)
-        comment.save()
+        with transaction.atomic():
+            comment.save()
 
     # Ordering answers
     if request.method == 'POST' and 'sort_by_form_select' in request.POST:
         initial_select_value = request.POST['sort_by_form_select']
-        if request.POST['sort_by_form_select'] == 'lowestScore':
-            q_answers = Answer.objects.filter(question=question,
-                                              correct_answer=False)\
-                .annotate(points=F('upvotes') - F('downvotes'))\
-                .order_by('points')
-        elif request.POST['sort_by_form_select'] == 'highestScore':
-            q_answers = Answer.objects.filter(question=question,
-                                              correct_answer=False)\
-                .annotate(points=F('upvotes') - F('downvotes'))\
-                .order_by('-points')
-        elif request.POST['sort_by_form_select'] == 'leastRecent':
-            q_answers = Answer.objects.filter(
-                question=question, correct_answer=False) \
-                .order_by('creation_date')
-        else:  # Most Recent
-            q_answers = Answer.objects.filter(
-                question=question, correct_answer=False) \
-                .order_by('-creation_date')
-    else:
-        initial_select_value = "highestScore"
-        q_answers = Answer.objects.filter(question=question,
-                                          correct_answer=False)\
-            .annotate(points=F('upvotes') - F('downvotes')).order_by('-points')
-
-    q_best_answer = Answer.objects.filter(question=question,
-                                          correct_answer=True)
-    q_comments = Comment.objects.filter(question=question)
-    a_comments = Comment.objects.filter(answer__question=question)
-
-    # Voting indicators
-    if request.user.is_authenticated:
-        vote_on_q = Vote.objects.filter(user=request.user, question=question)
-        votes_on_answers = Vote.objects.filter(user=request.user,
-                                               answer__in=q_answers)
-        vote_on_best_answer = Vote.objects.filter(user=request.user,
-                                                  answer_id=q_best_answer[0].id\
-                                                      if len(q_best_answer)\
-                                                      else -1)
-        votes_on_q_comments = Vote.objects.filter(user=request.user,
-                                                  comment__in=q_comments)
-        votes_on_a_comments = Vote.objects.filter(user=request.user,
-                                                  comment__in=a_comments)
-        pos_vote_q = len(vote_on_q) and vote_on_q[0].positive
-        neg_vote_q = len(vote_on_q) and not vote_on_q[0].positive
-
-        pos_vote_a = [v.answer.id for v in list(votes_on_answers) \
-                      + list(vote_on_best_answer) if v.positive]
-        neg_vote_a = [v.answer.id for v in list(votes_on_answers) \
-                      + list(vote_on_best_answer) if not v.positive]
-
-        pos_vote_c = [v.comment.id for v in list(votes_on_a_comments) \
-                      + list(votes_on_q_comments) if v.positive]
-        neg_vote_c = [v.comment.id for v in list(votes_on_a_comments) \
-                      + list(votes_on_q_comments) if not v.positive]
     else:
-        pos_vote_a, pos_vote_c, pos_vote_q = [], [], False
-        neg_vote_a, neg_vote_c, neg_vote_q = [], [], False
-
-    # Increment the visits counter of the question by one
-    if request.user.is_authenticated:
-        question.visits += 1
-        question.save()
-
-    if len(q_best_answer) > 0:
-        q_best_answer = q_best_answer.last()
-    return render(request, 'qa_web/question_thread.html',
-                  {'currentQuestion': question, 'answers': q_answers,
-                   'bestAnswer': q_best_answer, 'q_comments': q_comments,
-                   'a_comments': a_comments,
-                   'initial_select_value': initial_select_value,
-                   'pos_v_q': pos_vote_q, 'neg_v_q': neg_vote_q,
-                   'pos_v_a': pos_vote_a, 'neg_v_a': neg_vote_a,
-                   'pos_v_c': pos_vote_c, 'neg_v_c': neg_vote_c})
+        initial_select_value = DEFAULT_ORDERING
+    thread = load_thread(question, request.user, initial_select_value)
+
+    # Increment the visits counter of the question by one, the visit is
+    # buffered and written to the database in batches.
+    if request.user.is_authenticated and visit_buffer.record(question.id):
+        question.refresh_from_db(fields=['visits'])
+    question.visits += visit_buffer.pending(question.id)
+
+    response = render(
+        request, 'qa_web/question_thread.html',
+        {'currentQuestion': question, 'answers': thread.answers,
+         'bestAnswer': thread.best_answer,
+         'q_comments': thread.comments,
+         'related_questions': related_questions(question),
+         'initial_select_value': initial_select_value,
+         'pos_v_q': thread.has_voted('question', question.id, True),
+         'neg_v_q': thread.has_voted('question', question.id, False),
+         'pos_v_a': thread.voted_ids('answer', True),
+         'neg_v_a': thread.voted_ids('answer', False),
+         'pos_v_c': thread.voted_ids('comment', True),
+         'neg_v_c': thread.voted_ids('comment', False)})
+    if request.method == 'GET' and validators is not None:
+        response = validators.apply(response)
+    return response
 
 def vote(request):
     """Receives AJAX queries to vote on Posts, updates the corresponding Post
@@ -154,105 +133,124 @@ def vote(request):
         vote_direction, button_id, post_type = request.POST['button'].split(
             '_')
         vote_direction = vote_direction == 'upvote'
-        post_subclass = Question if post_type == 'question' else Answer \
-            if post_type == 'answer' else Comment
-        post = get_object_or_404(post_subclass, pk=int(button_id))
-        # Workaround to provide the correct kwarg depending on post_type
-        foreign_key_args = {post_type: post}
-        if request.user not in post.voters.all():
-            # Not yet voted on current post
-            Vote.objects.create(user=request.user, positive=vote_direction,
-                                **foreign_key_args)
-            if vote_direction:
-                post.upvotes = post.upvotes + 1
-            else:
-                post.downvotes = post.downvotes + 1
-        else:
-            # Modifying existing vote
-            last_vote = Vote.objects.get(user=request.user, **foreign_key_args)
-            if last_vote.positive == vote_direction:
-                # Vote cancelled, user pressed same button as original vote
-                last_vote.delete()
-                if vote_direction:
-                    post.upvotes = post.upvotes - 1
-                else:
-                    post.downvotes = post.downvotes - 1
-            else:
-                # Vote changed direction
-                last_vote.positive = vote_direction
-                last_vote.save()
-                if vote_direction:
-                    post.upvotes = post.upvotes + 1
-                    post.downvotes = post.downvotes - 1
-                else:
-                    post.downvotes = post.downvotes + 1
-                    post.upvotes = post.upvotes - 1
-        post.save()
-        return JsonResponse({'new_score': post.score, 'id':
-                             'score_{}_{}'.format(post.id, post_type)})
+        if post_type not in POST_TYPES:
+            raise Http404('Unknown post type.')
+        try:
+            new_score = cast_vote(request.user, post_type, int(button_id),
+                                  vote_direction)
+        except ObjectDoesNotExist:
+            raise Http404('No {} matches the given query.'.format(post_type))
+        return JsonResponse({'new_score': new_score, 'id':
+                             'score_{}_{}'.format(button_id, post_type)})
     # Accessing url without using Post or unauthenticated
     return HttpResponseRedirect('/')
 
-class QuestionDisplayView(ListView):
+def tag_cloud():
+    """Most used tags along with their number of questions, read from the
+    materialized TagUsage table.
+
+    :return: Queryset of at most `TAG_CLOUD_SIZE` TagUsage
+    """
+    return TagUsage.objects.filter(num_questions__gt=0) \
+        .exclude(tag__slug__exact='').select_related('tag') \
+        .order_by('-num_questions', '-tag_id')[:TAG_CLOUD_SIZE]
+
+
+def index_validators(view):
+    """Validators of the index of every question. Totals displayed in the
+    sidebar change along with questions being deleted or users signing
+    up, they are kept in the view's `site_stats`."""
+    view.site_stats = get_stats()
+    return listing_validators(Question.objects.all(), view.request.user,
+                              tuple(sorted(view.site_stats.items())))
+
+
+def tag_validators(view):
+    """Validators of the questions classified under the view's tag, the
+    sidebar totals being kept in the view's `site_stats`."""
+    view.site_stats = get_stats()
+    return listing_validators(
+        Question.objects.filter(tag__slug=view.kwargs['tag']),
+        view.request.user, tuple(sorted(view.site_stats.items())), count=True)
+
+
+class ConditionalListMixin:
+    """Answers GET requests with a 304 response when the client's copy of the
+    listing is current, before any question is loaded.
+
+    Views set `validators` to a function of the view returning the
+    Validators of the listing, see qa_web.conditional.
+    """
+    validators = None
+
+    def get(self, request, *args, **kwargs):
+        if self.validators is None:
+            raise ImproperlyConfigured(
+                '{} requires a definition of validators.'.format(
+                    self.__class__.__name__))
+        validators = self.validators()
+        response = validators.not_modified(request)
+        if response is None:
+            response = validators.apply(super().get(request, *args, **kwargs))
+        return response
+
+
+class QuestionDisplayView(ConditionalListMixin, ListView):
     """View for displaying the list of questions currently available."""
     model = Question
     paginate_by = 10
     context_object_name = 'questions'
     template_name = 'qa_web/question_index.html'
-    ordering = '-creation_date'
+    validators = index_validators
 
     def get_context_data(self, *args, **kwargs):
         context = super(
             QuestionDisplayView, self).get_context_data(*args, **kwargs)
 
-        context['total_question_num'] = Question.objects.count()
-        context['total_answer_num'] = Answer.objects.count()
-
-        # Try to page the question page
-        # whether the paginator is needed. It's a must.
-        context['is_paginated'] = True
-        all_questions_qs = Question.objects.order_by('-creation_date') \
-            .select_related('owner') \
-            .annotate(num_answers=Count('answer', distinct=True),
-                      num_question_comments=Count('comment', distinct=True),
-                      num_tag=Count('tag', distinct=True))
-        paginator_all_questions = Paginator(
-            all_questions_qs, QuestionDisplayView.paginate_by)
-
-        # Get question_page number from url
-        page_0 = self.request.GET.get('question_page')
-        try:
-            page_obj = paginator_all_questions.page(page_0)
-
-        except PageNotAnInteger:
-            page_obj = paginator_all_questions.page(1)
+        context['site_stats'] = self.site_stats
+        context['total_question_num'] = context['site_stats']['questions']
+        context['total_answer_num'] = context['site_stats']['answers']
 
-        except EmptyPage:  # pragma: no cover
-            page_obj = paginator_all_questions.page(
-                paginator_all_questions.num_pages)
-        context['latest_current_page'] = page_obj
+        # The page was built by paginate_queryset
+        context['latest_current_page'] = context['page_obj']
 
         # Using modified paging num
         pagination_data = self._pagination_data(
-            paginator_all_questions, page_obj, context['is_paginated'])
+            context['paginator'], context['page_obj'], context['is_paginated'])
         context.update(pagination_data)
 
         # Pass tags to html.
-        question_contenttype = ContentType.objects.get_for_model(Question)
-        items = TaggedItem.objects.filter(content_type=question_contenttype)
-        context['tags'] = Tag.objects.filter(
-            taggit_taggeditem_items__in=items).exclude(
-                slug__exact='').order_by('-id').distinct()
+        context['tags'] = tag_cloud()
 
         return context
 
     def get_queryset(self):
         queryset = super(QuestionDisplayView, self).get_queryset() \
-            .select_related('owner') \
-            .annotate(num_answers=Count('answer', distinct=True),
-                      num_question_comments=Count('comment', distinct=True))
+            .select_related('owner').prefetch_related('tag')
         return queryset
 
+    def paginate_queryset(self, queryset, page_size):
+        """Builds the requested page once, following the cursor given in
+        `after` when present, otherwise from the page number given in
+        `question_page`.
+        The number of pages is computed from the stored total of questions
+        read by the validators.
+        """
+        paginator = KeysetPaginator(queryset, page_size,
+                                    count=self.site_stats['questions'])
+        page_number = self.request.GET.get('question_page')
+        cursor = self.request.GET.get('after')
+        page = None
+        if cursor:
+            try:
+                page = paginator.page_after(cursor, page_number)
+            except ValueError:
+                # Malformed cursor, falling back to the page number
+                pass
+        if page is None:
+            page = paginator.get_page(page_number)
+        return paginator, page, page.object_list, True
+
     def _pagination_data(self, paginator, page, is_paginated):
         """to show page number like this:
         1...3 4 5- 6 7 ...9
@@ -325,17 +323,17 @@ class QuestionDisplayView(ListView):
         return context
 
 
-class QuestionsByTagView(ListView):
+class QuestionsByTagView(ConditionalListMixin, ListView):
     """View to call all the questions classified under one specific tag."""
     model = Question
     paginate_by = 10
     context_object_name = 'questions'
     template_name = 'qa_web/question_index.html'
+    validators = tag_validators
 
     def get_queryset(self, **kwargs):
         return Question.objects.order_by('-creation_date').filter(
-            tag__slug=self.kwargs['tag']) \
-            .annotate(num_answers=Count('answer', distinct=True))
+            tag__slug=self.kwargs['tag']).prefetch_related('tag')
 
     def get_context_data(self, *args, **kwargs):
         context = super(QuestionsByTagView, self).get_context_data(
@@ -344,14 +342,11 @@ class QuestionsByTagView(ListView):
         # Get default display objects from get_queryset.
         context['latest_current_page'] = context['questions']
 
-        context['total_question_num'] = Question.objects.count()
-        context['total_answer_num'] = Answer.objects.count()
+        context['site_stats'] = self.site_stats
+        context['total_question_num'] = context['site_stats']['questions']
+        context['total_answer_num'] = context['site_stats']['answers']
         # Pass tags to html.
-        question_contenttype = ContentType.objects.get_for_model(Question)
-        items = TaggedItem.objects.filter(content_type=question_contenttype)
-        context['tags'] = Tag.objects.filter(
-            taggit_taggeditem_items__in=items).exclude(
-                slug__exact='').order_by('-id').distinct()
+        context['tags'] = tag_cloud()
         return context
 
 @csrf_exempt
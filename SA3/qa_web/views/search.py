@@ -0,0 +1,88 @@
+"""
+Controller for the search of questions
+"""
+
+from django.conf import settings
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.http import Http404, JsonResponse
+from django.urls import reverse
+from haystack.views import SearchView, search_view_factory
+from qa_web.models import Question
+from qa_web.search.cache import (current_generation, normalize_query,
+                                 result_cache)
+from qa_web.search.suggest import suggest_titles
+
+
+class CachedResult:
+    """Search result served from the cache, exposing the matching question
+    as `object` like haystack's SearchResult."""
+
+    def __init__(self, question):
+        self.pk = question.pk
+        self.object = question
+
+
+class CachedSearchView(SearchView):
+    """Haystack's SearchView serving pages of results from
+    qa_web.search.cache.result_cache.
+
+    Only the primary keys of a page's results and the total number of
+    results are cached. Questions are loaded in a single query.
+    """
+
+    def _page_number(self):
+        try:
+            page_no = int(self.request.GET.get('page', 1))
+        except (TypeError, ValueError):
+            raise Http404("Not a valid number for page.")
+        if page_no < 1:
+            raise Http404("Pages should be 1 or greater.")
+        return page_no
+
+    def build_page(self):
+        if not self.query:
+            return super(CachedSearchView, self).build_page()
+        page_no = self._page_number()
+        key = (normalize_query(self.query),
+               tuple(sorted(self.form.cleaned_data.get('models') or ())),
+               page_no)
+        generation = current_generation()
+        cached = result_cache.get(key, generation)
+        if cached is None:
+            start = (page_no - 1) * self.results_per_page
+            pks = [int(result.pk) for result in
+                   self.results[start:start + self.results_per_page]]
+            cached = (pks, self.results.count())
+            result_cache.set(key, cached, generation)
+        pks, count = cached
+
+        paginator = Paginator([], self.results_per_page)
+        paginator.count = count
+        try:
+            page_no = paginator.validate_number(page_no)
+        except InvalidPage:
+            raise Http404("No such page!")
+        questions = Question.objects.in_bulk(pks)
+        results = [CachedResult(questions[pk]) for pk in pks
+                   if pk in questions]
+        return paginator, Page(results, page_no, paginator)
+
+
+search_view = search_view_factory(view_class=CachedSearchView)
+
+
+def suggest(request):
+    """Suggests the titles of questions starting with the `q` parameter,
+    used by the navbar's search field.
+
+    :param request: Request object containing the prefix in `q`
+    :return: JSONResponse with a list of `suggestions`, each holding the
+             `title` and `url` of a question
+    """
+    prefix = request.GET.get('q', '').strip()
+    if not prefix:
+        return JsonResponse({'suggestions': []})
+    return JsonResponse({'suggestions': [
+        {'title': title, 'url': reverse('answers', args=[question_id])}
+        for question_id, title in suggest_titles(prefix,
+                                                 settings.SUGGEST_LIMIT)]})
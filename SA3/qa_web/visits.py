@@ -0,0 +1,118 @@
+"""Buffered counting of question visits.
+
+Visits are collected in memory and written to the database as batched
+`F('visits') + n` updates. `QuerySet.update` neither rewrites the whole
+Question row nor sends the `post_save` signal, so viewing a question no longer
+reindexes it.
+
+Pending visits are flushed once `VISITS_FLUSH_INTERVAL` seconds have elapsed
+since the last flush or once `VISITS_FLUSH_THRESHOLD` visits are pending.
+Both are only checked when a visit is recorded, so the visits of a process
+which stops receiving visits stay pending until its next one. They are also
+flushed when the interpreter exits gracefully, `flush_visits` can be called
+to force a flush at any other time. A worker killed by its server, e.g. on
+a timeout or with SIGKILL, does not run its exit handlers and loses its
+pending visits, at most `VISITS_FLUSH_THRESHOLD` of them: visit counts are
+approximate.
+
+Failing to write the visits never fails the request recording them. The
+error is logged and the visits are kept to be written on next flush.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from qa_web.models import Question
+
+# Maximum number of ids in a single `IN` clause, SQLite's limit on the number
+# of query parameters being 999.
+BATCH_SIZE = 500
+
+logger = logging.getLogger('qa_web.visits')
+
+
+class VisitBuffer:
+    """Thread-safe in-memory counter of visits per question id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._last_flush = time.monotonic()
+
+    def record(self, question_id):
+        """Counts a visit on a question, flushing the buffer when it is due.
+        A failed flush is logged, its visits staying pending.
+
+        :param question_id: Id of the visited question
+        :return: Whether the buffer was flushed
+        """
+        with self._lock:
+            self._pending[question_id] += 1
+            due = sum(self._pending.values()) >= \
+                settings.VISITS_FLUSH_THRESHOLD or \
+                time.monotonic() - self._last_flush >= \
+                settings.VISITS_FLUSH_INTERVAL
+        if not due:
+            return False
+        try:
+            self.flush()
+        except DatabaseError:
+            with self._lock:
+                count = sum(self._pending.values())
+            logger.exception('Failed to write %d pending visit(s)', count)
+            return False
+        return True
+
+    def pending(self, question_id):
+        """Number of visits on a question not yet written to the database."""
+        with self._lock:
+            return self._pending[question_id]
+
+    def flush(self):
+        """Writes all pending visits to the database.
+        Questions with the same number of pending visits are updated together.
+        If the update fails, the visits are kept to be written on next flush.
+
+        :return: Number of visits written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        ids_by_increment = defaultdict(list)
+        for question_id, increment in pending.items():
+            ids_by_increment[increment].append(question_id)
+        try:
+            with transaction.atomic():
+                for increment, ids in ids_by_increment.items():
+                    for i in range(0, len(ids), BATCH_SIZE):
+                        Question.objects.filter(pk__in=ids[i:i + BATCH_SIZE]) \
+                            .update(visits=F('visits') + increment)
+        except Exception:
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return sum(pending.values())
+
+    def clear(self):
+        """Discards all pending visits, restarting the flush interval."""
+        with self._lock:
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+
+
+visit_buffer = VisitBuffer()
+
+
+def flush_visits():
+    """Forces pending visits to be written to the database."""
+    return visit_buffer.flush()
+
+
+atexit.register(flush_visits)
@@ -0,0 +1,79 @@
+"""Voting on posts.
+
+A user's existing vote on a post is found through the (user, post) unique
+index and the post's counters are updated database-side inside a single
+transaction, so concurrent votes on a popular post never lose updates and
+voting does not get slower as the number of voters grows. The score of the
+post's owner and the last activity on its thread are updated within the
+same transaction.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from qa_web.conditional import touch_thread
+from qa_web.models import Answer, Comment, Question, Vote
+from qa_web.reputation import adjust_user_stats
+
+POST_TYPES = {
+    'question': Question,
+    'answer': Answer,
+    'comment': Comment,
+}
+
+
+def cast_vote(user, post_type, post_id, positive):
+    """Applies a user's vote on a post and returns the post's new score.
+    Voting in the same direction as an existing vote cancels it, voting in
+    the opposite direction changes it.
+
+    :param user: User voting
+    :param post_type: One of `POST_TYPES`' keys
+    :param post_id: Id of the post being voted on
+    :param positive: Direction of the vote
+    :return: Score of the post once the vote is applied
+    :raises ObjectDoesNotExist: If the post does not exist
+    """
+    model = POST_TYPES[post_type]
+    try:
+        return _apply_vote(user, model, post_type, post_id, positive)
+    except IntegrityError:
+        # A concurrent request from the same user recorded a vote on this
+        # post first, apply this vote on top of it.
+        return _apply_vote(user, model, post_type, post_id, positive)
+
+
+def _apply_vote(user, model, post_type, post_id, positive):
+    """Records the vote and updates the post's counters in one transaction."""
+    post_filter = {post_type + '_id': post_id}
+    with transaction.atomic():
+        last_vote = Vote.objects.select_for_update() \
+            .filter(user=user, **post_filter) \
+            .values_list('id', 'positive').first()
+
+        if last_vote is None:
+            # Not yet voted on current post
+            upvotes, downvotes = (1, 0) if positive else (0, 1)
+        elif last_vote[1] == positive:
+            # Vote cancelled, user pressed same button as original vote
+            upvotes, downvotes = (-1, 0) if positive else (0, -1)
+        else:
+            # Vote changed direction
+            upvotes, downvotes = (1, -1) if positive else (-1, 1)
+
+        posts = model.objects.filter(pk=post_id)
+        if not posts.update(upvotes=F('upvotes') + upvotes,
+                            downvotes=F('downvotes') + downvotes,
+                            score=F('score') + upvotes - downvotes):
+            raise model.DoesNotExist(
+                'No {} matches the given query.'.format(post_type))
+
+        if last_vote is None:
+            Vote.objects.create(user=user, positive=positive, **post_filter)
+        elif last_vote[1] == positive:
+            Vote.objects.filter(id=last_vote[0]).delete()
+        else:
+            Vote.objects.filter(id=last_vote[0]).update(positive=positive)
+
+        score, owner_id = posts.values_list('score', 'owner_id').get()
+        adjust_user_stats(owner_id, score=upvotes - downvotes)
+        touch_thread(post_type, post_id)
+        return score